@@ -0,0 +1,3 @@
+from .word_list_view import WordListView
+
+__all__ = ["WordListView"]
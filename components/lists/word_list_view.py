@@ -0,0 +1,98 @@
+from typing import List, Optional
+
+from PySide6.QtCore import QSortFilterProxyModel, Qt
+from PySide6.QtWidgets import QAbstractItemView, QListView
+
+from models import WordListModel
+
+
+class WordListView(QListView):
+    """
+    List view of a WordListModel behind a QSortFilterProxyModel.
+
+    Only the visible rows are drawn, and every row has the same height, so the view
+    stays fast with large lists. Rows can be filtered by text.
+
+    Attributes:
+        word_model (WordListModel): The source model.
+        proxy (QSortFilterProxyModel): The filter model between the view and the source.
+    """
+
+    def __init__(self, word_model: WordListModel, multi_selection: bool = False):
+        """
+        Initializes the view.
+
+        Args:
+            word_model (WordListModel): The model to show.
+            multi_selection (bool, optional): Let the user select several rows. Defaults to False.
+        """
+        super().__init__()
+        self.word_model = word_model
+        self.proxy = QSortFilterProxyModel(self)
+        self.proxy.setSourceModel(word_model)
+        self.proxy.setFilterCaseSensitivity(Qt.CaseInsensitive)
+        self.setModel(self.proxy)
+        self.setUniformItemSizes(True)
+        if multi_selection:
+            self.setSelectionMode(QAbstractItemView.MultiSelection)
+
+    def set_filter(self, text: str) -> None:
+        """
+        Shows only the rows containing the text.
+
+        Args:
+            text (str): The text to filter by. An empty string shows every row.
+
+        Returns:
+            None: This function does not return a value.
+        """
+        self.proxy.setFilterFixedString(text)
+
+    def row_count(self) -> int:
+        """
+        Returns the number of visible rows.
+
+        Returns:
+            int: The number of rows.
+        """
+        return self.proxy.rowCount()
+
+    def current_row(self) -> int:
+        """
+        Returns the visible row of the current item.
+
+        Returns:
+            int: The row, or -1 if there is no current item.
+        """
+        return self.currentIndex().row()
+
+    def set_current_row(self, row: int) -> None:
+        """
+        Makes a visible row the current item.
+
+        Args:
+            row (int): The row.
+
+        Returns:
+            None: This function does not return a value.
+        """
+        self.setCurrentIndex(self.proxy.index(row, 0))
+
+    def current_guid(self) -> Optional[str]:
+        """
+        Returns the guid of the current item.
+
+        Returns:
+            Optional[str]: The guid, or None if there is no current item.
+        """
+        index = self.currentIndex()
+        return index.data(Qt.UserRole) if index.isValid() else None
+
+    def selected_guids(self) -> List[str]:
+        """
+        Returns the guids of the selected items.
+
+        Returns:
+            List[str]: The guids.
+        """
+        return [index.data(Qt.UserRole) for index in self.selectedIndexes()]
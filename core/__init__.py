@@ -1,17 +1,37 @@
-from .anki_export_thread import AnkiExportThread
-from .apple_note_import import AppleNoteImport
-from .audio_thread import AudioThread
-from .google_audio_worker import GoogleAudioWorker
-from .remove_duplicate_audio import RemoveDuplicateAudio
-from .word_lookup_worker import WordLookupWorker
-from .word_lookup_worker_mw import WordLookupWorkerWebster
+import importlib
+
+# The workers are imported on first use so importing `core` doesn't pull in the
+# network and Google SDK modules they depend on before a stage needs them.
+_exports = {
+    "AnkiDuplicateCheck": ".anki_duplicate_check",
+    "AnkiExportThread": ".anki_export_thread",
+    "AppleNoteImport": ".apple_note_import",
+    "AudioThread": ".audio_thread",
+    "GoogleTTSEngine": ".google_tts_engine",
+    "PipelineOrchestrator": ".pipeline_orchestrator",
+    "RemoveDuplicateAudio": ".remove_duplicate_audio",
+    "WordLookupWorker": ".word_lookup_worker",
+}
 
 __all__ = [
+    "AnkiDuplicateCheck",
     "AnkiExportThread",
     "AudioThread",
     "WordLookupWorker",
-    "GoogleAudioWorker",
+    "GoogleTTSEngine",
     "AppleNoteImport",
+    "PipelineOrchestrator",
     "RemoveDuplicateAudio",
-    "WordLookupWorkerWebster",
 ]
+
+
+def __getattr__(name):
+    if name not in _exports:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(_exports[name], __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(list(globals()) + __all__)
@@ -0,0 +1,92 @@
+import requests
+from PySide6.QtCore import Signal, Slot
+
+from base import QWorkerBase
+from models import WordModel
+from services.anki import AnkiConnect, AnkiConnectError
+
+
+class AnkiDuplicateCheck(QWorkerBase):
+    """
+    Pre-flight check that asks Anki which words it would reject as duplicates,
+    so no audio is downloaded for them.
+
+    All words are checked with a single `canAddNotesWithErrorDetail` request, falling back
+    to `canAddNotes` on older AnkiConnect versions. `canAddNotes` doesn't say why a note
+    can't be added, so its rejections are confirmed with `findNotes`. If Anki isn't
+    reachable the check is skipped with a warning and every word goes on to the audio
+    stage.
+
+    Signals:
+        send_logs (Signal[str, str, bool]): Emits log messages.
+        duplicate_word (Signal[WordModel]): Emitted for each word Anki already has.
+        error_word (Signal[WordModel, str]): Emitted for each word Anki would reject
+            for another reason, with the reason.
+        finished (Signal): Emitted when the check is done.
+    """
+
+    duplicate_word = Signal(WordModel)
+    error_word = Signal(WordModel, str)
+
+    def __init__(self, words, deck_name, model_name):
+        super().__init__()
+        self.words = list(words)
+        self.deck_name = deck_name
+        self.model_name = model_name
+        self.anki_connect = AnkiConnect(timeout=30)
+
+    @Slot()
+    def do_work(self):
+        try:
+            if self.words:
+                duplicates, errors = self.find_duplicates()
+                for word in duplicates:
+                    self.duplicate_word.emit(word)
+                for word, error in errors:
+                    self.error_word.emit(word, error)
+        except requests.exceptions.RequestException as e:
+            self.logging(
+                f"Could not reach Anki, skipping the duplicate check: {e}", "WARN"
+            )
+        except Exception as e:
+            self.logging(f"Duplicate check failed, skipping it: {e}", "WARN")
+        finally:
+            self.finished.emit()
+
+    def find_duplicates(self):
+        """
+        Asks Anki which of the words can't be added, and why.
+
+        Returns:
+            Tuple[List[WordModel], List[Tuple[WordModel, str]]]: The duplicate words,
+                and the words rejected for another reason with the reason.
+        """
+        notes = [
+            AnkiConnect.build_note(word, self.deck_name, self.model_name)
+            for word in self.words
+        ]
+        try:
+            results = self.anki_connect.invoke(
+                "canAddNotesWithErrorDetail", notes=notes
+            )
+            rejected = [
+                (word, result.get("error", ""))
+                for word, result in zip(self.words, results)
+                if not result.get("canAdd")
+            ]
+        except AnkiConnectError:
+            can_add = self.anki_connect.invoke("canAddNotes", notes=notes)
+            indexes = [i for i, ok in enumerate(can_add) if not ok]
+            exists = self.anki_connect.notes_exist([notes[i] for i in indexes])
+            rejected = [
+                (self.words[i], "duplicate" if found else "Anki can't add this note")
+                for i, found in zip(indexes, exists)
+            ]
+
+        found = [word for word, error in rejected if "duplicate" in error]
+        errors = [(word, error) for word, error in rejected if "duplicate" not in error]
+        self.logging(
+            f"Found {len(found)} duplicate and {len(errors)} invalid words before "
+            "downloading audio"
+        )
+        return found, errors
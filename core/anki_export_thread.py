@@ -1,38 +1,70 @@
 from collections import deque
+from concurrent.futures import FIRST_COMPLETED, wait
 
 import requests
-from PySide6.QtCore import QMutex, QMutexLocker, QThread, QWaitCondition, Signal, Slot
+from PySide6.QtCore import (
+    QMutex,
+    QMutexLocker,
+    Qt,
+    QThread,
+    QWaitCondition,
+    Signal,
+    Slot,
+)
 
-from models import Status, WordModel
+from models import Status, WordModel, WordsModel
+from services.anki import DUPLICATE_ERROR, AnkiConnect, AnkiUnreachableError
+from services.retry import CircuitBreaker, RetryExecutor, RetryPolicy, RetryRule
+from services.storage import JobJournal
 from services.subprocess import SubprocessTasks
 
 
 class AnkiExportThread(QThread):
+    # adding notes isn't idempotent, so only requests that never reached Anki are
+    # sent again
+    RETRY_POLICY = RetryPolicy(
+        [
+            RetryRule(
+                "unreachable",
+                (AnkiUnreachableError,),
+                max_attempts=5,
+                base_delay=2.0,
+                max_delay=60.0,
+            )
+        ]
+    )
+
     synced_word = Signal(WordModel)
     error_word = Signal(WordModel)
     dup_word = Signal(WordModel)
     finished = Signal()
-    start_check = Signal()
 
-    def __init__(self, words, deck_name, model_name):
+    def __init__(self, words, deck_name, model_name, batch_size=50, in_flight=()):
         super().__init__()
         self.deck_name = deck_name
         self.model_name = model_name
+        self.batch_size = max(1, int(batch_size or 1))
+        self.anki_connect = AnkiConnect()
         self.word_index = 0
         self.words = deque(words)
         self._mutex = QMutex()
         self._wait_condition = QWaitCondition()
         self._stop = False
         self._paused = False
+        self._input_open = False
+        self.in_flight = set(in_flight)
+        self.journal = JobJournal()
 
     def run(self):
-        print("started")
+        self.journal.run_started("sync")
 
-        self.subprocess_tasks = SubprocessTasks("Anki")
-        self.subprocess_tasks.moveToThread(self)
-        self.subprocess_tasks.app_checked_opened.connect(self.receive_check)
-        self.start_check.connect(self.subprocess_tasks.check_and_open)
-        self.start_check.emit()
+        # the check runs on this thread and its answer is handled here, so the sync
+        # below never blocks the GUI thread
+        subprocess_tasks = SubprocessTasks("Anki")
+        subprocess_tasks.app_checked_opened.connect(
+            self.receive_check, Qt.ConnectionType.DirectConnection
+        )
+        subprocess_tasks.check_and_open()
 
     def receive_check(self, status, msg):
         if status:
@@ -40,72 +72,191 @@ class AnkiExportThread(QThread):
             self.sync_next_word()
         else:
             print(msg)
+            self.journal.run_finished("sync")
             self.finished.emit()
 
     def sync_next_word(self):
-        while self.words:
-            word = self.words.popleft()
-            try:
-                payload = {
-                    "action": "addNote",
-                    "version": 6,
-                    "params": {
-                        "note": {
-                            "deckName": f"{self.deck_name}",
-                            "modelName": f"{self.model_name}",
-                            "fields": {
-                                "Word": f"{word.word}",
-                                "Definition": f"{word.definition}",
-                                "Audio": f"{word.audio}",
-                                "Synonyms": f"{word.synonyms}",
-                                "Example": f"{word.example}",
-                            },
-                            "options": {
-                                "allowDuplicate": False,
-                                "duplicateScope": "deck",
-                                "duplicateScopeOptions": {
-                                    "deckName": "English Words",
-                                    "checkChildren": True,
-                                    "checkAllModels": True,
-                                },
-                            },
-                        }
-                    },
-                }
-
-                response = requests.post(
-                    "http://127.0.0.1:8765/", json=payload, timeout=5
-                )
+        """
+        Sends the words to Anki in chunks, one request at a time. A chunk that never
+        reached Anki is retried with backoff while the next chunks go ahead, and the
+        stage pauses if Anki stops answering altogether. A chunk that timed out after
+        it was sent is never sent again; Anki is asked which of its notes were added.
+        Every word's result is recorded in the JobJournal. While the input is open the
+        thread waits for more words instead of ending when the queue runs dry. Runs on
+        the export thread; results reach the pages through queued signals.
+
+        Returns:
+            None: This function does not return a value.
+        """
+        executor = RetryExecutor(
+            1,
+            policy=self.RETRY_POLICY,
+            breaker=CircuitBreaker.for_name("anki"),
+            thread_name_prefix="anki",
+            on_retry=self.log_retry,
+            on_circuit_open=self.log_circuit_open,
+        )
+        self.confirm_in_flight()
+        pending = {}
+        while True:
+            with QMutexLocker(self._mutex):
+                while self.words and len(pending) < 1 + executor.waiting():
+                    chunk = [
+                        self.words.popleft()
+                        for _ in range(min(self.batch_size, len(self.words)))
+                    ]
+                    for word in chunk:
+                        self.journal.started("sync", word.guid)
+                    pending[executor.submit(self.sync_chunk, chunk)] = chunk
+                if not pending:
+                    if not self.words and not self._input_open:
+                        break
+                    # waiting for the audio stage to send more words
+                    self._wait_condition.wait(self._mutex, 500)
+                    continue
 
-                response = response.json()
-
-                if "error" in response:
-                    if (
-                        response["error"]
-                        == "cannot create note because it is a duplicate"
-                    ):
-                        print("Word is a duplicate skipping")
-                        word.status = Status.SKIPPED_ANKI_DUP
-                        self.dup_word.emit(word)
-                if response["result"] is not None:
-                    id = response["result"]
-                    print(f"Word is creating with id: {id}")
-                    word.status = Status.ANKI_SYNCED
-                    self.synced_word.emit(word)
-            except requests.exceptions.ConnectTimeout as e:
-                word.status = Status.SKIPPED_ANKI_ERROR
-                self.error_word.emit(word)
-            except Exception as e:
-                word.status = Status.SKIPPED_ANKI_ERROR
-                self.error_word.emit(word)
-                print(e)
+            # wake up now and then, a chunk waiting to be retried frees its slot
+            done, _ = wait(pending, timeout=0.5, return_when=FIRST_COMPLETED)
+            for future in done:
+                words = pending.pop(future)
+                try:
+                    results = future.result()
+                except Exception as e:
+                    print(f"Could not add {len(words)} notes to Anki: {e}")
+                    for word in words:
+                        self.mark_error(word, e)
+                    continue
+                for word, response in zip(words, results):
+                    self.handle_result(word, response)
 
+        executor.shutdown()
+        self.journal.run_finished("sync")
         self.cleanup()
 
+    def confirm_in_flight(self):
+        """
+        Looks up the queued words an interrupted run had sent without recording a
+        result. Words Anki already has are marked as synced instead of being added a
+        second time. If Anki can't be asked, the words are marked as errors so they are
+        checked by hand.
+
+        Returns:
+            None: This function does not return a value.
+        """
+        with QMutexLocker(self._mutex):
+            words = [word for word in self.words if word.guid in self.in_flight]
+        if not words:
+            return
+        print(f"Checking {len(words)} words an interrupted sync had sent")
+        notes = [
+            AnkiConnect.build_note(word, self.deck_name, self.model_name)
+            for word in words
+        ]
+        try:
+            found = self.anki_connect.notes_exist(notes)
+            error = None
+        except Exception as e:
+            found = [None] * len(words)
+            error = f"Could not check if the note was added: {e}"
+
+        # words Anki doesn't have stay queued and are added as usual
+        resolved = {
+            word.guid for word, added in zip(words, found) if added is not False
+        }
+        with QMutexLocker(self._mutex):
+            self.words = deque(word for word in self.words if word.guid not in resolved)
+        for word, added in zip(words, found):
+            if added is None:
+                self.mark_error(word, error)
+            elif added:
+                self.handle_result(word, {"result": "found", "error": None})
+
+    def sync_chunk(self, words):
+        """
+        Adds a chunk of words to Anki with a single AnkiConnect request.
+
+        If the request fails after it may have reached Anki, the notes are looked up
+        with `findNotes` instead of being sent again, since a second `addNote` of a
+        note that made it in comes back as a duplicate.
+
+        Args:
+            words (List[WordModel]): The words to export.
+
+        Returns:
+            List[dict]: One AnkiConnect response per word.
+
+        Raises:
+            AnkiUnreachableError: If the request never reached AnkiConnect.
+            requests.exceptions.RequestException: If Anki can't be asked which notes
+                were added.
+        """
+        notes = [
+            AnkiConnect.build_note(word, self.deck_name, self.model_name)
+            for word in words
+        ]
+        actions = [AnkiConnect.action("addNote", note=note) for note in notes]
+        try:
+            if len(actions) == 1:
+                return [self.anki_connect.post(actions[0])]
+            print(f"Adding {len(actions)} notes in one request")
+            return self.anki_connect.multi(actions)
+        except AnkiUnreachableError:
+            raise
+        except requests.exceptions.RequestException as e:
+            print(f"No answer from Anki ({e}). Checking which notes were added.")
+            # AnkiConnect answers requests in order, so this lookup is only answered
+            # once the request that timed out has been handled
+            return [
+                (
+                    {"result": "found", "error": None}
+                    if found
+                    else {"result": None, "error": f"No answer from Anki: {e}"}
+                )
+                for found in self.anki_connect.notes_exist(notes)
+            ]
+
+    def log_retry(self, error, attempt, delay):
+        print(f"Anki attempt {attempt} failed: {error}. Retrying in {delay:.1f}s.")
+
+    def log_circuit_open(self, name, pause):
+        print(f"Anki is not answering. Pausing the sync for {pause:.0f}s.")
+
+    def handle_result(self, word, response):
+        error = response.get("error")
+        if error == DUPLICATE_ERROR:
+            print("Word is a duplicate skipping")
+            word.status = Status.SKIPPED_ANKI_DUP
+            self.journal.completed("sync", WordsModel.to_row(word))
+            self.dup_word.emit(word)
+        elif error is None and response.get("result") is not None:
+            print(f"Word is in Anki: {response['result']}")
+            word.status = Status.ANKI_SYNCED
+            self.journal.completed("sync", WordsModel.to_row(word))
+            self.synced_word.emit(word)
+        else:
+            print(error)
+            self.mark_error(word, error)
+
+    def mark_error(self, word, error=""):
+        word.status = Status.SKIPPED_ANKI_ERROR
+        self.journal.failed("sync", word.guid, str(error), WordsModel.to_row(word))
+        self.error_word.emit(word)
+
     @Slot(WordModel)
     def add_word_to_list(self, word):
         with QMutexLocker(self._mutex):
             self.words.append(word)
+            self._wait_condition.wakeAll()
+
+    def set_input_open(self, open):
+        """
+        Keeps the thread running while its queue is empty, because the audio stage is
+        still sending words. The thread ends once the input is closed and the queue is
+        done.
+        """
+        with QMutexLocker(self._mutex):
+            self._input_open = open
+            self._wait_condition.wakeAll()
 
     def pause_if_needed(self, checkVar):
         with QMutexLocker(self._mutex):
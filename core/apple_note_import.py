@@ -1,6 +1,5 @@
 import subprocess
 
-from bs4 import BeautifulSoup
 from PySide6.QtCore import QObject, Signal, Slot
 
 
@@ -69,6 +68,8 @@ class AppleNoteImport(QObject):
 
     def clean_html(self, content):
         """Removes HTML tags and returns clean text."""
+        from bs4 import BeautifulSoup
+
         soup = BeautifulSoup(content, "html.parser")
         title = soup.find("div")
         if title.getText() == self.noteName:
@@ -1,69 +1,269 @@
+import time
 from collections import deque
+from concurrent.futures import FIRST_COMPLETED, wait
 
 from PySide6.QtCore import QMutex, QMutexLocker, QThread, QWaitCondition, Signal, Slot
 
-from models import Status, WordModel
+from models import Status, WordModel, WordsModel
+from services.cache import AudioCache
+from services.retry import CircuitBreaker, RetryExecutor
+from services.storage import JobJournal
 from utils.files.path_manager import PathManager
 
-from .google_audio_worker import GoogleAudioWorker
+from .anki_duplicate_check import AnkiDuplicateCheck
+from .google_tts_engine import GoogleTTSEngine
 
 
 class AudioThread(QThread):
+    """
+    Downloads the pronunciation audio for a queue of words.
+
+    One GoogleTTSEngine is built per run and shared by a bounded pool, so at most
+    `max_workers` synthesis requests are in flight at once and the credentials are
+    only parsed once. Audio synthesized before is taken from the AudioCache.
+
+    Synthesis that fails with a transient error is retried with backoff by a
+    RetryExecutor. Waiting retries don't take a pool slot, so other words keep going.
+    When the API keeps failing, its circuit breaker pauses the whole stage.
+
+    Files are written under a temporary name and renamed when complete, and every
+    word's result is recorded in the JobJournal, so a run cut short by the app quitting
+    leaves no partial MP3s behind and resumes where it stopped.
+
+    When the define stage feeds the thread directly, its input is kept open and the
+    thread waits for more words instead of ending when the queue runs dry. With an
+    Anki deck and model set, the words sent in while the thread runs are checked with
+    an AnkiDuplicateCheck first, in batches of the words that arrived within
+    `check_delay` seconds, so no audio is downloaded for notes Anki would reject. If
+    Anki can't be asked, the check is turned off for the rest of the run.
+
+    Signals:
+        send_logs (Signal[str, str, bool]): Emits log messages.
+        audio_word (Signal[WordModel]): Emitted when a word's audio was saved.
+        error_word (Signal[WordModel]): Emitted when a word's audio failed.
+        duplicate_word (Signal[WordModel]): Emitted for each word sent in that Anki
+            already has.
+        invalid_word (Signal[WordModel, str]): Emitted for each word sent in that Anki
+            would reject for another reason, with the reason.
+        finished (Signal): Emitted when there are no more words in the queue.
+    """
+
+    send_logs = Signal(str, str, bool)
     finished = Signal()
 
     audio_word = Signal(WordModel)
     error_word = Signal(WordModel)
+    duplicate_word = Signal(WordModel)
+    invalid_word = Signal(WordModel, str)
+
+    # seconds words sent in are collected for before they are checked together
+    check_delay = 0.5
 
-    def __init__(self, words, folder_path=None, access_key_location="", credential_string=""):
+    def __init__(
+        self,
+        words,
+        folder_path=None,
+        access_key_location="",
+        credential_string="",
+        max_workers=4,
+        use_cache=True,
+        use_journal=True,
+        anki_deck_name=None,
+        anki_model_name=None,
+    ):
         super().__init__()
         self.folder_path = folder_path
         self.access_key_location = access_key_location
         self.credential_string = credential_string
+        self.max_workers = max(1, int(max_workers or 1))
+        self.audio_cache = AudioCache() if use_cache else None
+        self.anki_deck_name = anki_deck_name
+        self.anki_model_name = anki_model_name
         self.words = deque(words)
+        self._unchecked = []
+        self._unchecked_since = 0.0
         self._mutex = QMutex()
         self._wait_condition = QWaitCondition()
         self._stop = False
         self._paused = False
+        self._held = False
+        self._input_open = False
+        self.journal = JobJournal() if use_journal else None
 
     def run(self):
-        self.download_next_word()
-
-    def download_next_word(self):
-        self.pause_if_needed(self._stop)
-        if  len(self.words) > 0:
-            word = self.words.popleft()
-            self.worker = GoogleAudioWorker(
-                word.word,
-                f"{word.word}",
-                self.folder_path,
+        self.record("run_started", "audio", folder=self.folder_path)
+        try:
+            self.engine = GoogleTTSEngine(
+                self.credential_string,
                 self.access_key_location,
-                self.credential_string
+                audio_cache=self.audio_cache,
             )
-            self.worker.moveToThread(self)
-            self.worker.success.connect(lambda path: self.success_download(path,word))
-            self.worker.error.connect(lambda: self.error_download(word))
-            self.worker.do_work()
-
-        else:
+        except Exception as e:
+            self.logging(f"Could not create Google Text-to-Speech client: {e}", "ERROR")
+            with QMutexLocker(self._mutex):
+                words = list(self.words) + self._unchecked
+                self.words.clear()
+                self._unchecked = []
+            for word in words:
+                self.error_download(word)
+            self.record("run_finished", "audio")
             self.cleanup()
+            return
+
+        executor = RetryExecutor(
+            self.max_workers,
+            breaker=CircuitBreaker.for_name(GoogleTTSEngine.rate_limit_name),
+            thread_name_prefix="tts",
+            on_retry=self.log_retry,
+            on_circuit_open=self.log_circuit_open,
+        )
+        pending = {}
+        while True:
+            self.pause_if_needed(self._stop)
+            self.check_new_words()
+            with QMutexLocker(self._mutex):
+                while (
+                    not self._held
+                    and self.words
+                    and len(pending) < self.max_workers + executor.waiting()
+                ):
+                    word = self.words.popleft()
+                    self.record("started", "audio", word.guid)
+                    future = executor.submit(
+                        self.engine.save, word.word, f"{word.word}", self.folder_path
+                    )
+                    pending[future] = word
+                if not pending:
+                    if not self.words and not self._unchecked and not self._input_open:
+                        break
+                    # held, or waiting for the previous stage to send more words
+                    self._wait_condition.wait(self._mutex, 500)
+                    continue
+
+            # wake up now and then, a word waiting to be retried frees its slot
+            done, _ = wait(pending, timeout=0.5, return_when=FIRST_COMPLETED)
+            for future in done:
+                word = pending.pop(future)
+                try:
+                    self.success_download(future.result(), word)
+                except Exception as e:
+                    self.logging(f"Failed to get audio for {word.word}: {e}", "WARN")
+                    self.error_download(word)
+
+        executor.shutdown()
+        self.record("run_finished", "audio")
+        self.cleanup()
+
+    def check_new_words(self):
+        """
+        Asks Anki about the words sent in since the last check, once they have waited
+        `check_delay` seconds or the input is closed. Words Anki would reject are
+        emitted and dropped, the rest are queued for synthesis.
+
+        Returns:
+            None: This function does not return a value.
+        """
+        with QMutexLocker(self._mutex):
+            due = self._unchecked and (
+                not self._input_open
+                or time.monotonic() - self._unchecked_since >= self.check_delay
+            )
+            if not due:
+                return
+            words, self._unchecked = self._unchecked, []
+
+        duplicates, errors = [], []
+        if self.anki_deck_name and self.anki_model_name:
+            check = AnkiDuplicateCheck(words, self.anki_deck_name, self.anki_model_name)
+            check.send_logs.connect(self.send_logs)
+            try:
+                duplicates, errors = check.find_duplicates()
+            except Exception as e:
+                self.logging(
+                    "Could not check new words against Anki, downloading their audio"
+                    f" without the duplicate check: {e}",
+                    "WARN",
+                )
+                with QMutexLocker(self._mutex):
+                    self.anki_deck_name = None
+
+        rejected = {word.guid for word in duplicates}
+        rejected.update(word.guid for word, _ in errors)
+        for word in duplicates:
+            self.duplicate_word.emit(word)
+        for word, error in errors:
+            self.invalid_word.emit(word, error)
+        with QMutexLocker(self._mutex):
+            self.words.extend(word for word in words if word.guid not in rejected)
+
+    def record(self, event, *args, **kwargs):
+        if self.journal is not None:
+            getattr(self.journal, event)(*args, **kwargs)
+
+    def log_retry(self, error, attempt, delay):
+        self.logging(
+            f"Audio attempt {attempt} failed: {error}. Retrying in {delay:.1f}s.",
+            "WARN",
+        )
+
+    def log_circuit_open(self, name, pause):
+        self.logging(
+            f"{name} keeps failing. Pausing audio downloads for {pause:.0f}s.", "WARN"
+        )
 
     @Slot(WordModel)
     def add_word_to_list(self, word):
         with QMutexLocker(self._mutex):
-            self.words.append(word)
+            if self.anki_deck_name and self.anki_model_name:
+                if not self._unchecked:
+                    self._unchecked_since = time.monotonic()
+                self._unchecked.append(word)
+            else:
+                self.words.append(word)
+            self._wait_condition.wakeAll()
+
+    def set_input_open(self, open):
+        """
+        Keeps the thread running while its queue is empty, because the previous stage
+        is still sending words. The thread ends once the input is closed and the queue
+        is done.
+        """
+        with QMutexLocker(self._mutex):
+            self._input_open = open
+            self._wait_condition.wakeAll()
+
+    def hold(self):
+        """
+        Stops starting new words until `release` is called. Words already started
+        finish. Used by the PipelineOrchestrator while the sync stage has too many
+        words waiting.
+        """
+        with QMutexLocker(self._mutex):
+            self._held = True
+
+    def release(self):
+        with QMutexLocker(self._mutex):
+            self._held = False
+            self._wait_condition.wakeAll()
 
     def success_download(self, path, word):
         path_dict = PathManager.regex_path(path)
         word.audio_path = path
-        word.audio = f"[sound:{path_dict["filename"]}{path_dict["ext"]}]"
+        word.audio = f"[sound:{path_dict['filename']}{path_dict['ext']}]"
         word.status = Status.AUDIO
+        self.record("completed", "audio", WordsModel.to_row(word))
         self.audio_word.emit(word)
-        self.download_next_word()
 
     def error_download(self, word):
         word.status = Status.SKIPPED_AUDIO
+        self.record(
+            "failed",
+            "audio",
+            word.guid,
+            "audio download failed",
+            WordsModel.to_row(word),
+        )
         self.error_word.emit(word)
-        self.download_next_word()
 
     def pause_if_needed(self, checkVar):
         with QMutexLocker(self._mutex):
@@ -79,9 +279,22 @@ class AudioThread(QThread):
             self._wait_condition.wakeAll()
 
     def cleanup(self):
-        if not self.words:
-            if self.worker:
-                self.worker.deleteLater()
-            self.finished.emit()
-        else:
-            self.download_next_word()
\ No newline at end of file
+        self.finished.emit()
+
+    @Slot(str, str, bool)
+    def logging(self, msg: str, level: str = "INFO", print_msg: bool = True) -> None:
+        """
+        Logs a message with the specified log level.
+
+        This method send logs to Logger with a message, log level, and
+        an optional flag to print the message.
+
+        Args:
+            msg (str): The message to be logged.
+            level (str, optional): The log level (e.g., "INFO", "WARN", "ERROR"). Defaults to "INFO".
+            print_msg (bool, optional): Flag to determine whether to print the log message. Defaults to True.
+
+        Returns:
+            None
+        """
+        self.send_logs.emit(msg, level, print_msg)
@@ -0,0 +1,14 @@
+from .dictionary_backend import DictionaryBackend
+from .free_dictionary_backend import FreeDictionaryBackend
+from .merriam_webster_backend import MerriamWebsterBackend
+from .offline_dictionary_backend import OfflineDictionaryBackend
+from .offline_index import OfflineIndex, build_index
+
+__all__ = [
+    "DictionaryBackend",
+    "FreeDictionaryBackend",
+    "MerriamWebsterBackend",
+    "OfflineDictionaryBackend",
+    "OfflineIndex",
+    "build_index",
+]
@@ -0,0 +1,30 @@
+import argparse
+
+from .offline_index import OfflineIndex, build_index
+
+
+def main(argv=None) -> None:
+    parser = argparse.ArgumentParser(
+        prog="python -m core.backends.build_offline_index",
+        description="Build or query an offline dictionary index.",
+    )
+    commands = parser.add_subparsers(dest="command", required=True)
+    build = commands.add_parser("build", help="Build an index from a JSON/CSV dump.")
+    build.add_argument("source", help="Dictionary dump (.json, .jsonl or .csv)")
+    build.add_argument("index", help="Index file to write")
+    lookup = commands.add_parser("lookup", help="Look a word up in an index.")
+    lookup.add_argument("index", help="Index file")
+    lookup.add_argument("word", help="Word to look up")
+    args = parser.parse_args(argv)
+
+    if args.command == "build":
+        count = build_index(args.source, args.index)
+        print(f"Wrote {count} headwords to {args.index}")
+    else:
+        index = OfflineIndex(args.index)
+        print(index.lookup(args.word) or "Not found")
+        index.close()
+
+
+if __name__ == "__main__":
+    main()
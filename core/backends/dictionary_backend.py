@@ -0,0 +1,59 @@
+from typing import List, Optional, Protocol, runtime_checkable
+
+from models import DictionaryEntryModel
+
+
+@runtime_checkable
+class DictionaryBackend(Protocol):
+    """
+    Interface implemented by every dictionary source used by WordLookupWorker.
+
+    A backend only knows how to fetch raw responses and turn them into entries. Queueing,
+    prefetching, caching, rate limiting and the user selection prompts are handled once
+    by the lookup engine.
+
+    Attributes:
+        name (str): Stable name of the backend, used as the response cache namespace.
+        batch_size (int): Maximum number of words the backend can answer with one `fetch` call.
+        requests_per_second (Optional[float]): Maximum sustained request rate, or None if unlimited.
+        burst (int): Maximum number of requests sent back to back.
+        daily_limit (Optional[int]): Maximum requests per day, or None if unlimited.
+        cacheable (bool): Whether responses should be stored in the response cache.
+    """
+
+    name: str
+    batch_size: int
+    requests_per_second: Optional[float]
+    burst: int
+    daily_limit: Optional[int]
+    cacheable: bool
+
+    def fetch(self, words: List[str]) -> List[Optional[str]]:
+        """
+        Fetches the raw responses for up to `batch_size` words.
+
+        Args:
+            words (List[str]): The words to look up.
+
+        Returns:
+            List[Optional[str]]: One raw response body per word, in the same order,
+                with None for a word that isn't in the dictionary. Only bodies are
+                cached, so a not found answer is asked for again next time.
+
+        Raises:
+            Exception: On transport errors.
+        """
+        ...
+
+    def parse(self, word: str, body: str) -> List[DictionaryEntryModel]:
+        """
+        Parses a raw response body into dictionary entries.
+
+        Args:
+            word (str): The word that was looked up.
+            body (str): The raw response body returned by `fetch`.
+
+        Returns:
+            List[DictionaryEntryModel]: The entries found, or an empty list if the word wasn't found.
+        """
+        ...
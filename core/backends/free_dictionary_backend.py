@@ -0,0 +1,86 @@
+import json
+from typing import List, Optional
+
+from models import DefinitionModel, DictionaryEntryModel
+from services.network import HttpClient
+
+
+class FreeDictionaryBackend:
+    """
+    Dictionary backend for the Free Dictionary API (dictionaryapi.dev).
+    """
+
+    name = "free_dictionary"
+    batch_size = 1
+    requests_per_second = 5.0
+    burst = 5
+    daily_limit = None
+    cacheable = True
+
+    def fetch(self, words: List[str]) -> List[Optional[str]]:
+        """
+        Fetches the raw responses for the words, one request per word.
+
+        Args:
+            words (List[str]): The words to look up.
+
+        Returns:
+            List[Optional[str]]: The response bodies, with None for words the API
+                answered with a 404.
+        """
+        bodies = []
+        for word in words:
+            response = HttpClient().get(
+                f"https://api.dictionaryapi.dev/api/v2/entries/en/{word}",
+            )
+            if response.status_code == 404:
+                bodies.append(None)
+                continue
+            response.raise_for_status()
+            bodies.append(response.text)
+        return bodies
+
+    def parse(self, word: str, body: str) -> List[DictionaryEntryModel]:
+        """
+        Parses a Free Dictionary API response into dictionary entries.
+
+        Args:
+            word (str): The word that was looked up.
+            body (str): The raw response body.
+
+        Returns:
+            List[DictionaryEntryModel]: The entries found for the word.
+        """
+        res = json.loads(body)
+        # handle not finding word
+        if not isinstance(res, list):
+            return []
+
+        entries = []
+        for found_word in res:
+            meanings = found_word.get("meanings") or []
+            if not meanings or not meanings[0].get("definitions"):
+                continue
+
+            definitions = []
+            for meaning in meanings:
+                for definition in meaning["definitions"]:
+                    definitions.append(
+                        DefinitionModel(
+                            meaning["partOfSpeech"],
+                            definition.get("definition", ""),
+                            definition.get("synonyms") or meaning.get("synonyms", []),
+                            definition.get("antonyms") or meaning.get("antonyms", []),
+                            definition.get("example", ""),
+                        )
+                    )
+
+            entries.append(
+                DictionaryEntryModel(
+                    found_word["word"],
+                    meanings[0]["partOfSpeech"],
+                    meanings[0]["definitions"][0]["definition"],
+                    definitions,
+                )
+            )
+        return entries
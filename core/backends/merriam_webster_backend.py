@@ -0,0 +1,106 @@
+import json
+from typing import List
+
+from models import DefinitionModel, DictionaryEntryModel
+from services.network import HttpClient
+
+
+class MerriamWebsterBackend:
+    """
+    Dictionary backend for the Merriam-Webster Collegiate Dictionary API.
+
+    Attributes:
+        api_key (str): The Merriam-Webster API key.
+    """
+
+    name = "merriam_webster"
+    batch_size = 1
+    requests_per_second = 2.0
+    burst = 2
+    # free keys are limited to 1000 queries a day
+    daily_limit = 1000
+    cacheable = True
+
+    def __init__(self, api_key: str):
+        """
+        Initializes the backend.
+
+        Args:
+            api_key (str): The Merriam-Webster API key.
+        """
+        self.api_key = api_key
+
+    def fetch(self, words: List[str]) -> List[str]:
+        """
+        Fetches the raw responses for the words, one request per word.
+
+        Args:
+            words (List[str]): The words to look up.
+
+        Returns:
+            List[str]: The response bodies.
+        """
+        bodies = []
+        for word in words:
+            response = HttpClient().get(
+                f"https://www.dictionaryapi.com/api/v3/references/collegiate/json/{word}?key={self.api_key}",
+            )
+            response.raise_for_status()
+            bodies.append(response.text)
+        return bodies
+
+    def parse(self, word: str, body: str) -> List[DictionaryEntryModel]:
+        """
+        Parses a Merriam-Webster response into dictionary entries.
+
+        Unknown words come back as a list of spelling suggestions, which parse to no entries.
+
+        Args:
+            word (str): The word that was looked up.
+            body (str): The raw response body.
+
+        Returns:
+            List[DictionaryEntryModel]: The entries found for the word.
+        """
+        res = json.loads(body)
+
+        entries = []
+        for found_word in res:
+            if (
+                not isinstance(found_word, dict)
+                or "hwi" not in found_word
+                or not found_word.get("shortdef")
+            ):
+                continue
+
+            part_of_speech = found_word.get("fl", "")
+            definitions = [
+                DefinitionModel(part_of_speech, definition, "", "", "")
+                for definition in found_word["shortdef"]
+            ]
+
+            syns = []
+            if "syns" in found_word:
+                syns = found_word["syns"][0]["pt"][0][1]
+                syns = syns.split("{sc}")
+                syns = [syn.replace("{sc}", "").replace("{/sc} ", "") for syn in syns]
+
+            example = ""
+            if "quotes" in found_word:
+                example = (
+                    found_word["quotes"][0]["t"]
+                    .replace("{qword}", "'")
+                    .replace("{/qword}", "'")
+                )
+
+            entries.append(
+                DictionaryEntryModel(
+                    found_word["hwi"]["hw"].replace("*", ""),
+                    part_of_speech,
+                    found_word["shortdef"][0],
+                    definitions,
+                    syns,
+                    example,
+                )
+            )
+        return entries
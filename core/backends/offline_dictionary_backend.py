@@ -0,0 +1,62 @@
+from typing import List, Optional
+
+from models import DictionaryEntryModel
+
+from .free_dictionary_backend import FreeDictionaryBackend
+from .offline_index import OfflineIndex
+
+
+class OfflineDictionaryBackend:
+    """
+    Dictionary backend that answers lookups from a local index built with
+    `python -m core.backends.build_offline_index build`. No network is used.
+
+    Attributes:
+        index_path (str): Location of the index file.
+    """
+
+    name = "offline"
+    batch_size = 64
+    requests_per_second = None
+    burst = 0
+    daily_limit = None
+    cacheable = False
+
+    def __init__(self, index_path: str):
+        """
+        Opens the offline index.
+
+        Args:
+            index_path (str): Location of the index file.
+
+        Raises:
+            ValueError: If the file is not a dictionary index.
+        """
+        self.index_path = index_path
+        self.index = OfflineIndex(index_path)
+        self._parser = FreeDictionaryBackend()
+
+    def fetch(self, words: List[str]) -> List[Optional[str]]:
+        """
+        Reads the records for the words from the index.
+
+        Args:
+            words (List[str]): The words to look up.
+
+        Returns:
+            List[Optional[str]]: The records, with None for words not in the index.
+        """
+        return [self.index.lookup(word) for word in words]
+
+    def parse(self, word: str, body: str) -> List[DictionaryEntryModel]:
+        """
+        Parses an index record. Records use the Free Dictionary API shape.
+
+        Args:
+            word (str): The word that was looked up.
+            body (str): The record returned by `fetch`.
+
+        Returns:
+            List[DictionaryEntryModel]: The entries found for the word.
+        """
+        return self._parser.parse(word, body)
@@ -0,0 +1,260 @@
+import csv
+import json
+import mmap
+import os
+import struct
+from typing import Dict, Iterable, List, Optional
+
+from utils.text import normalize_headword
+
+MAGIC = b"EWDICT01"
+HEADER = struct.Struct("<8sII")
+OFFSET = struct.Struct("<Q")
+
+
+class OfflineIndex:
+    """
+    Read-only, memory-mapped dictionary index built by `build_index`.
+
+    The file starts with a header and a table of record offsets sorted by headword,
+    followed by `headword<TAB>json<NEWLINE>` records. Lookups binary search the offset
+    table directly in the mapped file, so opening the index is instant and only the
+    pages that are touched are read from disk.
+
+    The JSON of each record uses the Free Dictionary API response shape.
+
+    Attributes:
+        path (str): Location of the index file.
+        count (int): Number of headwords in the index.
+    """
+
+    def __init__(self, path: str):
+        """
+        Opens and maps the index.
+
+        Args:
+            path (str): Location of the index file.
+
+        Raises:
+            ValueError: If the file is not a dictionary index.
+        """
+        self.path = path
+        self._file = open(path, "rb")
+        try:
+            self._mm = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError as e:
+            self._file.close()
+            raise ValueError(f"{path} is not a dictionary index") from e
+        try:
+            magic, self.count, _ = HEADER.unpack_from(self._mm, 0)
+        except struct.error as e:
+            self.close()
+            raise ValueError(f"{path} is not a dictionary index") from e
+        if magic != MAGIC:
+            self.close()
+            raise ValueError(f"{path} is not a dictionary index")
+        if len(self._mm) < HEADER.size + self.count * OFFSET.size:
+            self.close()
+            raise ValueError(f"{path} is truncated")
+
+    def _record(self, position: int):
+        offset = OFFSET.unpack_from(self._mm, HEADER.size + position * OFFSET.size)[0]
+        tab = self._mm.find(b"\t", offset)
+        return self._mm[offset:tab], tab + 1
+
+    def lookup(self, word: str) -> Optional[str]:
+        """
+        Finds the record for a word.
+
+        Args:
+            word (str): The word to look up.
+
+        Returns:
+            Optional[str]: The JSON body for the word, or None if it isn't in the index.
+        """
+        key = normalize_headword(word).encode("utf-8")
+        low, high = 0, self.count
+        while low < high:
+            mid = (low + high) // 2
+            headword, body_start = self._record(mid)
+            if headword < key:
+                low = mid + 1
+            elif headword > key:
+                high = mid
+            else:
+                body_end = self._mm.find(b"\n", body_start)
+                return self._mm[body_start:body_end].decode("utf-8")
+        return None
+
+    def close(self) -> None:
+        """
+        Unmaps and closes the index file.
+
+        Returns:
+            None: This function does not return a value.
+        """
+        if not self._mm.closed:
+            self._mm.close()
+        self._file.close()
+
+
+def _split_list(value) -> List[str]:
+    if not value:
+        return []
+    if isinstance(value, list):
+        return [
+            item["word"] if isinstance(item, dict) else str(item)
+            for item in value
+            if item
+        ]
+    items = str(value).replace(";", ",").split(",")
+    return [item.strip() for item in items if item.strip()]
+
+
+def _read_records(source_path: str) -> Iterable[dict]:
+    _, ext = os.path.splitext(source_path)
+    with open(source_path, "r", encoding="utf-8", newline="") as source:
+        if ext.lower() == ".csv":
+            yield from csv.DictReader(source)
+        elif ext.lower() in [".jsonl", ".ndjson"]:
+            for line in source:
+                if line.strip():
+                    yield json.loads(line)
+        else:
+            data = json.load(source)
+            if isinstance(data, dict):
+                data = [
+                    dict(record, word=record.get("word", word))
+                    for word, records in data.items()
+                    for record in (records if isinstance(records, list) else [records])
+                ]
+            yield from data
+
+
+def _record_meanings(record: dict) -> List[dict]:
+    """Converts a CSV row, Wiktionary (wiktextract) or WordNet style record into meanings."""
+    part_of_speech = (
+        record.get("partOfSpeech")
+        or record.get("part_of_speech")
+        or record.get("pos")
+        or ""
+    )
+    synonyms = _split_list(record.get("synonyms"))
+    antonyms = _split_list(record.get("antonyms"))
+
+    if "senses" in record:
+        definitions = []
+        for sense in record["senses"]:
+            glosses = sense.get("glosses") or sense.get("raw_glosses") or []
+            if not glosses:
+                continue
+            examples = [
+                example
+                for example in sense.get("examples") or []
+                if isinstance(example, dict)
+            ]
+            example = examples[0].get("text", "") if examples else ""
+            definitions.append(
+                {
+                    "definition": glosses[-1],
+                    "example": example,
+                    "synonyms": _split_list(sense.get("synonyms")),
+                    "antonyms": _split_list(sense.get("antonyms")),
+                }
+            )
+    else:
+        definition = record.get("definition") or record.get("gloss") or ""
+        definitions = []
+        if definition:
+            definitions.append(
+                {
+                    "definition": definition,
+                    "example": record.get("example") or "",
+                    "synonyms": [],
+                    "antonyms": [],
+                }
+            )
+
+    if not definitions:
+        return []
+    return [
+        {
+            "partOfSpeech": part_of_speech,
+            "definitions": definitions,
+            "synonyms": synonyms,
+            "antonyms": antonyms,
+        }
+    ]
+
+
+def build_index(source_path: str, index_path: str) -> int:
+    """
+    Builds a memory-mappable dictionary index from a JSON, JSON Lines or CSV dump.
+
+    Records already in the Free Dictionary API shape (with `meanings`) are kept as is.
+    Other records need a `word` and either a `definition` (CSV/WordNet style rows, with
+    optional `pos`, `example` and `synonyms` columns) or a list of `senses` with `glosses`
+    (Wiktionary/wiktextract exports). Rows for the same headword are merged.
+
+    Args:
+        source_path (str): Location of the dictionary dump.
+        index_path (str): Where to write the index.
+
+    Returns:
+        int: The number of headwords written.
+    """
+    entries: Dict[str, Dict[tuple, dict]] = {}
+    for record in _read_records(source_path):
+        word = str(record.get("word") or "").strip()
+        if not word:
+            continue
+        headword = normalize_headword(word)
+        word_entries = entries.setdefault(headword, {})
+
+        if "meanings" in record:
+            word_entries[("record", len(word_entries))] = record
+            continue
+
+        entry = word_entries.setdefault(("word", word), {"word": word, "meanings": []})
+        for meaning in _record_meanings(record):
+            existing = next(
+                (
+                    m
+                    for m in entry["meanings"]
+                    if m["partOfSpeech"] == meaning["partOfSpeech"]
+                ),
+                None,
+            )
+            if existing:
+                existing["definitions"].extend(meaning["definitions"])
+                existing["synonyms"].extend(
+                    s for s in meaning["synonyms"] if s not in existing["synonyms"]
+                )
+            else:
+                entry["meanings"].append(meaning)
+
+    records = []
+    for headword, word_entries in entries.items():
+        body = [entry for entry in word_entries.values() if entry["meanings"]]
+        if body:
+            records.append(
+                (
+                    headword.encode("utf-8"),
+                    json.dumps(body, ensure_ascii=False, separators=(",", ":")).encode(
+                        "utf-8"
+                    ),
+                )
+            )
+    records.sort(key=lambda record: record[0])
+
+    tmp_path = f"{index_path}.tmp"
+    with open(tmp_path, "wb") as index:
+        index.write(HEADER.pack(MAGIC, len(records), 0))
+        offset = HEADER.size + OFFSET.size * len(records)
+        for headword, body in records:
+            index.write(OFFSET.pack(offset))
+            offset += len(headword) + len(body) + 2
+        for headword, body in records:
+            index.write(headword + b"\t" + body + b"\n")
+    os.replace(tmp_path, index_path)
+    return len(records)
@@ -0,0 +1,191 @@
+import json
+import threading
+
+from services.cache import AudioCache
+from services.network import RateLimiter
+from utils.files.path_manager import PathManager
+
+
+class GoogleTTSEngine:
+    """
+    Google Text-to-Speech synthesis engine that keeps one authenticated client for a
+    whole run.
+
+    The client is thread safe, so one engine can be shared by every thread of a
+    synthesis pool. Only picking the file name and writing the file are serialized,
+    which keeps `PathManager.check_dup` from handing the same name to two words.
+
+    When an audio cache is given, audio that was synthesized before with the same
+    text and voice settings is placed from the cache instead of calling the API.
+
+    Synthesis requests wait on the shared RateLimiter so every engine together stays
+    under the API's characters per minute quota.
+
+    Attributes:
+        client (TextToSpeechClient): The authenticated Text-to-Speech client.
+        language_code (str): Language of the synthesized voice.
+        ssml_gender (SsmlVoiceGender): Gender of the synthesized voice.
+        audio_encoding (AudioEncoding): Encoding of the synthesized audio.
+        audio_cache (AudioCache): Cache of synthesized audio, or None to always synthesize.
+    """
+
+    _path_lock = threading.Lock()
+
+    rate_limit_name = "google_tts"
+    characters_per_minute = 150000
+
+    @classmethod
+    def register_rate_limit(cls) -> None:
+        """
+        Registers the API's characters per minute quota with the shared RateLimiter.
+
+        Returns:
+            None: This function does not return a value.
+        """
+        RateLimiter().register(
+            cls.rate_limit_name,
+            cls.characters_per_minute / 60,
+            cls.characters_per_minute,
+            unit="characters",
+        )
+
+    def __init__(
+        self,
+        credential_string="",
+        access_key_location="",
+        language_code="en-US",
+        ssml_gender=None,
+        audio_encoding=None,
+        audio_cache=None,
+    ):
+        """
+        Parses the service account credentials and builds the client. The Google SDK
+        is imported here rather than with the module, since it is slow to import and
+        only the audio stage needs it.
+
+        Args:
+            credential_string (str, optional): Service account JSON. Defaults to "".
+            access_key_location (str, optional): Path to a service account JSON file,
+                used when no credential string is given. Defaults to "".
+            language_code (str, optional): Voice language. Defaults to "en-US".
+            ssml_gender (SsmlVoiceGender, optional): Voice gender. Defaults to FEMALE.
+            audio_encoding (AudioEncoding, optional): Audio encoding. Defaults to MP3.
+            audio_cache (AudioCache, optional): Cache of synthesized audio. Defaults to None.
+
+        Raises:
+            ValueError: If no credentials were provided.
+            json.JSONDecodeError: If the credentials aren't valid JSON.
+            google.auth.exceptions.GoogleAuthError: If the credentials are rejected.
+        """
+        from google.cloud import texttospeech
+
+        if ssml_gender is None:
+            ssml_gender = texttospeech.SsmlVoiceGender.FEMALE
+        if audio_encoding is None:
+            audio_encoding = texttospeech.AudioEncoding.MP3
+
+        if credential_string:
+            service_account_info = json.loads(credential_string)
+        elif access_key_location:
+            with open(access_key_location) as key_file:
+                service_account_info = json.load(key_file)
+        else:
+            raise ValueError("Service account json file or string not provided.")
+
+        self.client = texttospeech.TextToSpeechClient.from_service_account_info(
+            service_account_info
+        )
+        self.language_code = language_code
+        self.ssml_gender = ssml_gender
+        self.audio_encoding = audio_encoding
+        self.voice = texttospeech.VoiceSelectionParams(
+            language_code=language_code, ssml_gender=ssml_gender
+        )
+        self.audio_config = texttospeech.AudioConfig(audio_encoding=audio_encoding)
+        self.audio_cache = audio_cache
+        self.register_rate_limit()
+
+    def cache_key(self, text: str) -> str:
+        """
+        Builds the audio cache key for the text with this engine's voice settings.
+
+        Args:
+            text (str): The text to speak.
+
+        Returns:
+            str: The cache key.
+        """
+        from google.cloud import texttospeech
+
+        return AudioCache.key(
+            text,
+            self.language_code,
+            texttospeech.SsmlVoiceGender(self.ssml_gender).name,
+            texttospeech.AudioEncoding(self.audio_encoding).name,
+        )
+
+    def synthesize(self, text: str) -> bytes:
+        """
+        Synthesizes speech for the text.
+
+        Args:
+            text (str): The text to speak.
+
+        Returns:
+            bytes: The encoded audio.
+        """
+        from google.cloud import texttospeech
+
+        RateLimiter().acquire(self.rate_limit_name, len(text))
+        response = self.client.synthesize_speech(
+            request={
+                "input": texttospeech.SynthesisInput(text=text),
+                "voice": self.voice,
+                "audio_config": self.audio_config,
+            }
+        )
+        return response.audio_content
+
+    def save(self, text: str, filename: str, folder_path: str) -> str:
+        """
+        Synthesizes speech for the text and writes it to a unique file in the folder.
+        Cached audio is linked or copied instead of calling the API.
+
+        Args:
+            text (str): The text to speak.
+            filename (str): The base file name, without extension.
+            folder_path (str): The folder the file is written to.
+
+        Returns:
+            str: The path of the written file.
+        """
+        if self.audio_cache is None:
+            return self.write(self.synthesize(text), filename, folder_path)
+
+        key = self.cache_key(text)
+        with self._path_lock:
+            path = PathManager.check_dup(folder_path, filename, ".mp3")
+            if self.audio_cache.place(key, path):
+                return path
+
+        audio_content = self.synthesize(text)
+        self.audio_cache.put(key, audio_content)
+        return self.write(audio_content, filename, folder_path)
+
+    def write(self, audio_content: bytes, filename: str, folder_path: str) -> str:
+        """
+        Writes audio to a unique file in the folder. The file is written under a
+        temporary name and renamed when complete.
+
+        Args:
+            audio_content (bytes): The encoded audio.
+            filename (str): The base file name, without extension.
+            folder_path (str): The folder the file is written to.
+
+        Returns:
+            str: The path of the written file.
+        """
+        with self._path_lock:
+            path = PathManager.check_dup(folder_path, filename, ".mp3")
+            PathManager.write_atomic(path, audio_content)
+        return path
@@ -0,0 +1,109 @@
+from concurrent.futures import Future
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from services.retry import CircuitBreaker, RetryExecutor, RetryPolicy
+
+
+class LookupPrefetcher:
+    """
+    Prefetches dictionary lookups on a bounded thread pool while handing the results
+    back strictly in queue order.
+
+    The lookup thread still walks its word list one word at a time so the selection
+    dialogs are shown in order, but the network round trips for the next words are
+    already in flight while the user is answering a prompt. Batches that fail with a
+    transient error are retried in the background by a RetryExecutor.
+
+    Attributes:
+        fetch (Callable): Function run on the pool for a batch of words. It returns one
+            result per word; an exception that isn't retried fails every word of the
+            batch.
+        max_workers (int): Maximum number of batches running at the same time.
+        batch_size (int): Maximum number of words handed to one `fetch` call.
+        window (int): How many words ahead of the current word are prefetched.
+    """
+
+    def __init__(
+        self,
+        fetch: Callable[[List[Any]], List[Any]],
+        max_workers: int = 4,
+        batch_size: int = 1,
+        breaker: Optional[CircuitBreaker] = None,
+        policy: Optional[RetryPolicy] = None,
+        on_retry: Optional[Callable[[BaseException, int, float], None]] = None,
+        on_circuit_open: Optional[Callable[[str, float], None]] = None,
+    ):
+        """
+        Initializes the prefetcher.
+
+        Args:
+            fetch (Callable): Function that fetches and parses the responses for a batch of words.
+            max_workers (int, optional): Maximum concurrent batches. Defaults to 4.
+            batch_size (int, optional): Maximum words per batch. Defaults to 1.
+            breaker (CircuitBreaker, optional): The backend's breaker. Defaults to None.
+            policy (RetryPolicy, optional): Retry policy. Defaults to the default one.
+            on_retry (Callable, optional): Called before a batch is retried.
+            on_circuit_open (Callable, optional): Called when the breaker opens.
+        """
+        self.fetch = fetch
+        self.max_workers = max(1, int(max_workers or 1))
+        self.batch_size = max(1, int(batch_size or 1))
+        self.window = self.max_workers * self.batch_size * 2
+        self.executor = RetryExecutor(
+            self.max_workers,
+            policy,
+            breaker,
+            thread_name_prefix="lookup",
+            on_retry=on_retry,
+            on_circuit_open=on_circuit_open,
+        )
+        self._futures: Dict[int, Tuple[Future, int]] = {}
+        self._submitted = 0
+
+    def fill(self, words: List[Any], index: int) -> None:
+        """
+        Submits lookups for the words from `index` up to the prefetch window.
+
+        Words appended to `words` while a run is active are picked up on the next call.
+
+        Args:
+            words (list): The queue of words being defined. Only ever appended to.
+            index (int): Index of the word that is about to be consumed.
+
+        Returns:
+            None: This function does not return a value.
+        """
+        limit = min(len(words), index + self.window)
+        while self._submitted < limit:
+            start = self._submitted
+            end = min(limit, start + self.batch_size)
+            future = self.executor.submit(self.fetch, words[start:end])
+            for offset in range(end - start):
+                self._futures[start + offset] = (future, offset)
+            self._submitted = end
+
+    def result(self, index: int) -> Any:
+        """
+        Blocks until the lookup for the word at `index` is done and returns its result.
+
+        Args:
+            index (int): Index of the word in the queue.
+
+        Returns:
+            Any: The result `fetch` returned for this word.
+
+        Raises:
+            Exception: Re-raises whatever `fetch` raised for the word's batch.
+        """
+        future, offset = self._futures.pop(index)
+        return future.result()[offset]
+
+    def shutdown(self) -> None:
+        """
+        Cancels lookups that have not started yet and shuts the pool down.
+
+        Returns:
+            None: This function does not return a value.
+        """
+        self.executor.shutdown(wait=False, cancel_futures=True)
+        self._futures.clear()
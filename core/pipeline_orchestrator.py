@@ -0,0 +1,209 @@
+from typing import Dict, Optional
+
+from PySide6.QtCore import QThread, QTimer, Signal, Slot
+
+from base import QObjectBase, QSingleton
+from models import Status, WordModel, WordsModel
+
+
+class PipelineOrchestrator(QObjectBase, metaclass=QSingleton):
+    """
+    Streams words through the define, audio and sync stages.
+
+    By default each stage runs on its own and its results wait for the user to send
+    them on. With auto-advance on for a stage, every word the stage finishes is moved
+    straight to the next stage, which is started if it isn't running. The next stage
+    keeps its input open while the stage feeding it runs, so the stages overlap and a
+    batch takes about as long as its slowest stage.
+
+    The queue between two stages is bounded. Once `queue_size` words are waiting for
+    or in the next stage, the stage feeding it is held and stops starting new words
+    until the backlog drops. Each stage keeps its own concurrency setting.
+
+    The pages tell the orchestrator when their worker starts and finishes. The
+    workers only need `hold`/`release` to be fed from, and `set_input_open` to feed.
+
+    Attributes:
+        auto_advance (Dict[str, bool]): Whether each stage sends its words on.
+        queue_size (int): Most words waiting for or in a stage fed by another stage.
+
+    Signals:
+        start_stage (Signal[str]): Asks for a stage's run to be started.
+        change_status (Signal[str, Status]): Moves a word to the next stage.
+    """
+
+    STAGES = ["define", "audio", "sync"]
+
+    # how often a held stage checks whether it may go on, in ms
+    balance_interval = 200
+
+    start_stage = Signal(str)
+    change_status = Signal(str, Status)
+
+    def __init__(self, queue_size: int = 20):
+        super().__init__()
+        self.wordsModel = WordsModel()
+        self.auto_advance = {stage: False for stage in self.STAGES[:-1]}
+        self.queue_size = queue_size
+        self._workers: Dict[str, QThread] = {}
+        self._held = set()
+        self._requested = set()
+        self._timer = QTimer(self)
+        self._timer.setInterval(self.balance_interval)
+        self._timer.timeout.connect(self.balance)
+        self.change_status.connect(self.wordsModel.update_status)
+
+    @Slot(bool, bool, int)
+    def receive_settings_update(
+        self, auto_advance_define, auto_advance_audio, pipeline_queue_size
+    ):
+        self.auto_advance["define"] = auto_advance_define
+        self.auto_advance["audio"] = auto_advance_audio
+        self.queue_size = max(1, pipeline_queue_size)
+        for stage in self.STAGES[1:]:
+            worker = self._workers.get(stage)
+            if worker is not None:
+                worker.set_input_open(self.feeds(stage))
+        self.balance()
+
+    def previous_stage(self, stage: str) -> Optional[str]:
+        index = self.STAGES.index(stage)
+        return self.STAGES[index - 1] if index > 0 else None
+
+    def next_stage(self, stage: str) -> Optional[str]:
+        index = self.STAGES.index(stage)
+        return self.STAGES[index + 1] if index + 1 < len(self.STAGES) else None
+
+    def feeds(self, stage: str) -> bool:
+        """
+        Checks if the stage before a stage is running and sending its words on.
+
+        Args:
+            stage (str): The stage.
+
+        Returns:
+            bool: True if more words can still arrive at the stage.
+        """
+        previous = self.previous_stage(stage)
+        return (
+            previous is not None
+            and self.auto_advance[previous]
+            and previous in self._workers
+        )
+
+    def stage_started(self, stage: str, worker: QThread) -> None:
+        """
+        Records that a stage's worker started. A stage fed by a running stage keeps
+        its input open.
+
+        Args:
+            stage (str): The stage.
+            worker (QThread): The stage's worker.
+
+        Returns:
+            None: This function does not return a value.
+        """
+        self._workers[stage] = worker
+        self._requested.discard(stage)
+        if self.previous_stage(stage) is not None:
+            worker.set_input_open(self.feeds(stage))
+        following = self.next_stage(stage)
+        if following in self._workers and self.auto_advance[stage]:
+            self._workers[following].set_input_open(True)
+        self.balance()
+
+    def stage_finished(self, stage: str) -> None:
+        """
+        Records that a stage's run ended, or never started. The next stage's input is
+        closed so it ends once its queue is done.
+
+        Args:
+            stage (str): The stage.
+
+        Returns:
+            None: This function does not return a value.
+        """
+        self._workers.pop(stage, None)
+        self._held.discard(stage)
+        self._requested.discard(stage)
+        following = self.next_stage(stage)
+        self._requested.discard(following)
+        if following in self._workers:
+            self._workers[following].set_input_open(False)
+        # a word sent on just as the worker ran dry missed the run
+        if self.feeds(stage) and self.wordsModel.count_words(
+            WordsModel.STAGE_STATUSES[stage]
+        ):
+            self.request_start(stage)
+        self.balance()
+
+    def advance(self, stage: str, word: WordModel) -> bool:
+        """
+        Sends a word a stage finished on to the next stage if the stage auto-advances.
+
+        Args:
+            stage (str): The stage that finished the word.
+            word (WordModel): The word.
+
+        Returns:
+            bool: True if the word was sent on, False if it waits for the user.
+        """
+        following = self.next_stage(stage)
+        if following is None or not self.auto_advance[stage]:
+            return False
+        self.change_status.emit(word.guid, WordsModel.STAGE_STATUSES[following])
+        if following not in self._workers:
+            self.request_start(following)
+        self.balance()
+        return True
+
+    def request_start(self, stage: str) -> None:
+        """
+        Asks for a stage to be started, once until it starts or its feeding run ends,
+        so a stage that can't start doesn't warn about it for every word.
+
+        Args:
+            stage (str): The stage.
+
+        Returns:
+            None: This function does not return a value.
+        """
+        if stage in self._requested:
+            return
+        self._requested.add(stage)
+        self.start_stage.emit(stage)
+
+    @Slot()
+    def balance(self) -> None:
+        """
+        Holds every stage whose next stage has `queue_size` or more words waiting, and
+        releases it once the backlog drops. A stage is never held for a next stage
+        that isn't running.
+
+        Returns:
+            None: This function does not return a value.
+        """
+        for stage, following in zip(self.STAGES, self.STAGES[1:]):
+            worker = self._workers.get(stage)
+            if worker is None:
+                continue
+            backlog = self.wordsModel.count_words(WordsModel.STAGE_STATUSES[following])
+            full = (
+                self.auto_advance[stage]
+                and following in self._workers
+                and backlog >= self.queue_size
+            )
+            if full and stage not in self._held:
+                self.logging(
+                    f"{following} has {backlog} words waiting. Holding {stage}."
+                )
+                worker.hold()
+                self._held.add(stage)
+            elif not full and stage in self._held:
+                worker.release()
+                self._held.discard(stage)
+
+        if self._held and not self._timer.isActive():
+            self._timer.start()
+        elif not self._held:
+            self._timer.stop()
@@ -1,10 +1,36 @@
-import requests
 from PySide6.QtCore import QMutex, QMutexLocker, QThread, QWaitCondition, Signal, Slot
 
-from models import DefinitionModel, Status, WordModel
+from models import Status, WordModel, WordsModel
+from services.cache import ResponseCache
+from services.network import QuotaExceededError, RateLimiter
+from services.retry import CircuitBreaker
+from services.storage import JobJournal
+
+from .backends import DictionaryBackend
+from .lookup_prefetcher import LookupPrefetcher
 
 
 class WordLookupWorker(QThread):
+    """
+    Lookup engine that defines a queue of words using a DictionaryBackend.
+
+    Responses are prefetched on a bounded pool, answered from the response cache when
+    possible and throttled by the shared RateLimiter to the backend's rate limit and
+    daily quota. The words are then handled strictly in queue order, pausing to let the
+    user pick a word or definitions when the backend returns more than one. Once the
+    daily quota is used up the lookup stops and the remaining words stay queued. Every
+    word defined or skipped is recorded in the JobJournal, so a run cut short by the
+    app quitting resumes where it stopped.
+
+    Signals:
+        send_logs (Signal[str, str, bool]): Emits log messages.
+        multi_words (Signal[list]): Asks the user to choose between several words.
+        multi_definitions (Signal[str, list]): Asks the user which definitions to keep.
+        defined_word (Signal[WordModel]): Emitted when a word has been defined.
+        skipped_word (Signal[WordModel]): Emitted when a word was skipped.
+        finished (Signal): Emitted when there are no more words to define.
+    """
+
     send_logs = Signal(str, str, bool)
     result = Signal(list)
     finished = Signal()
@@ -15,150 +41,219 @@ class WordLookupWorker(QThread):
     defined_word = Signal(WordModel)
     skipped_word = Signal(WordModel)
 
-    def __init__(self, word_list):
+    def __init__(self, word_list, backend: DictionaryBackend, max_workers=4):
         super().__init__()
         self.content = None
         self.word_list = word_list
-        # self.start_work.connect(self.do_work)
+        self.backend = backend
+        self.max_workers = max_workers
+        self.response_cache = ResponseCache()
         self._mutex = QMutex()
         self._wait_condition = QWaitCondition()
         self._stop = False
         self._paused = False
+        self._held = False
+        self.rate_limiter = RateLimiter()
+        if backend.requests_per_second or backend.daily_limit:
+            self.rate_limiter.register(
+                backend.name,
+                backend.requests_per_second,
+                backend.burst,
+                backend.daily_limit,
+            )
         self.multi_selection = None
         self.word_selection = None
-        self.skipped_word_list = []
-        self.words = []
+        self.journal = JobJournal()
 
     @Slot()
     def run(self):
-
-        for list_word in self.word_list:
+        self.logging(f"Defining words using {self.backend.name}")
+        self.journal.run_started("define")
+        self.prefetcher = LookupPrefetcher(
+            self.fetch_entries,
+            self.max_workers,
+            self.backend.batch_size,
+            breaker=CircuitBreaker.for_name(self.backend.name),
+            on_retry=self.log_retry,
+            on_circuit_open=self.log_circuit_open,
+        )
+        index = 0
+
+        while True:
+            self.wait_while_held()
+            with QMutexLocker(self._mutex):
+                if index >= len(self.word_list):
+                    break
+                list_word = self.word_list[index]
+                self.prefetcher.fill(self.word_list, index)
+            index += 1
             self.pause_if_needed(self._stop)
             try:
                 self.logging(f"Getting Definition for {list_word.word}")
-                response = requests.get(
-                    f"https://api.dictionaryapi.dev/api/v2/entries/en/{list_word.word}",
-                    timeout=15,
-                )
-                res = response.json()
-
-                # handle not finding word
-
-                self.multi_selection = 0
-
-                word_choices = []
-
-                if "title" in res and res["title"] == "No Definitions Found":
-                    self.logging(
-                        f"No definitions found for word: {list_word.word} ...Skipping Word...",
-                        "WARN",
-                    )
-                    list_word.status = Status.SKIPPED_DEFINED
-                    self.skipped_word.emit(list_word)
-                    continue
-
-                self.logging(f"Found {len(res)} word for {list_word.word}")
-                for word in res:
-                    word_choice = {
-                        "word": word["word"],
-                        "partOfSpeech": word["meanings"][0]["partOfSpeech"],
-                        "meaning": word["meanings"][0]["definitions"][0]["definition"],
-                    }
-                    word_choices.append(word_choice)
-
-                with QMutexLocker(self._mutex):
-                    if len(res) > 1:
-                        self.logging("Pausing to ask User to Select Word Choice")
-                        self.multi_words.emit(word_choices)
-                        self._paused = True
-
-                    while self._paused:
-                        self._wait_condition.wait(self._mutex)
-
-                if self.word_selection == len(word_choices):
-                    self.logging("User did not select a word choice. Skipping word...")
-                    list_word.status = Status.SKIPPED_DEFINED
-                    self.skipped_word.emit(list_word)
-                    continue
-
-                if len(res) > 1:
-                    self.logging(f"User selected option {self.word_selection + 1}")
-                    word = res[self.word_selection]
-                else:
-                    word = res[0]
-
-                meanings = word["meanings"]
+                self.journal.started("define", list_word.guid)
+                entries = self.prefetcher.result(index - 1)
+                self.define_word(list_word, entries)
+            except QuotaExceededError as e:
+                self.logging(f"{e}. Stopping word look up.", "ERROR")
+                break
+            except Exception as e:
+                self.journal.failed("define", list_word.guid, str(e))
                 self.logging(
-                    f"Found {len(meanings)} meanings for word: {list_word.word}"
+                    f"Could not look up {list_word.word}: {e}. "
+                    "It stays in the queue to be defined.",
+                    "ERROR",
                 )
-                all_meanings = []
-                for meaning in meanings:
-                    for definition in meaning["definitions"]:
-                        a_meaning = DefinitionModel(
-                            meaning["partOfSpeech"],
-                            definition.get("definition", ""),
-                            definition.get("synonyms") or meaning.get("synonyms", []),
-                            definition.get("antonyms") or meaning.get("antonyms", []),
-                            definition.get("example", ""),
-                        )
-                        all_meanings.append(a_meaning)
-
-                with QMutexLocker(self._mutex):
-                    if len(all_meanings) > 1:
-                        self.logging("Asking User for meanings they want to keep.")
-                        self.multi_definitions.emit(list_word.word, all_meanings)
-                        self._paused = True
-
-                    while self._paused:
-                        self._wait_condition.wait(self._mutex)
-
-                if len(all_meanings) > 1 and self.multi_selection[0] == len(
-                    all_meanings
-                ):
-                    list_word.status = Status.SKIPPED_DEFINED
-                    self.logging(
-                        "User did not select a word meanings. Skipping word..."
-                    )
-                    self.skipped_word.emit(list_word)
-                    continue
-
-                def add_non_duplicates(original_list, new_items):
-                    return list(set(original_list).union(new_items))
-
-                if len(all_meanings) == 1:
-                    self.multi_selection = [0]
-                all_meanings = [all_meanings[i] for i in self.multi_selection]
-                word_name = word["word"]
-                definition_string = ""
-                synonyms = ""
-                example = ""
-                audio = ""
-
-                for index, meaning in enumerate(all_meanings):
-
-                    if index != 0:
-                        definition_string += "<br><br>"
-
-                    definition_string += (
-                        f"<b>{meaning.partOfSpeech}</b> - {meaning.definition}"
-                    )
-                    synonyms = add_non_duplicates(synonyms, meaning.synonyms)
-                    example += meaning.example
-
-                list_word.status = Status.DEFINDED
-                list_word.word = word_name
-                list_word.definition = definition_string
-                list_word.audio = audio
-                list_word.synonyms = ", ".join(meaning.synonyms)
-                list_word.example = example
-                self.logging(f"Completed word: {list_word.word}")
-                self.defined_word.emit(list_word)
-
-            except Exception as e:
-                print(e)
+        self.prefetcher.shutdown()
+        self.journal.run_finished("define")
         self.logging("No more words left. Ending word look up.")
         self.finished.emit()
 
+    def define_word(self, list_word, entries):
+        """
+        Walks the user through choosing a word and definitions and emits the result.
+
+        Args:
+            list_word (WordModel): The word being defined.
+            entries (List[DictionaryEntryModel]): The entries the backend found for the word.
+
+        Returns:
+            None: This function does not return a value.
+        """
+        self.multi_selection = 0
+
+        # handle not finding word
+        if not entries:
+            self.logging(
+                f"No definitions found for word: {list_word.word} ...Skipping Word...",
+                "WARN",
+            )
+            self.skip_word(list_word)
+            return
+
+        self.logging(f"Found {len(entries)} word for {list_word.word}")
+        word_choices = [
+            {
+                "word": entry.word,
+                "partOfSpeech": entry.partOfSpeech,
+                "meaning": entry.meaning,
+            }
+            for entry in entries
+        ]
+
+        with QMutexLocker(self._mutex):
+            if len(entries) > 1:
+                self.logging("Pausing to ask User to Select Word Choice")
+                self.multi_words.emit(word_choices)
+                self._paused = True
+
+            while self._paused:
+                self._wait_condition.wait(self._mutex)
+
+        if len(entries) > 1 and self.word_selection == len(word_choices):
+            self.logging("User did not select a word choice. Skipping word...")
+            self.skip_word(list_word)
+            return
+
+        if len(entries) > 1:
+            self.logging(f"User selected option {self.word_selection + 1}")
+            entry = entries[self.word_selection]
+        else:
+            entry = entries[0]
+
+        all_meanings = entry.definitions
+        self.logging(f"Found {len(all_meanings)} meanings for word: {list_word.word}")
+
+        with QMutexLocker(self._mutex):
+            if len(all_meanings) > 1:
+                self.logging("Asking User for meanings they want to keep.")
+                self.multi_definitions.emit(list_word.word, all_meanings)
+                self._paused = True
+
+            while self._paused:
+                self._wait_condition.wait(self._mutex)
+
+        if len(all_meanings) > 1 and self.multi_selection[0] == len(all_meanings):
+            self.logging("User did not select a word meanings. Skipping word...")
+            self.skip_word(list_word)
+            return
+
+        if len(all_meanings) == 1:
+            self.multi_selection = [0]
+        selected_meanings = [all_meanings[i] for i in self.multi_selection]
+
+        definition_string = "<br><br>".join(
+            f"<b>{meaning.partOfSpeech}</b> - {meaning.definition}"
+            for meaning in selected_meanings
+        )
+        synonyms = entry.synonyms or list(
+            dict.fromkeys(
+                synonym for meaning in selected_meanings for synonym in meaning.synonyms
+            )
+        )
+        example = entry.example or "".join(
+            meaning.example for meaning in selected_meanings
+        )
+
+        list_word.status = Status.DEFINDED
+        list_word.word = entry.word
+        list_word.definition = definition_string
+        list_word.audio = ""
+        list_word.synonyms = ", ".join(synonyms)
+        list_word.example = example
+        self.journal.completed("define", WordsModel.to_row(list_word))
+        self.logging(f"Completed word: {list_word.word}")
+        self.defined_word.emit(list_word)
+
+    def skip_word(self, list_word):
+        list_word.status = Status.SKIPPED_DEFINED
+        self.journal.completed("define", WordsModel.to_row(list_word))
+        self.skipped_word.emit(list_word)
+
+    def fetch_entries(self, list_words):
+        """
+        Fetches and parses the entries for a batch of words, answering from the
+        response cache when possible. Runs on the prefetch pool.
+
+        Args:
+            list_words (List[WordModel]): The words to look up.
+
+        Returns:
+            list: One list of DictionaryEntryModel per word.
+        """
+        bodies = [None] * len(list_words)
+        if self.backend.cacheable:
+            bodies = [
+                self.response_cache.get(self.backend.name, list_word.word)
+                for list_word in list_words
+            ]
+
+        missing = [i for i, body in enumerate(bodies) if body is None]
+        if missing:
+            self.rate_limiter.acquire(self.backend.name, len(missing))
+            fetched = self.backend.fetch([list_words[i].word for i in missing])
+            for i, body in zip(missing, fetched):
+                bodies[i] = body
+
+        results = []
+        for i, list_word in enumerate(list_words):
+            # a not found word has no body and is not cached
+            if bodies[i] is None:
+                results.append([])
+                continue
+            results.append(self.backend.parse(list_word.word, bodies[i]))
+            if self.backend.cacheable and i in missing:
+                self.response_cache.put(self.backend.name, list_word.word, bodies[i])
+        return results
+
+    def log_retry(self, error: BaseException, attempt: int, delay: float) -> None:
+        self.logging(
+            f"Lookup attempt {attempt} failed: {error}. Retrying in {delay:.1f}s.",
+            "WARN",
+        )
+
+    def log_circuit_open(self, name: str, pause: float) -> None:
+        self.logging(f"{name} keeps failing. Pausing lookups for {pause:.0f}s.", "WARN")
+
     @Slot(WordModel)
     def add_word_to_list(self, word):
         with QMutexLocker(self._mutex):
@@ -177,6 +272,24 @@ class WordLookupWorker(QThread):
             self._paused = False
             self._wait_condition.wakeAll()
 
+    def hold(self):
+        """
+        Stops starting new words until `release` is called. Used by the
+        PipelineOrchestrator while the next stage has too many words waiting.
+        """
+        with QMutexLocker(self._mutex):
+            self._held = True
+
+    def release(self):
+        with QMutexLocker(self._mutex):
+            self._held = False
+            self._wait_condition.wakeAll()
+
+    def wait_while_held(self):
+        with QMutexLocker(self._mutex):
+            while self._held:
+                self._wait_condition.wait(self._mutex)
+
     @Slot(list)
     def get_user_definition_selection(self, choices):
         self.multi_selection = choices
@@ -0,0 +1,3 @@
+from .runner import POLICIES, STAGES, HeadlessRunner, SelectionPolicy
+
+__all__ = ["HeadlessRunner", "SelectionPolicy", "STAGES", "POLICIES"]
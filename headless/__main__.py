@@ -0,0 +1,65 @@
+import argparse
+import os
+import sys
+
+from PySide6.QtCore import QCoreApplication, QTimer
+
+from .runner import POLICIES, STAGES, HeadlessRunner, SelectionPolicy
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m headless",
+        description="Run the word pipeline without the GUI, using the app's settings.",
+    )
+    commands = parser.add_subparsers(dest="command", required=True)
+    run = commands.add_parser("run", help="Run pipeline stages.")
+    run.add_argument(
+        "--stage",
+        action="append",
+        choices=STAGES + ["all"],
+        help="Stage to run. Can be given more than once. Defaults to all.",
+    )
+    run.add_argument(
+        "--input",
+        action="append",
+        default=[],
+        help="File with one word per line to add in the import stage.",
+    )
+    run.add_argument(
+        "--policy",
+        choices=POLICIES,
+        default="first",
+        help="How to pick between several words or definitions. Defaults to first.",
+    )
+    run.add_argument(
+        "--max-definitions",
+        type=int,
+        default=1,
+        help="Definitions kept by the first policy. Defaults to 1.",
+    )
+    run.add_argument(
+        "--verbose", action="store_true", help="Print the workers' log messages."
+    )
+    args = parser.parse_args(argv)
+
+    for path in args.input:
+        if not os.path.isfile(path):
+            parser.error(f"input file not found: {path}")
+    stages = args.stage or ["all"]
+    if "all" in stages:
+        stages = STAGES
+
+    app = QCoreApplication(sys.argv[:1])
+    runner = HeadlessRunner(
+        stages,
+        SelectionPolicy(args.policy, args.max_definitions),
+        args.input,
+        args.verbose,
+    )
+    QTimer.singleShot(0, runner.start)
+    return app.exec()
+
+
+if __name__ == "__main__":
+    sys.exit(main())
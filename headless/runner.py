@@ -0,0 +1,360 @@
+import time
+import uuid
+from typing import List, Optional
+
+from PySide6.QtCore import QCoreApplication, QObject, Slot
+
+from core import AnkiDuplicateCheck, AnkiExportThread, AudioThread, WordLookupWorker
+from core.backends import (
+    FreeDictionaryBackend,
+    MerriamWebsterBackend,
+    OfflineDictionaryBackend,
+)
+from models import AppSettingsModel, Status, WordModel, WordsModel
+from services.network import HttpClient
+
+STAGES = ["import", "define", "audio", "sync"]
+POLICIES = ["first", "all", "skip"]
+
+
+class SelectionPolicy:
+    """
+    Answers the lookup worker's word and definition prompts without a user.
+
+    Policies:
+        first: Keeps the first word and its first `max_definitions` definitions.
+        all: Keeps the first word and all of its definitions.
+        skip: Skips any word with more than one word choice or definition.
+
+    Attributes:
+        name (str): The policy name.
+        max_definitions (int): Definitions kept by the "first" policy.
+    """
+
+    def __init__(self, name: str = "first", max_definitions: int = 1):
+        self.name = name
+        self.max_definitions = max(1, max_definitions)
+
+    def choose_word(self, choices: list) -> int:
+        """
+        Returns the index of the word to keep, or len(choices) to skip the word.
+        """
+        return len(choices) if self.name == "skip" else 0
+
+    def choose_definitions(self, definitions: list) -> List[int]:
+        """
+        Returns the indexes of the definitions to keep, or [len(definitions)] to skip
+        the word.
+        """
+        if self.name == "skip":
+            return [len(definitions)]
+        if self.name == "all":
+            return list(range(len(definitions)))
+        return list(range(min(self.max_definitions, len(definitions))))
+
+
+class HeadlessRunner(QObject):
+    """
+    Runs the import, define, audio and Anki sync stages without any widgets.
+
+    The runner drives the same workers and models the pages use, answers the lookup
+    prompts with a SelectionPolicy and prints progress to stdout. Stages run one after
+    the other, each on the words the previous stage produced, and the app quits when
+    the last stage is done.
+
+    Attributes:
+        stages (List[str]): The stages to run, in pipeline order.
+        policy (SelectionPolicy): Answers the word and definition prompts.
+        input_paths (List[str]): Files with one word per line for the import stage.
+        verbose (bool): Also print the workers' log messages.
+        exit_code (int): 0 if every stage ran, 1 if a stage could not start.
+    """
+
+    def __init__(
+        self,
+        stages: List[str],
+        policy: SelectionPolicy,
+        input_paths: Optional[List[str]] = None,
+        verbose: bool = False,
+    ):
+        super().__init__()
+        self.stages = [stage for stage in STAGES if stage in stages]
+        self.policy = policy
+        self.input_paths = input_paths or []
+        self.verbose = verbose
+        self.exit_code = 0
+        self.wordsModel = WordsModel()
+        self.settings = AppSettingsModel()
+        self.settings.get_settings()
+        HttpClient().configure(
+            pool_size=int(self.settings.http_pool_size or 10),
+            read_timeout=int(self.settings.http_timeout or 15),
+        )
+        self.worker = None
+        self.stage = None
+        self.stage_started = 0.0
+        self.stage_total = 0
+        self.stage_done = 0
+        self.summary = []
+        self.run_started = 0.0
+
+    @Slot()
+    def start(self) -> None:
+        """
+        Starts the first stage. Connect to the application's startup, e.g. with a
+        zero timeout single shot timer.
+
+        Returns:
+            None: This function does not return a value.
+        """
+        self.run_started = time.monotonic()
+        self.next_stage()
+
+    def next_stage(self) -> None:
+        if self.stage is not None:
+            self.end_stage()
+        if not self.stages:
+            self.finish()
+            return
+        self.stage = self.stages.pop(0)
+        getattr(self, f"run_{self.stage}")()
+
+    def begin_stage(self, total: int) -> None:
+        self.stage_started = time.monotonic()
+        self.stage_total = total
+        self.stage_done = 0
+        self.output(f"starting with {total} words")
+
+    def end_stage(self) -> None:
+        elapsed = time.monotonic() - self.stage_started
+        self.wordsModel.save_words()
+        self.summary.append((self.stage, self.stage_done, elapsed))
+        rate = self.stage_done / elapsed if elapsed else 0
+        self.output(f"done: {self.stage_done} words in {elapsed:.1f}s ({rate:.2f}/s)")
+
+    def progress(self, word: WordModel, result: str) -> None:
+        self.stage_done += 1
+        self.output(f"{self.stage_done}/{self.stage_total} {result}: {word.word}")
+
+    def fail_stage(self, msg: str) -> None:
+        self.output(msg)
+        self.exit_code = 1
+        self.stages.clear()
+        self.next_stage()
+
+    def move_words(self, words: List[WordModel], status: Status) -> None:
+        for word in words:
+            self.wordsModel.update_status(word.guid, status)
+
+    # IMPORT
+    def run_import(self) -> None:
+        new_words = []
+        seen = set()
+        for text in self.read_input():
+            if text.lower() in seen or self.wordsModel.has_headword(text):
+                continue
+            seen.add(text.lower())
+            new_words.append(
+                WordModel(Status.ADDED, str(uuid.uuid4()), text, "", "", "", "", "")
+            )
+        self.wordsModel.add_words(new_words)
+        added = self.wordsModel.undefined_words
+        self.begin_stage(len(added))
+        self.move_words(added, Status.TO_BE_DEFINED)
+        self.stage_done = len(added)
+        self.next_stage()
+
+    def read_input(self):
+        for path in self.input_paths:
+            with open(path, "r", encoding="utf-8") as file:
+                for line in file:
+                    if line.strip():
+                        yield line.strip()
+
+    # DEFINE
+    def run_define(self) -> None:
+        words = self.wordsModel.to_be_defined_words
+        self.begin_stage(len(words))
+        if not words:
+            self.next_stage()
+            return
+
+        source = self.settings.dictionary_source
+        if (
+            source == "Merriam Webster"
+            and self.settings.merriam_webster_api_key
+            and self.settings.merriam_webster_api_key_verified
+        ):
+            backend = MerriamWebsterBackend(self.settings.merriam_webster_api_key)
+        elif (
+            source == "Offline Dictionary"
+            and self.settings.offline_dictionary_path
+            and self.settings.offline_dictionary_path_verified
+        ):
+            backend = OfflineDictionaryBackend(self.settings.offline_dictionary_path)
+        else:
+            backend = FreeDictionaryBackend()
+
+        self.worker = WordLookupWorker(
+            words, backend, max_workers=max(1, int(self.settings.lookup_concurrency))
+        )
+        self.worker.send_logs.connect(self.receive_logs)
+        self.worker.multi_words.connect(self.select_word)
+        self.worker.multi_definitions.connect(self.select_definitions)
+        self.worker.defined_word.connect(self.receive_defined_word)
+        self.worker.skipped_word.connect(self.receive_skipped_word)
+        self.worker.finished.connect(self.on_worker_finished)
+        self.worker.start()
+
+    @Slot(list)
+    def select_word(self, choices: list) -> None:
+        self.worker.get_user_word_selection(self.policy.choose_word(choices))
+
+    @Slot(str, list)
+    def select_definitions(self, word: str, definitions: list) -> None:
+        self.worker.get_user_definition_selection(
+            self.policy.choose_definitions(definitions)
+        )
+
+    # AUDIO
+    def run_audio(self) -> None:
+        self.move_words(self.wordsModel.defined_words, Status.TO_BE_AUDIO)
+        words = self.wordsModel.to_be_audio_words
+        self.begin_stage(len(words))
+        if not words:
+            self.next_stage()
+            return
+        if (
+            not self.settings.google_api_key
+            or not self.settings.google_api_key_verified
+        ):
+            self.fail_stage("Google API key is not set or not verified. Stopping.")
+            return
+        if (
+            not self.settings.anki_audio_path
+            or not self.settings.anki_audio_path_verified
+        ):
+            self.fail_stage("Anki audio path is not set or not verified. Stopping.")
+            return
+
+        if (
+            self.settings.anki_deck_name_verified
+            and self.settings.anki_model_name_verified
+        ):
+            duplicate_check = AnkiDuplicateCheck(
+                words, self.settings.anki_deck_name, self.settings.anki_model_name
+            )
+            duplicate_check.send_logs.connect(self.receive_logs)
+            duplicate_check.duplicate_word.connect(self.receive_duplicate_word)
+            duplicate_check.do_work()
+            words = self.wordsModel.to_be_audio_words
+
+        self.worker = AudioThread(
+            words,
+            folder_path=self.settings.anki_audio_path,
+            credential_string=self.settings.google_api_key,
+            max_workers=max(1, int(self.settings.audio_concurrency)),
+        )
+        self.worker.send_logs.connect(self.receive_logs)
+        self.worker.audio_word.connect(self.receive_audio_word)
+        self.worker.error_word.connect(self.receive_error_word)
+        self.worker.finished.connect(self.on_worker_finished)
+        self.worker.start()
+
+    @Slot(WordModel)
+    def receive_duplicate_word(self, word: WordModel) -> None:
+        self.wordsModel.update_status(word.guid, Status.SKIPPED_ANKI_DUP)
+        self.progress(word, "in anki")
+
+    # SYNC
+    def run_sync(self) -> None:
+        self.move_words(self.wordsModel.audio_words, Status.TO_BE_SYNCED)
+        words = self.wordsModel.to_be_synced_words
+        self.begin_stage(len(words))
+        if not words:
+            self.next_stage()
+            return
+        if not (
+            self.settings.anki_deck_name
+            and self.settings.anki_model_name
+            and self.settings.anki_deck_name_verified
+            and self.settings.anki_model_name_verified
+        ):
+            self.fail_stage("Anki deck or model is not set or not verified. Stopping.")
+            return
+
+        self.worker = AnkiExportThread(
+            words,
+            self.settings.anki_deck_name,
+            self.settings.anki_model_name,
+            max(1, int(self.settings.anki_export_batch_size)),
+            in_flight=self.wordsModel.take_in_flight("sync"),
+        )
+        self.worker.synced_word.connect(self.receive_synced_word)
+        self.worker.dup_word.connect(self.receive_anki_duplicate_word)
+        self.worker.error_word.connect(self.receive_error_word)
+        self.worker.finished.connect(self.on_worker_finished)
+        self.worker.start()
+
+    # the worker signals are connected to slots on the runner, not lambdas, so they are
+    # queued to the main thread like they are for the pages
+    @Slot(WordModel)
+    def receive_defined_word(self, word: WordModel) -> None:
+        self.receive_word(word, "defined")
+
+    @Slot(WordModel)
+    def receive_skipped_word(self, word: WordModel) -> None:
+        self.receive_word(word, "skipped")
+
+    @Slot(WordModel)
+    def receive_audio_word(self, word: WordModel) -> None:
+        self.receive_word(word, "audio")
+
+    @Slot(WordModel)
+    def receive_synced_word(self, word: WordModel) -> None:
+        self.receive_word(word, "synced")
+
+    @Slot(WordModel)
+    def receive_anki_duplicate_word(self, word: WordModel) -> None:
+        self.receive_word(word, "duplicate")
+
+    @Slot(WordModel)
+    def receive_error_word(self, word: WordModel) -> None:
+        self.receive_word(word, "error")
+
+    def receive_word(self, word: WordModel, result: str) -> None:
+        self.wordsModel.update_word(word.guid, word)
+        self.progress(word, result)
+
+    @Slot()
+    def on_worker_finished(self) -> None:
+        if self.worker.isRunning():
+            self.worker.quit()
+            self.worker.wait()
+        self.worker.deleteLater()
+        self.worker = None
+        self.next_stage()
+
+    @Slot(str, str, bool)
+    def receive_logs(self, msg: str, level: str, print_msg: bool) -> None:
+        if self.verbose or level in ["WARN", "ERROR"]:
+            self.output(f"{level}: {msg}")
+
+    def output(self, msg: str) -> None:
+        print(f"[{self.stage or 'run'}] {msg}", flush=True)
+
+    def finish(self) -> None:
+        """
+        Writes the words, prints the run summary and quits the application.
+
+        Returns:
+            None: This function does not return a value.
+        """
+        self.stage = None
+        self.wordsModel.flush_words()
+        total = time.monotonic() - self.run_started
+        for stage, done, elapsed in self.summary:
+            rate = done / elapsed if elapsed else 0
+            self.output(f"{stage:<7} {done:>6} words {elapsed:>8.1f}s {rate:>8.2f}/s")
+        self.output(f"total {total:.1f}s")
+        QCoreApplication.exit(self.exit_code)
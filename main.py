@@ -1,15 +1,25 @@
 # import faulthandler
+import os
 import sys
 
-from PySide6.QtWidgets import QApplication
+from utils.startup import StartupTimer
 
-from views import MainWindow
+# time every import when started with --import-times (like python -X importtime)
+if "--import-times" in sys.argv or os.environ.get("ENGLISHWORDS_IMPORT_TIMES"):
+    StartupTimer.enable_import_timing()
+
+from PySide6.QtWidgets import QApplication  # noqa: E402
+
+from views import MainWindow  # noqa: E402
 
 # faulthandler.enable(file=sys.stderr)
 # faulthandler.enable()
 
+StartupTimer.mark("imports done")
+
 if __name__ == "__main__":
     app = QApplication(sys.argv)
     window = MainWindow(app)
+    StartupTimer.mark("window built")
     window.show()
     app.exec()
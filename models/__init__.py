@@ -1,13 +1,19 @@
 from .definition_model import DefinitionModel
+from .dictionary_entry_model import DictionaryEntryModel
 from .log_settings import LogSettingsModel
 from .settings_model import AppSettingsModel
+from .word_list_model import WordListModel
 from .word_model import Status, WordModel
 from .words_model import WordsModel
+from .words_snapshot import WordsSnapshot
 
 __all__ = [
     "WordModel",
     "WordsModel",
+    "WordsSnapshot",
+    "WordListModel",
     "DefinitionModel",
+    "DictionaryEntryModel",
     "Status",
     "LogSettingsModel",
     "AppSettingsModel",
@@ -0,0 +1,14 @@
+from dataclasses import dataclass, field
+from typing import List
+
+from .definition_model import DefinitionModel
+
+
+@dataclass
+class DictionaryEntryModel:
+    word: str
+    partOfSpeech: str
+    meaning: str
+    definitions: List[DefinitionModel]
+    synonyms: List[str] = field(default_factory=list)
+    example: str = ""
@@ -20,6 +20,15 @@ class AppSettingsModel(QObject, metaclass=QSingleton):
         self.google_api_key = ""
         self.dictionary_source = ""
         self.merriam_webster_api_key = ""
+        self.lookup_concurrency = 4
+        self.offline_dictionary_path = ""
+        self.anki_export_batch_size = 50
+        self.audio_concurrency = 4
+        self.http_pool_size = 10
+        self.http_timeout = 15
+        self.auto_advance_define = False
+        self.auto_advance_audio = False
+        self.pipeline_queue_size = 20
 
         self.anki_deck_name_verified = False
         self.anki_model_name_verified = False
@@ -29,6 +38,15 @@ class AppSettingsModel(QObject, metaclass=QSingleton):
         self.google_api_key_verified = False
         self.dictionary_source_verified = False
         self.merriam_webster_api_key_verified = False
+        self.lookup_concurrency_verified = False
+        self.offline_dictionary_path_verified = False
+        self.anki_export_batch_size_verified = False
+        self.audio_concurrency_verified = False
+        self.http_pool_size_verified = False
+        self.http_timeout_verified = False
+        self.auto_advance_define_verified = False
+        self.auto_advance_audio_verified = False
+        self.pipeline_queue_size_verified = False
 
         self.log_file_path_verified = False
         self.log_file_name_verified = False
@@ -57,6 +75,15 @@ class AppSettingsModel(QObject, metaclass=QSingleton):
             "log_backup_count",
             "dictionary_source",
             "merriam_webster_api_key",
+            "lookup_concurrency",
+            "offline_dictionary_path",
+            "anki_export_batch_size",
+            "audio_concurrency",
+            "http_pool_size",
+            "http_timeout",
+            "auto_advance_define",
+            "auto_advance_audio",
+            "pipeline_queue_size",
         ]
 
         self.settings_mapping = {
@@ -113,6 +140,36 @@ class AppSettingsModel(QObject, metaclass=QSingleton):
                 "type": "secure",
             },
             "auto_save_on_close": {"default": True, "type": "bool"},
+            "lookup_concurrency": {
+                "default": 4,
+                "type": "int",
+            },
+            "offline_dictionary_path": {
+                "default": "",
+                "type": "str",
+            },
+            "anki_export_batch_size": {
+                "default": 50,
+                "type": "int",
+            },
+            "audio_concurrency": {
+                "default": 4,
+                "type": "int",
+            },
+            "http_pool_size": {
+                "default": 10,
+                "type": "int",
+            },
+            "http_timeout": {
+                "default": 15,
+                "type": "int",
+            },
+            "auto_advance_define": {"default": False, "type": "bool"},
+            "auto_advance_audio": {"default": False, "type": "bool"},
+            "pipeline_queue_size": {
+                "default": 20,
+                "type": "int",
+            },
         }
 
     def get_settings(self):
@@ -0,0 +1,285 @@
+import threading
+from typing import Callable, Dict, Iterable, List, Optional, Set, Tuple
+
+from utils.text import normalize_headword
+
+from .word_model import Status, WordModel
+
+
+class WordIndex:
+    """
+    Indexed store of words with a guid map and an insertion ordered bucket per status.
+
+    The index doesn't see assignments to a word's fields. A word changed in place is
+    put back with `put`, or moved with `set_status`, to update its bucket. Every
+    operation is O(1) except listing a bucket, which is O(bucket size).
+
+    Stored words can be loaded one status at a time. With a source set, a status
+    bucket is read from storage the first time it is used, and a guid lookup reads
+    only the bucket of that word. Listing every word, counting the headwords or the
+    index size loads the remaining buckets.
+
+    The index also records which words changed or were removed since the last call to
+    `take_changes`, so persistence only has to write those rows, and counts the
+    normalized headwords so duplicates can be found without a scan.
+
+    All access is serialized with a lock so worker threads can read the buckets while
+    the pages change them.
+    """
+
+    def __init__(self):
+        self._lock = threading.RLock()
+        self._by_guid: Dict[str, WordModel] = {}
+        self._by_status: Dict[Status, Dict[str, WordModel]] = {
+            status: {} for status in Status
+        }
+        self._status_of: Dict[str, Status] = {}
+        self._changed: Dict[str, None] = {}
+        self._removed: Dict[str, None] = {}
+        self._headwords: Dict[str, int] = {}
+        self._headword_of: Dict[str, str] = {}
+        self._load_status: Optional[Callable[[List[Status]], List[WordModel]]] = None
+        self._stored_status: Optional[Callable[[str], Optional[Status]]] = None
+        self._unloaded: Set[Status] = set()
+        self._deleted: Set[str] = set()
+
+    def __len__(self) -> int:
+        with self._lock:
+            self._ensure_loaded(Status)
+            return len(self._by_guid)
+
+    def __contains__(self, guid: str) -> bool:
+        return self.get(guid) is not None
+
+    def set_source(
+        self,
+        load_status: Callable[[List[Status]], List[WordModel]],
+        stored_status: Callable[[str], Optional[Status]],
+    ) -> None:
+        """
+        Sets where stored words are read from. Every status is loaded on first use.
+
+        Args:
+            load_status (Callable): Reads the stored words with the given statuses, in
+                the order they were first stored.
+            stored_status (Callable): Reads the stored status of a guid, or None if the
+                word isn't stored.
+
+        Returns:
+            None: This function does not return a value.
+        """
+        with self._lock:
+            self._load_status = load_status
+            self._stored_status = stored_status
+            self._unloaded = set(Status)
+            self._deleted.clear()
+
+    def get(self, guid: str) -> Optional[WordModel]:
+        """
+        Returns the word with the guid, or None if it isn't in the index.
+
+        Args:
+            guid (str): The guid of the word.
+
+        Returns:
+            Optional[WordModel]: The word.
+        """
+        with self._lock:
+            word = self._by_guid.get(guid)
+            if word is None and self._unloaded and guid not in self._deleted:
+                status = self._stored_status(guid)
+                if status is not None:
+                    self._ensure_loaded([status])
+                    word = self._by_guid.get(guid)
+            return word
+
+    def words(self, status: Optional[Status] = None) -> List[WordModel]:
+        """
+        Lists the words in the index, or only the words with a status.
+
+        Args:
+            status (Status, optional): The status to list. Defaults to every word.
+
+        Returns:
+            List[WordModel]: The words, in the order they were added or moved into the status.
+        """
+        with self._lock:
+            if status is None:
+                self._ensure_loaded(Status)
+                return list(self._by_guid.values())
+            self._ensure_loaded([status])
+            return list(self._by_status[status].values())
+
+    def count(self, status: Status) -> int:
+        """
+        Counts the words with a status.
+
+        Args:
+            status (Status): The status to count.
+
+        Returns:
+            int: The number of words.
+        """
+        with self._lock:
+            self._ensure_loaded([status])
+            return len(self._by_status[status])
+
+    def put(self, word: WordModel) -> None:
+        """
+        Adds a word, or replaces the word with the same guid while keeping its position.
+        Putting a word that is already in the index records its changes and moves it
+        to its status bucket.
+
+        Args:
+            word (WordModel): The word to store.
+
+        Returns:
+            None: This function does not return a value.
+        """
+        with self._lock:
+            old = self._by_guid.get(word.guid)
+            if old is not None:
+                old_status = self._status_of[word.guid]
+                if old is not word or old_status != word.status:
+                    self._by_status[old_status].pop(word.guid, None)
+                if self._headword_of.get(word.guid) != normalize_headword(word.word):
+                    self._drop_headword(word.guid)
+                    self._add_headword(word)
+            else:
+                self._add_headword(word)
+            self._by_guid[word.guid] = word
+            self._by_status[word.status][word.guid] = word
+            self._status_of[word.guid] = word.status
+            self._changed[word.guid] = None
+            self._removed.pop(word.guid, None)
+            self._deleted.discard(word.guid)
+
+    def remove(self, guid: str) -> Optional[WordModel]:
+        """
+        Removes the word with the guid.
+
+        Args:
+            guid (str): The guid of the word.
+
+        Returns:
+            Optional[WordModel]: The removed word, or None if it wasn't in the index.
+        """
+        with self._lock:
+            if self.get(guid) is None:
+                return None
+            word = self._by_guid.pop(guid)
+            self._by_status[self._status_of.pop(guid)].pop(guid, None)
+            self._drop_headword(guid)
+            self._changed.pop(guid, None)
+            self._removed[guid] = None
+            # the stored row may outlive the word until the next save
+            self._deleted.add(guid)
+            return word
+
+    def remove_status(self, status: Status) -> List[WordModel]:
+        """
+        Removes every word with a status.
+
+        Args:
+            status (Status): The status to clear.
+
+        Returns:
+            List[WordModel]: The removed words.
+        """
+        with self._lock:
+            self._ensure_loaded([status])
+            removed = list(self._by_status[status].values())
+            for word in removed:
+                self.remove(word.guid)
+            return removed
+
+    def clear(self) -> None:
+        """
+        Removes every word.
+
+        Returns:
+            None: This function does not return a value.
+        """
+        with self._lock:
+            self._by_guid.clear()
+            for bucket in self._by_status.values():
+                bucket.clear()
+            self._status_of.clear()
+            self._changed.clear()
+            self._removed.clear()
+            self._headwords.clear()
+            self._headword_of.clear()
+            self._unloaded.clear()
+            self._deleted.clear()
+
+    def has_headword(self, text: str) -> bool:
+        """
+        Checks if a word with the same normalized headword is in the index.
+
+        Args:
+            text (str): The word to check.
+
+        Returns:
+            bool: True if the headword is already in the index.
+        """
+        with self._lock:
+            self._ensure_loaded(Status)
+            return normalize_headword(text) in self._headwords
+
+    def take_changes(self) -> Tuple[List[WordModel], List[str]]:
+        """
+        Returns and forgets the words changed and the guids removed since the last call.
+
+        Returns:
+            Tuple[List[WordModel], List[str]]: The changed words and the removed guids.
+        """
+        with self._lock:
+            changed = [self._by_guid[guid] for guid in self._changed]
+            removed = list(self._removed)
+            self._changed.clear()
+            self._removed.clear()
+            return changed, removed
+
+    def set_status(self, word: WordModel, status: Status) -> None:
+        """
+        Sets a word's status and moves it to the status bucket.
+
+        Args:
+            word (WordModel): The word whose status is changing.
+            status (Status): The new status.
+
+        Returns:
+            None: This function does not return a value.
+        """
+        with self._lock:
+            word.status = status
+            if self._by_guid.get(word.guid) is word:
+                self.put(word)
+
+    def _ensure_loaded(self, statuses: Iterable[Status]) -> None:
+        missing = [status for status in statuses if status in self._unloaded]
+        if not missing:
+            return
+        self._unloaded.difference_update(missing)
+        for word in self._load_status(missing):
+            # words already in memory are newer than their stored rows
+            if word.guid in self._by_guid or word.guid in self._deleted:
+                continue
+            self._add_headword(word)
+            self._by_guid[word.guid] = word
+            self._by_status[word.status][word.guid] = word
+            self._status_of[word.guid] = word.status
+
+    def _add_headword(self, word: WordModel) -> None:
+        headword = normalize_headword(word.word)
+        self._headword_of[word.guid] = headword
+        self._headwords[headword] = self._headwords.get(headword, 0) + 1
+
+    def _drop_headword(self, guid: str) -> None:
+        headword = self._headword_of.pop(guid, None)
+        if headword is None:
+            return
+        if self._headwords[headword] > 1:
+            self._headwords[headword] -= 1
+        else:
+            del self._headwords[headword]
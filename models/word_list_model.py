@@ -0,0 +1,250 @@
+from typing import Callable, Iterable, List, Optional
+
+from PySide6.QtCore import QAbstractListModel, QModelIndex, Qt, Slot
+
+from .word_model import WordModel
+from .words_model import WordsModel
+
+
+class WordListModel(QAbstractListModel):
+    """
+    List model of words for the page list views.
+
+    Rows are kept in a list with a guid to position index, so adding, updating and
+    removing a word doesn't scan the list. Positions are counted from an offset, so
+    removing rows from the front, as a queue does, only moves the offset. After any
+    other removal the index is rebuilt lazily from the first row it shifted, which keeps
+    a burst of removals to a single rebuild. Removals of adjacent rows are sent to the
+    view as one ranged `rowsRemoved`.
+
+    The model follows the WordsModel: updated words are refreshed and deleted words
+    are removed.
+
+    Attributes:
+        display (Callable): Returns the text shown for a word. Defaults to the word itself.
+    """
+
+    def __init__(
+        self,
+        words: Optional[Iterable[WordModel]] = None,
+        display: Optional[Callable[[WordModel], str]] = None,
+        parent=None,
+    ):
+        """
+        Initializes the model.
+
+        Args:
+            words (Iterable[WordModel], optional): The starting rows. Defaults to none.
+            display (Callable, optional): Returns the text shown for a word. Defaults to the word.
+            parent (QObject, optional): The parent object. Defaults to None.
+        """
+        super().__init__(parent)
+        self.display = display or (lambda word: word.word)
+        self._words: List[WordModel] = list(words or [])
+        self._rows = {}
+        self._indexed = 0
+        self._offset = 0
+
+        self.wordsModel = WordsModel()
+        self.wordsModel.word_updated.connect(self.update_word)
+        self.wordsModel.word_deleted.connect(self.remove_word)
+        self.wordsModel.words_deleted.connect(self.remove_words)
+        self.wordsModel.data_reset.connect(lambda _: self.set_words([]))
+
+    def rowCount(self, parent=None) -> int:
+        if parent is not None and parent.isValid():
+            return 0
+        return len(self._words)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid() or index.row() >= len(self._words):
+            return None
+        word = self._words[index.row()]
+        if role == Qt.DisplayRole:
+            return self.display(word)
+        if role == Qt.UserRole:
+            return word.guid
+        return None
+
+    def row_of(self, guid: str) -> int:
+        """
+        Finds the row of a word.
+
+        Args:
+            guid (str): The guid of the word.
+
+        Returns:
+            int: The row, or -1 if the word isn't in the model.
+        """
+        position = self._rows.get(guid)
+        if position is not None and 0 <= position - self._offset < self._indexed:
+            return position - self._offset
+        for i in range(self._indexed, len(self._words)):
+            self._rows[self._words[i].guid] = i + self._offset
+        self._indexed = len(self._words)
+        position = self._rows.get(guid)
+        return -1 if position is None else position - self._offset
+
+    def word(self, row: int) -> WordModel:
+        """
+        Returns the word at a row.
+
+        Args:
+            row (int): The row.
+
+        Returns:
+            WordModel: The word.
+        """
+        return self._words[row]
+
+    def words(self) -> List[WordModel]:
+        """
+        Returns the words in row order.
+
+        Returns:
+            List[WordModel]: The words.
+        """
+        return list(self._words)
+
+    def guids(self) -> List[str]:
+        """
+        Returns the guids of the words in row order.
+
+        Returns:
+            List[str]: The guids.
+        """
+        return [word.guid for word in self._words]
+
+    @Slot(WordModel)
+    def add_word(self, word: WordModel) -> None:
+        """
+        Appends a word, or refreshes its row if it is already in the model.
+
+        Args:
+            word (WordModel): The word to add.
+
+        Returns:
+            None: This function does not return a value.
+        """
+        if self.row_of(word.guid) >= 0:
+            self.update_word(word)
+            return
+        row = len(self._words)
+        self.beginInsertRows(QModelIndex(), row, row)
+        self._words.append(word)
+        if self._indexed == row:
+            self._rows[word.guid] = row + self._offset
+            self._indexed += 1
+        self.endInsertRows()
+
+    def add_words(self, words: Iterable[WordModel]) -> None:
+        """
+        Appends several words with a single insert.
+
+        Args:
+            words (Iterable[WordModel]): The words to add.
+
+        Returns:
+            None: This function does not return a value.
+        """
+        new_words = []
+        seen = set()
+        for word in words:
+            if word.guid in seen or self.row_of(word.guid) >= 0:
+                continue
+            seen.add(word.guid)
+            new_words.append(word)
+        if not new_words:
+            return
+        first = len(self._words)
+        self.beginInsertRows(QModelIndex(), first, first + len(new_words) - 1)
+        self._words.extend(new_words)
+        self.endInsertRows()
+
+    @Slot(WordModel)
+    def update_word(self, word: WordModel) -> None:
+        """
+        Refreshes the row of a word if it is in the model.
+
+        Args:
+            word (WordModel): The updated word.
+
+        Returns:
+            None: This function does not return a value.
+        """
+        row = self.row_of(word.guid)
+        if row < 0:
+            return
+        self._words[row] = word
+        index = self.index(row, 0)
+        self.dataChanged.emit(index, index)
+
+    @Slot(str)
+    def remove_word(self, guid: str) -> None:
+        """
+        Removes a word if it is in the model.
+
+        Args:
+            guid (str): The guid of the word.
+
+        Returns:
+            None: This function does not return a value.
+        """
+        self.remove_words([guid])
+
+    @Slot(list)
+    def remove_words(self, guids: Iterable[str]) -> None:
+        """
+        Removes words, sending each run of adjacent rows as one removal.
+
+        Args:
+            guids (Iterable[str]): The guids of the words.
+
+        Returns:
+            None: This function does not return a value.
+        """
+        rows = sorted(
+            {row for row in (self.row_of(guid) for guid in guids) if row >= 0},
+            reverse=True,
+        )
+        while rows:
+            last = first = rows.pop(0)
+            while rows and rows[0] == first - 1:
+                first = rows.pop(0)
+            self.beginRemoveRows(QModelIndex(), first, last)
+            for word in self._words[first : last + 1]:
+                self._rows.pop(word.guid, None)
+            del self._words[first : last + 1]
+            if first == 0:
+                # the rows after the removed ones keep their positions
+                self._offset += last + 1
+                self._indexed = max(self._indexed - last - 1, 0)
+            else:
+                self._indexed = min(self._indexed, first)
+            self.endRemoveRows()
+
+    def set_words(self, words: Iterable[WordModel]) -> None:
+        """
+        Replaces every row.
+
+        Args:
+            words (Iterable[WordModel]): The new rows.
+
+        Returns:
+            None: This function does not return a value.
+        """
+        self.beginResetModel()
+        self._words = list(words)
+        self._rows = {}
+        self._indexed = 0
+        self._offset = 0
+        self.endResetModel()
+
+    def clear(self) -> None:
+        """
+        Removes every row.
+
+        Returns:
+            None: This function does not return a value.
+        """
+        self.set_words([])
@@ -1,39 +1,69 @@
+import threading
 from dataclasses import asdict
-from typing import List
+from typing import List, Optional
 
-from PySide6.QtCore import QObject, Signal, Slot
+from PySide6.QtCore import Signal, Slot
 
-from base import QSingleton
+from base import QObjectBase, QSingleton
 from services.settings import AppSettings
+from services.storage import JobJournal, SaveScheduler, WordStore
 
+from .word_index import WordIndex
 from .word_model import Status, WordModel
+from .words_snapshot import WordsSnapshot
 
 
-class WordsModel(QObject, metaclass=QSingleton):
+class WordsModel(QObjectBase, metaclass=QSingleton):
     """
     Manages the words data for the application, allowing for adding,updated, deleting, saving, and resetting
-    words. It interacts with persistent storage through AppSettings and emits signals when
-    the data changes.
+    words. It persists the words in a WordStore and emits signals when the data changes.
+
+    Words are kept in a WordIndex, so guid lookups, status changes and the status
+    properties don't scan the whole library. The index reads each status from the
+    words database the first time it is used, so starting the app doesn't load the
+    whole library. Other threads read the words from a WordsSnapshot instead of the
+    live words. A save only hands its changed rows to the snapshot; they are applied
+    the next time the snapshot is read, so saving stays as cheap as the change.
 
     Attributes:
-        self._words (list): Internal list storing the words data.
-        settings (AppSettings): The application settings instance for saving and loading rules.
+        self._index (WordIndex): Internal index storing the words by guid and status.
+        store (WordStore): The words database.
+        save_scheduler (SaveScheduler): Merges save requests and writes them in the background.
+        snapshot (WordsSnapshot): Copy of the words as of the last save.
+        journal (JobJournal): Journal of the define, audio and sync runs.
+        interrupted_stages (Dict[str, dict]): The stages whose last run was cut short,
+            with the options the run was started with.
+        in_flight (Dict[str, List[str]]): The guids each cut short run had started
+            without recording a result. Their work may have been done.
+        settings (AppSettings): The application settings instance, used to migrate old saves.
 
     Signals:
         data_reset (list): Emitted when the model is reset.
         word_added (WordModel): Emits new word when a new word is added
+        words_added (list): Emits the new words when several words are added at once
         word_updated (WordModel): Emits updated word when a word is updated
         word_deleted (WordModel): Emits guid of deleted word when a word is deleted
+        words_deleted (list): Emits the guids of the deleted words when several words are deleted
     """
 
     data_reset = Signal(list)
     word_added = Signal(WordModel)
+    words_added = Signal(list)
     word_updated = Signal(WordModel)
     word_deleted = Signal(str)
+    words_deleted = Signal(list)
     word_added_to_be_defined = Signal(WordModel)
     word_added_to_be_audio = Signal(WordModel)
     word_added_to_be_sync = Signal(WordModel)
     word_added_synced = Signal(WordModel)
+    word_added_anki_dup = Signal(WordModel)
+
+    # the status a word has while it waits for each stage
+    STAGE_STATUSES = {
+        "define": Status.TO_BE_DEFINED,
+        "audio": Status.TO_BE_AUDIO,
+        "sync": Status.TO_BE_SYNCED,
+    }
 
     def __init__(self):
         """
@@ -41,7 +71,7 @@ class WordsModel(QObject, metaclass=QSingleton):
         from persistent storage.
         """
         super().__init__()
-        self._words = []
+        self._index = WordIndex()
         self.settings = AppSettings()
         self.init_words_model()
 
@@ -53,7 +83,31 @@ class WordsModel(QObject, metaclass=QSingleton):
         Returns:
             list: The list of current rule sets.
         """
-        return self._words
+        return self._index.words()
+
+    def get_word(self, guid: str) -> Optional[WordModel]:
+        """
+        Returns the word with the guid.
+
+        Args:
+            guid (str): The guid of the word.
+
+        Returns:
+            Optional[WordModel]: The word, or None if there is no word with the guid.
+        """
+        return self._index.get(guid)
+
+    def count_words(self, status: Status) -> int:
+        """
+        Returns how many words have a status, without building the list of words.
+
+        Args:
+            status (Status): The status.
+
+        Returns:
+            int: The number of words.
+        """
+        return self._index.count(status)
 
     @property
     def undefined_words(self) -> List:
@@ -63,7 +117,7 @@ class WordsModel(QObject, metaclass=QSingleton):
         Returns:
             list: The list of current rule sets.
         """
-        return [word for word in self._words if word.status == Status.ADDED]
+        return self._index.words(Status.ADDED)
 
     @property
     def to_be_defined_words(self) -> List:
@@ -73,7 +127,7 @@ class WordsModel(QObject, metaclass=QSingleton):
         Returns:
             list: The list of current rule sets.
         """
-        return [word for word in self._words if word.status == Status.TO_BE_DEFINED]
+        return self._index.words(Status.TO_BE_DEFINED)
 
     @property
     def defined_words(self) -> List:
@@ -83,7 +137,7 @@ class WordsModel(QObject, metaclass=QSingleton):
         Returns:
             list: The list of current rule sets.
         """
-        return [word for word in self._words if word.status == Status.DEFINDED]
+        return self._index.words(Status.DEFINDED)
 
     @property
     def skipped_defined_words(self) -> List:
@@ -93,7 +147,7 @@ class WordsModel(QObject, metaclass=QSingleton):
         Returns:
             list: The list of current rule sets.
         """
-        return [word for word in self._words if word.status == Status.SKIPPED_DEFINED]
+        return self._index.words(Status.SKIPPED_DEFINED)
 
     @property
     def skipped_audio_words(self) -> List:
@@ -103,7 +157,7 @@ class WordsModel(QObject, metaclass=QSingleton):
         Returns:
             list: The list of current rule sets.
         """
-        return [word for word in self._words if word.status == Status.SKIPPED_AUDIO]
+        return self._index.words(Status.SKIPPED_AUDIO)
 
     @property
     def skipped_sync_error(self) -> List:
@@ -113,9 +167,7 @@ class WordsModel(QObject, metaclass=QSingleton):
         Returns:
             list: The list of current rule sets.
         """
-        return [
-            word for word in self._words if word.status == Status.SKIPPED_ANKI_ERROR
-        ]
+        return self._index.words(Status.SKIPPED_ANKI_ERROR)
 
     @property
     def skipped_sync_duplicates(self) -> List:
@@ -125,7 +177,7 @@ class WordsModel(QObject, metaclass=QSingleton):
         Returns:
             list: The list of current rule sets.
         """
-        return [word for word in self._words if word.status == Status.SKIPPED_ANKI_DUP]
+        return self._index.words(Status.SKIPPED_ANKI_DUP)
 
     @property
     def to_be_audio_words(self) -> List:
@@ -135,7 +187,7 @@ class WordsModel(QObject, metaclass=QSingleton):
         Returns:
             list: The list of current rule sets.
         """
-        return [word for word in self._words if word.status == Status.TO_BE_AUDIO]
+        return self._index.words(Status.TO_BE_AUDIO)
 
     @property
     def audio_error_words(self) -> List:
@@ -145,7 +197,7 @@ class WordsModel(QObject, metaclass=QSingleton):
         Returns:
             list: The list of current rule sets.
         """
-        return [word for word in self._words if word.status == Status.SKIPPED_AUDIO]
+        return self._index.words(Status.SKIPPED_AUDIO)
 
     @property
     def audio_words(self) -> List:
@@ -155,7 +207,7 @@ class WordsModel(QObject, metaclass=QSingleton):
         Returns:
             list: The list of current rule sets.
         """
-        return [word for word in self._words if word.status == Status.AUDIO]
+        return self._index.words(Status.AUDIO)
 
     @property
     def to_be_synced_words(self) -> List:
@@ -165,7 +217,7 @@ class WordsModel(QObject, metaclass=QSingleton):
         Returns:
             list: The list of current rule sets.
         """
-        return [word for word in self._words if word.status == Status.TO_BE_SYNCED]
+        return self._index.words(Status.TO_BE_SYNCED)
 
     @property
     def anki_duplicate_words(self) -> List:
@@ -175,7 +227,7 @@ class WordsModel(QObject, metaclass=QSingleton):
         Returns:
             list: The list of current rule sets.
         """
-        return [word for word in self._words if word.status == Status.SKIPPED_ANKI_DUP]
+        return self._index.words(Status.SKIPPED_ANKI_DUP)
 
     @property
     def anki_error_words(self) -> List:
@@ -185,9 +237,7 @@ class WordsModel(QObject, metaclass=QSingleton):
         Returns:
             list: The list of current rule sets.
         """
-        return [
-            word for word in self._words if word.status == Status.SKIPPED_ANKI_ERROR
-        ]
+        return self._index.words(Status.SKIPPED_ANKI_ERROR)
 
     @property
     def synced_words(self) -> List:
@@ -197,7 +247,7 @@ class WordsModel(QObject, metaclass=QSingleton):
         Returns:
             list: The list of current rule sets.
         """
-        return [word for word in self._words if word.status == Status.ANKI_SYNCED]
+        return self._index.words(Status.ANKI_SYNCED)
 
     @Slot(WordModel)
     def add_word(self, word: WordModel) -> None:
@@ -210,9 +260,38 @@ class WordsModel(QObject, metaclass=QSingleton):
         Returns:
             None: This function does not return a value.
         """
-        self._words.append(word)
+        self._index.put(word)
         self.word_added.emit(word)
 
+    @Slot(list)
+    def add_words(self, words: List[WordModel]) -> None:
+        """
+        Adds several words to the model and emits the words_added signal once.
+
+        Args:
+            words (List[WordModel]): The words to be added.
+
+        Returns:
+            None: This function does not return a value.
+        """
+        for word in words:
+            self._index.put(word)
+        if words:
+            self.words_added.emit(list(words))
+
+    def has_headword(self, text: str) -> bool:
+        """
+        Checks if the library already has a word with the same normalized headword.
+        Safe to call from any thread.
+
+        Args:
+            text (str): The word to check.
+
+        Returns:
+            bool: True if the word is already in the library.
+        """
+        return self._index.has_headword(text)
+
     @Slot(str)
     def delete_word(self, guid: str) -> None:
         """
@@ -225,8 +304,7 @@ class WordsModel(QObject, metaclass=QSingleton):
             None: This function does not return a value.
         """
         if guid:
-            words = [word for word in self.words if word.guid != guid]
-            self._words = words
+            self._index.remove(guid)
             self.word_deleted.emit(guid)
 
     @Slot(list)
@@ -240,31 +318,27 @@ class WordsModel(QObject, metaclass=QSingleton):
         Returns:
             None: This function does not return a value.
         """
-        words = []
+        for guid in guids or []:
+            self._index.remove(guid)
         if guids:
-            for word in self.words:
-                if word.guid in guids:
-                    continue
-                else:
-                    words.append(word)
-
-            self._words = words
+            self.words_deleted.emit(list(guids))
 
     @Slot()
     def remove_synced_words(self):
-        self._words = [
-            word for word in self._words if word.status != Status.ANKI_SYNCED
-        ]
+        removed = self._index.remove_status(Status.ANKI_SYNCED)
+        self.words_deleted.emit([word.guid for word in removed])
 
     @Slot()
     def delete_duplicates(self):
-        words = [word for word in self.words if word.status != Status.SKIPPED_ANKI_DUP]
-        self._words = words
+        removed = self._index.remove_status(Status.SKIPPED_ANKI_DUP)
+        self.words_deleted.emit([word.guid for word in removed])
 
     @Slot(str, WordModel)
     def update_word(self, guid: str, word: WordModel) -> None:
         """
-        Update the word in the words model. Emits updated_word signal
+        Update the word in the words model. Emits updated_word signal. Workers change
+        words in place, so the index is updated here with the word's new fields and
+        status.
 
         Args:
             guid (str): The guid of the rule set
@@ -273,17 +347,9 @@ class WordsModel(QObject, metaclass=QSingleton):
         Returns:
             None: This function does not return a value.
         """
-        if guid:
-            words = []
-
-            for saved_word in self._words:
-                if saved_word.guid != guid:
-                    words.append(saved_word)
-                elif saved_word.guid == guid:
-                    words.append(word)
-                    self.word_updated.emit(word)
-
-            self._words = words
+        if guid and guid in self._index:
+            self._index.put(word)
+            self.word_updated.emit(word)
 
     @Slot()
     def reset_model(self) -> None:
@@ -294,59 +360,240 @@ class WordsModel(QObject, metaclass=QSingleton):
         Returns:
             None: This function does not return a value.
         """
-        self.settings.begin_group("word-model")
-        self.settings.set_value("words-saved", [])
-        self.settings.end_group()
-        self._words = []
-        self.data_reset.emit(self._words)
+        self._index.clear()
+        self.save_scheduler.wait()
+        self.store.clear()
+        with self._snapshot_lock:
+            self._pending_rows = {}
+            self._snapshot = (self._snapshot or WordsSnapshot()).cleared()
+        self.data_reset.emit(self._index.words())
 
     @Slot()
     def save_words(self) -> None:
         """
-        Saves the words to persistent storage.
+        Schedules a save of the words that changed. Saves requested close together are
+        merged and written on a background thread.
 
         Returns:
             None: This function does not return a value.
         """
-        self.settings.begin_group("word-model")
-        self.settings.set_value("words-saved", [asdict(word) for word in self._words])
-        self.settings.end_group()
+        self.save_scheduler.request()
+
+    @Slot()
+    def flush_words(self) -> None:
+        """
+        Writes any scheduled save now and waits for it to finish.
+
+        Returns:
+            None: This function does not return a value.
+        """
+        self.save_scheduler.flush(wait=True)
+
+    def collect_changes(self):
+        """
+        Takes a snapshot of the words changed and removed since the last save and
+        queues them for the next WordsSnapshot.
+
+        Returns:
+            Optional[tuple]: The changed rows and removed guids, or None if nothing changed.
+        """
+        changed, removed = self._index.take_changes()
+        if not changed and not removed:
+            return None
+        rows = [self.to_row(word) for word in changed]
+        with self._snapshot_lock:
+            # applied when the snapshot is next read
+            self._pending_rows.update((row["guid"], row) for row in rows)
+            self._pending_rows.update((guid, None) for guid in removed)
+        return rows, removed
+
+    @property
+    def snapshot(self) -> WordsSnapshot:
+        """
+        Copy of the words as of the last save, built from the words database the first
+        time it is read. The rows saved since the last read are applied on the reading
+        thread, so a save never waits for the snapshot to be rebuilt. Safe to read from
+        any thread.
+
+        Returns:
+            WordsSnapshot: The snapshot.
+        """
+        with self._snapshot_build_lock:
+            with self._snapshot_lock:
+                current, pending = self._snapshot, self._pending_rows
+                self._pending_rows = {}
+            snapshot = current
+            if snapshot is None:
+                snapshot = WordsSnapshot().apply(self.store.load(), [])
+            if pending:
+                snapshot = snapshot.apply(
+                    [row for row in pending.values() if row is not None],
+                    [guid for guid, row in pending.items() if row is None],
+                )
+            with self._snapshot_lock:
+                # a reset while building drops the rows it was built from
+                if self._snapshot is current:
+                    self._snapshot = snapshot
+                return self._snapshot
+
+    @staticmethod
+    def to_row(word: WordModel) -> dict:
+        """
+        Converts a word to a storage row.
+
+        Args:
+            word (WordModel): The word.
+
+        Returns:
+            dict: The word's fields, with the status stored by name.
+        """
+        row = asdict(word)
+        row["status"] = word.status.name
+        return row
+
+    @staticmethod
+    def from_row(row: dict) -> WordModel:
+        """
+        Converts a storage row to a word.
+
+        Args:
+            row (dict): The stored fields.
+
+        Returns:
+            WordModel: The word.
+        """
+        return WordModel(**dict(row, status=Status[row["status"]]))
 
     def init_words_model(self) -> None:
         """
-        Initializes the word model by loading saved user words from persistent storage.
-        If no words are found, an empty list is used for user words.
+        Initializes the word model over the words database. Stored words are not read
+        here; the index loads each status the first time it is used.
+
+        Words saved by older versions under the `word-model/words-saved` setting are
+        moved to the words database the first time the app starts. Results of runs
+        that were cut short are then recovered from the job journal.
         """
-        self.settings.begin_group("word-model")
-        words = self.settings.get_value("words-saved", [])
+        self.store = WordStore()
+        self.save_scheduler = SaveScheduler(self.collect_changes, self.store.save)
+        self.migrate_saved_words()
+        self._index.set_source(self.load_stored_words, self.stored_status)
+        self._snapshot = None
+        self._snapshot_lock = threading.Lock()
+        self._snapshot_build_lock = threading.Lock()
+        self._pending_rows = {}
+        self.journal = JobJournal()
+        self.recover_jobs()
 
-        for word in words:
+    def load_stored_words(self, statuses: List[Status]) -> List[WordModel]:
+        """
+        Reads the stored words with some statuses. Used by the index to load a status
+        on first use.
+
+        Args:
+            statuses (List[Status]): The statuses.
+
+        Returns:
+            List[WordModel]: The words, in the order they were first stored.
+        """
+        rows = self.store.load([status.name for status in statuses])
+        return [self.from_row(row) for row in rows]
+
+    def stored_status(self, guid: str) -> Optional[Status]:
+        """
+        Reads the stored status of a word. Used by the index to find the status to
+        load for a guid.
+
+        Args:
+            guid (str): The guid of the word.
 
-            saved_word = WordModel(**word)
-            self._words.append(saved_word)
+        Returns:
+            Optional[Status]: The status, or None if the word isn't stored.
+        """
+        name = self.store.status_of(guid)
+        return Status[name] if name else None
+
+    def recover_jobs(self) -> None:
+        """
+        Applies the word results recorded in the job journal that never reached the
+        words database, saves them and compacts the journal.
+
+        A result is applied only while the word still waits for the stage that produced
+        it, so words the user has moved on since are left alone and no finished word is
+        queued again. The interrupted stages that still have words waiting are kept in
+        `interrupted_stages`, so they can be started again, and the words they had
+        started without a result in `in_flight`.
+
+        Returns:
+            None: This function does not return a value.
+        """
+        recovery = self.journal.recover()
+        recovered = 0
+        for stage, row in recovery.results:
+            word = self._index.get(row["guid"])
+            if word is None or word.status != self.STAGE_STATUSES.get(stage):
+                continue
+            self._index.put(self.from_row(row))
+            recovered += 1
+        if recovered:
+            self.flush_words()
+            self.logging(f"Recovered {recovered} words from the job journal")
+        for path in recovery.removed_files:
+            self.logging(f"Removed partly written file {path}")
+        self.interrupted_stages = {}
+        self.in_flight = recovery.in_flight
+        for stage, options in recovery.interrupted.items():
+            if self._index.count(self.STAGE_STATUSES[stage]):
+                self.interrupted_stages[stage] = options
+            else:
+                # nothing left to resume
+                self.journal.run_finished(stage)
+        self.journal.compact()
+
+    def take_in_flight(self, stage: str) -> List[str]:
+        """
+        Returns and forgets the guids a cut short run of a stage had started without
+        recording a result, so the next run can check them first.
+
+        Args:
+            stage (str): The stage.
+
+        Returns:
+            List[str]: The guids.
+        """
+        return self.in_flight.pop(stage, [])
+
+    def migrate_saved_words(self) -> None:
+        """
+        Copies the words from the old `word-model/words-saved` setting into the words
+        database once, then clears the setting.
+
+        Returns:
+            None: This function does not return a value.
+        """
+        self.settings.begin_group("word-model")
+        words = self.settings.get_value("words-saved", [])
+        if words and self.store.is_empty():
+            rows = [self.to_row(WordModel(**word)) for word in words]
+            self.store.save(rows)
+            print(f"Moved {len(rows)} saved words to {self.store.db_path}")
+        if words:
+            self.settings.set_value("words-saved", [])
         self.settings.end_group()
 
     @Slot(str, Status)
     def update_status(self, guid, status):
-        updated_status = []
-        for word in self._words:
-            if word.guid == guid:
-                updated_word = word
-                match status:
-                    case Status.TO_BE_DEFINED:
-                        updated_word.status = Status.TO_BE_DEFINED
-                        self.word_added_to_be_defined.emit(word)
-                    case Status.TO_BE_AUDIO:
-                        updated_word.status = Status.TO_BE_AUDIO
-                        self.word_added_to_be_audio.emit(word)
-                    case Status.TO_BE_SYNCED:
-                        updated_word.status = Status.TO_BE_SYNCED
-                        self.word_added_to_be_sync.emit(word)
-                    case Status.ANKI_SYNCED:
-                        updated_word.status = Status.ANKI_SYNCED
-                        self.word_added_synced.emit(word)
-                updated_status.append(updated_word)
-            else:
-                updated_status.append(word)
-
-        self._words = updated_status
+        word = self._index.get(guid)
+        if word is None:
+            return
+        self._index.set_status(word, status)
+        match status:
+            case Status.TO_BE_DEFINED:
+                self.word_added_to_be_defined.emit(word)
+            case Status.TO_BE_AUDIO:
+                self.word_added_to_be_audio.emit(word)
+            case Status.TO_BE_SYNCED:
+                self.word_added_to_be_sync.emit(word)
+            case Status.ANKI_SYNCED:
+                self.word_added_synced.emit(word)
+            case Status.SKIPPED_ANKI_DUP:
+                self.word_added_anki_dup.emit(word)
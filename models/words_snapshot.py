@@ -0,0 +1,162 @@
+from bisect import bisect_right
+from heapq import merge
+from typing import Dict, Iterable, List, Optional, Tuple
+
+
+class WordsSnapshot:
+    """
+    Immutable copy of the words, built on the GUI thread and shared with other threads.
+
+    Each word is a storage row (see `WordsModel.to_row`). Words get a sequence number
+    the first time they appear, which keeps their position stable across snapshots and
+    is used as the pagination cursor. Every snapshot has a version, and each status
+    remembers the last version that changed one of its words, so readers can tell
+    whether the words of a status changed without comparing them.
+
+    A snapshot is never modified after it is built; `apply` and `cleared` return a new
+    one.
+
+    Attributes:
+        version (int): Increases every time a new snapshot is built.
+    """
+
+    def __init__(
+        self,
+        version: int = 0,
+        rows: Optional[Dict[str, dict]] = None,
+        seq_of: Optional[Dict[str, int]] = None,
+        next_seq: int = 1,
+        status_versions: Optional[Dict[str, int]] = None,
+    ):
+        self.version = version
+        self._rows = rows or {}
+        self._seq_of = seq_of or {}
+        self._next_seq = next_seq
+        self._status_versions = status_versions or {}
+
+        # rows are kept in sequence order, so the per status lists are sorted too
+        self._seqs: List[int] = []
+        self._by_status: Dict[str, Tuple[List[int], List[dict]]] = {}
+        for guid, row in self._rows.items():
+            seq = self._seq_of[guid]
+            self._seqs.append(seq)
+            seqs, status_rows = self._by_status.setdefault(row["status"], ([], []))
+            seqs.append(seq)
+            status_rows.append(row)
+        self._all_rows = list(self._rows.values())
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    def apply(self, changed: Iterable[dict], removed: Iterable[str]) -> "WordsSnapshot":
+        """
+        Builds the next snapshot from the changed rows and the removed guids.
+
+        Args:
+            changed (Iterable[dict]): The rows of the new and changed words.
+            removed (Iterable[str]): The guids of the removed words.
+
+        Returns:
+            WordsSnapshot: The new snapshot.
+        """
+        version = self.version + 1
+        rows = dict(self._rows)
+        seq_of = dict(self._seq_of)
+        next_seq = self._next_seq
+        status_versions = dict(self._status_versions)
+
+        for guid in removed:
+            old = rows.pop(guid, None)
+            if old is not None:
+                seq_of.pop(guid)
+                status_versions[old["status"]] = version
+        for row in changed:
+            old = rows.get(row["guid"])
+            if old is not None:
+                status_versions[old["status"]] = version
+            else:
+                seq_of[row["guid"]] = next_seq
+                next_seq += 1
+            rows[row["guid"]] = row
+            status_versions[row["status"]] = version
+
+        return WordsSnapshot(version, rows, seq_of, next_seq, status_versions)
+
+    def cleared(self) -> "WordsSnapshot":
+        """
+        Builds an empty snapshot that follows this one.
+
+        Returns:
+            WordsSnapshot: The new snapshot.
+        """
+        version = self.version + 1
+        status_versions = dict(self._status_versions)
+        for status in self._by_status:
+            status_versions[status] = version
+        return WordsSnapshot(version, {}, {}, self._next_seq, status_versions)
+
+    def status_version(self, statuses: Optional[List[str]] = None) -> int:
+        """
+        Returns the last version that changed the words of the statuses.
+
+        Args:
+            statuses (List[str], optional): Status names. Defaults to every status.
+
+        Returns:
+            int: The version.
+        """
+        if not statuses:
+            return self.version
+        return max(self._status_versions.get(status, 0) for status in statuses)
+
+    def count(self, statuses: Optional[List[str]] = None) -> int:
+        """
+        Counts the words with one of the statuses.
+
+        Args:
+            statuses (List[str], optional): Status names. Defaults to every status.
+
+        Returns:
+            int: The number of words.
+        """
+        if not statuses:
+            return len(self._rows)
+        return sum(len(self._by_status.get(status, ([], []))[0]) for status in statuses)
+
+    def page(
+        self, statuses: Optional[List[str]] = None, after: int = 0, limit: int = 100
+    ) -> Tuple[List[dict], Optional[int]]:
+        """
+        Returns the words after a cursor, in the order they were added.
+
+        Args:
+            statuses (List[str], optional): Status names. Defaults to every status.
+            after (int, optional): Cursor returned by the previous page. Defaults to 0.
+            limit (int, optional): Maximum number of words. Defaults to 100.
+
+        Returns:
+            Tuple[List[dict], Optional[int]]: The rows and the cursor of the next page,
+                or None if this is the last page.
+        """
+        if statuses:
+            lists = [
+                self._by_status[status]
+                for status in statuses
+                if status in self._by_status
+            ]
+        else:
+            lists = [(self._seqs, self._all_rows)]
+
+        streams = [self._stream(seqs, rows, after) for seqs, rows in lists]
+
+        page = []
+        for seq, row in merge(*streams, key=lambda item: item[0]):
+            if len(page) == limit:
+                return [row for _, row in page], page[-1][0]
+            page.append((seq, row))
+        return [row for _, row in page], None
+
+    @staticmethod
+    def _stream(seqs: List[int], rows: List[dict], after: int):
+        for i in range(bisect_right(seqs, after), len(seqs)):
+            yield seqs[i], rows[i]
@@ -0,0 +1,44 @@
+import os
+from typing import Optional
+
+from PySide6.QtCore import QResource
+
+RCC_PATH = os.path.join(os.path.dirname(__file__), "resources.rcc")
+
+_loaded = None
+
+
+def load_resources(mode: Optional[str] = None) -> str:
+    """
+    Registers the application's icons and images under ":/".
+
+    The compiled `resources.rcc` bundle (see `python -m resources.build`) is preferred.
+    Qt maps it from disk instead of keeping a copy of every image in the Python heap
+    like importing `resources_rc` does. If the bundle hasn't been built, or can't be
+    registered, the generated module is imported instead. Only the first call does
+    anything.
+
+    Args:
+        mode (str, optional): "auto", "rcc" or "module". Defaults to the
+            ENGLISHWORDS_RESOURCES environment variable, or "auto".
+
+    Returns:
+        str: How the resources were loaded, "rcc" or "module".
+    """
+    global _loaded
+    if _loaded:
+        return _loaded
+
+    mode = mode or os.environ.get("ENGLISHWORDS_RESOURCES", "auto")
+    if mode in ["auto", "rcc"] and os.path.isfile(RCC_PATH):
+        if QResource.registerResource(RCC_PATH):
+            _loaded = "rcc"
+            return _loaded
+        print(f"Could not register {RCC_PATH}. Using resources_rc instead.")
+    elif mode == "rcc":
+        print(f"{RCC_PATH} not found. Run python -m resources.build first.")
+
+    from . import resources_rc  # noqa: F401
+
+    _loaded = "module"
+    return _loaded
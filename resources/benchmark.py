@@ -0,0 +1,108 @@
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+from . import RCC_PATH
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Runs in a fresh interpreter so each sample pays the full cost of loading resources.
+CHILD = """
+import json, os, sys, time
+
+def rss_kb():
+    try:
+        with open("/proc/self/statm") as statm:
+            return int(statm.read().split()[1]) * os.sysconf("SC_PAGE_SIZE") // 1024
+    except OSError:
+        import resource
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return peak // 1024 if sys.platform == "darwin" else peak
+
+from PySide6.QtCore import QDirIterator, QFile, QIODevice
+
+rss_before = rss_kb()
+start = time.perf_counter()
+from resources import load_resources
+mode = load_resources(sys.argv[1])
+loaded = time.perf_counter()
+
+size = 0
+files = QDirIterator(":/", QDirIterator.IteratorFlag.Subdirectories)
+while files.hasNext():
+    path = files.next()
+    file = QFile(path)
+    if file.open(QIODevice.OpenModeFlag.ReadOnly):
+        size += len(file.readAll())
+        file.close()
+read = time.perf_counter()
+
+print(json.dumps({
+    "mode": mode,
+    "load_ms": (loaded - start) * 1000,
+    "read_ms": (read - loaded) * 1000,
+    "rss_kb": rss_kb() - rss_before,
+    "bytes": size,
+}))
+"""
+
+
+def sample(mode: str) -> dict:
+    """
+    Loads the resources once in a new interpreter.
+
+    Args:
+        mode (str): "module" or "rcc".
+
+    Returns:
+        dict: The load and read times in ms, the RSS growth in KB and the bytes read.
+    """
+    env = dict(os.environ)
+    env.pop("ENGLISHWORDS_RESOURCES", None)
+    result = subprocess.run(
+        [sys.executable, "-c", CHILD, mode],
+        capture_output=True,
+        text=True,
+        check=True,
+        cwd=ROOT_DIR,
+        env=env,
+    )
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def main(argv=None) -> None:
+    parser = argparse.ArgumentParser(
+        prog="python -m resources.benchmark",
+        description="Compare loading resources from resources_rc.py and resources.rcc.",
+    )
+    parser.add_argument(
+        "--runs", type=int, default=10, help="Samples per mode. Defaults to 10."
+    )
+    args = parser.parse_args(argv)
+
+    modes = ["module"]
+    if os.path.isfile(RCC_PATH):
+        modes.append("rcc")
+    else:
+        print(f"{RCC_PATH} not found, run python -m resources.build to compare.")
+
+    print(f"{'mode':<8} {'load ms':>9} {'read ms':>9} {'rss KB':>9} {'bytes':>10}")
+    for mode in modes:
+        samples = [sample(mode) for _ in range(max(1, args.runs))]
+        if any(s["mode"] != mode for s in samples):
+            print(f"{mode}: fell back to {samples[0]['mode']}")
+            continue
+        print(
+            f"{mode:<8} "
+            f"{statistics.median(s['load_ms'] for s in samples):>9.1f} "
+            f"{statistics.median(s['read_ms'] for s in samples):>9.1f} "
+            f"{statistics.median(s['rss_kb'] for s in samples):>9.0f} "
+            f"{samples[0]['bytes']:>10}"
+        )
+
+
+if __name__ == "__main__":
+    main()
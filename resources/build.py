@@ -0,0 +1,88 @@
+import argparse
+import os
+import shutil
+import subprocess
+import sys
+from typing import List, Tuple
+
+from . import RCC_PATH
+
+RESOURCES_DIR = os.path.dirname(os.path.abspath(__file__))
+QRC_PATH = os.path.join(RESOURCES_DIR, "resources.qrc")
+MODULE_PATH = os.path.join(RESOURCES_DIR, "resources_rc.py")
+
+
+def find_rcc() -> Tuple[List[str], List[str]]:
+    """
+    Finds the resource compiler, preferring the pyside6-rcc wrapper.
+
+    Returns:
+        Tuple[List[str], List[str]]: The command to run and the extra arguments it
+            needs to generate Python code.
+
+    Raises:
+        FileNotFoundError: If no resource compiler is installed.
+    """
+    wrapper = shutil.which("pyside6-rcc")
+    if wrapper:
+        return [wrapper], []
+
+    import PySide6
+
+    package_dir = os.path.dirname(PySide6.__file__)
+    for candidate in [
+        os.path.join(package_dir, "Qt", "libexec", "rcc"),
+        os.path.join(package_dir, "rcc"),
+        os.path.join(package_dir, "rcc.exe"),
+    ]:
+        if os.path.isfile(candidate):
+            return [candidate], ["-g", "python"]
+    raise FileNotFoundError("pyside6-rcc not found. Is PySide6 installed?")
+
+
+def build(python_module: bool = False) -> None:
+    """
+    Compiles resources.qrc into the binary resources.rcc bundle, and optionally
+    regenerates the resources_rc.py module as well.
+
+    Args:
+        python_module (bool, optional): Also regenerate resources_rc.py.
+            Defaults to False.
+
+    Returns:
+        None: This function does not return a value.
+    """
+    rcc, python_args = find_rcc()
+    subprocess.run(
+        rcc + ["--binary", QRC_PATH, "-o", RCC_PATH], check=True, cwd=RESOURCES_DIR
+    )
+    print(f"Wrote {RCC_PATH} ({os.path.getsize(RCC_PATH) / 1024:.0f} KB)")
+    if python_module:
+        subprocess.run(
+            rcc + python_args + [QRC_PATH, "-o", MODULE_PATH],
+            check=True,
+            cwd=RESOURCES_DIR,
+        )
+        print(f"Wrote {MODULE_PATH} ({os.path.getsize(MODULE_PATH) / 1024:.0f} KB)")
+
+
+def main(argv=None) -> None:
+    parser = argparse.ArgumentParser(
+        prog="python -m resources.build",
+        description="Compile resources.qrc into the binary resources.rcc bundle.",
+    )
+    parser.add_argument(
+        "--python",
+        action="store_true",
+        help="Also regenerate the resources_rc.py fallback module.",
+    )
+    args = parser.parse_args(argv)
+    try:
+        build(args.python)
+    except (FileNotFoundError, subprocess.CalledProcessError) as e:
+        print(f"Error building resources: {e}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
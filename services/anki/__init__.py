@@ -0,0 +1,8 @@
+from .anki_connect import (
+    DUPLICATE_ERROR,
+    AnkiConnect,
+    AnkiConnectError,
+    AnkiUnreachableError,
+)
+
+__all__ = ["AnkiConnect", "AnkiConnectError", "AnkiUnreachableError", "DUPLICATE_ERROR"]
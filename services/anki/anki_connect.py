@@ -0,0 +1,210 @@
+import re
+from typing import Any, Dict, List
+
+import requests
+import urllib3
+
+from services.network import HttpClient
+
+DUPLICATE_ERROR = "cannot create note because it is a duplicate"
+
+
+class AnkiConnectError(Exception):
+    """
+    Raised when AnkiConnect answers a request with an error.
+    """
+
+
+class AnkiUnreachableError(requests.exceptions.ConnectionError):
+    """
+    Raised when a request never reached AnkiConnect, because the connection was
+    refused or couldn't be made in time. Sending the request again is safe.
+    """
+
+
+class AnkiConnect:
+    """
+    Small client for the AnkiConnect add-on API.
+
+    Attributes:
+        url (str): Address AnkiConnect listens on.
+        timeout (int): Seconds to wait for a response.
+    """
+
+    VERSION = 6
+
+    def __init__(self, url: str = "http://127.0.0.1:8765/", timeout: int = 5):
+        """
+        Initializes the client.
+
+        Args:
+            url (str, optional): Address AnkiConnect listens on. Defaults to "http://127.0.0.1:8765/".
+            timeout (int, optional): Seconds to wait for a response. Defaults to 5.
+        """
+        self.url = url
+        self.timeout = timeout
+
+    @staticmethod
+    def action(action: str, **params) -> Dict[str, Any]:
+        """
+        Builds an AnkiConnect request body.
+
+        Args:
+            action (str): The AnkiConnect action name.
+            **params: The action's parameters.
+
+        Returns:
+            dict: The request body.
+        """
+        body = {"action": action, "version": AnkiConnect.VERSION}
+        if params:
+            body["params"] = params
+        return body
+
+    @staticmethod
+    def build_note(word, deck_name: str, model_name: str) -> Dict[str, Any]:
+        """
+        Builds the AnkiConnect note for a word.
+
+        Args:
+            word (WordModel): The word to export.
+            deck_name (str): The deck the note is added to.
+            model_name (str): The note type used for the note.
+
+        Returns:
+            dict: The note, as used by `addNote` and `canAddNotes`.
+        """
+        return {
+            "deckName": f"{deck_name}",
+            "modelName": f"{model_name}",
+            "fields": {
+                "Word": f"{word.word}",
+                "Definition": f"{word.definition}",
+                "Audio": f"{word.audio}",
+                "Synonyms": f"{word.synonyms}",
+                "Example": f"{word.example}",
+            },
+            "options": {
+                "allowDuplicate": False,
+                "duplicateScope": "deck",
+                "duplicateScopeOptions": {
+                    "deckName": "English Words",
+                    "checkChildren": True,
+                    "checkAllModels": True,
+                },
+            },
+        }
+
+    @staticmethod
+    def note_query(note: Dict[str, Any]) -> str:
+        """
+        Builds the search that finds the notes matching a note's first field in its deck.
+
+        Args:
+            note (dict): A note built with `build_note`.
+
+        Returns:
+            str: The Anki search query.
+        """
+        field, value = next(iter(note["fields"].items()))
+        deck = re.sub(r'([\\"*_])', r"\\\1", note["deckName"])
+        value = re.sub(r'([\\"*_:])', r"\\\1", value)
+        return f'deck:"{deck}" "{field}:{value}"'
+
+    def notes_exist(self, notes: List[Dict[str, Any]]) -> List[bool]:
+        """
+        Checks which notes are already in Anki, by their first field in their deck.
+
+        Args:
+            notes (List[dict]): Notes built with `build_note`.
+
+        Returns:
+            List[bool]: True for each note Anki has, in order.
+
+        Raises:
+            AnkiConnectError: If a search fails.
+            requests.exceptions.RequestException: If AnkiConnect can't be reached.
+        """
+        if not notes:
+            return []
+        actions = [
+            self.action("findNotes", query=self.note_query(note)) for note in notes
+        ]
+        exists = []
+        for response in self.multi(actions):
+            if response["error"] is not None:
+                raise AnkiConnectError(response["error"])
+            exists.append(bool(response["result"]))
+        return exists
+
+    def post(self, body: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Sends a request body to AnkiConnect.
+
+        Args:
+            body (dict): The request body.
+
+        Returns:
+            dict: The decoded response, with `result` and `error` keys.
+
+        Raises:
+            AnkiUnreachableError: If the request never reached AnkiConnect.
+            requests.exceptions.RequestException: If the request failed after it may
+                have reached AnkiConnect, e.g. a read timeout.
+        """
+        try:
+            response = HttpClient().post(self.url, json=body, timeout=self.timeout)
+        except requests.exceptions.ConnectionError as e:
+            reason = getattr(e.args[0], "reason", None) if e.args else None
+            if isinstance(e, requests.exceptions.ConnectTimeout) or isinstance(
+                reason, urllib3.exceptions.ConnectTimeoutError
+            ):
+                raise AnkiUnreachableError(*e.args, request=e.request) from e
+            raise
+        return response.json()
+
+    def invoke(self, action: str, **params) -> Any:
+        """
+        Runs a single AnkiConnect action.
+
+        Args:
+            action (str): The AnkiConnect action name.
+            **params: The action's parameters.
+
+        Returns:
+            Any: The action's result.
+
+        Raises:
+            AnkiConnectError: If AnkiConnect answers with an error.
+            requests.exceptions.RequestException: If AnkiConnect can't be reached.
+        """
+        response = self.post(self.action(action, **params))
+        if response.get("error") is not None:
+            raise AnkiConnectError(response["error"])
+        return response.get("result")
+
+    def multi(self, actions: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Runs several actions in one request using the `multi` action.
+
+        Each action gets its own result, so one failing note doesn't fail the others.
+
+        Args:
+            actions (List[dict]): Request bodies built with `action`.
+
+        Returns:
+            List[dict]: One `{"result": ..., "error": ...}` per action, in order.
+
+        Raises:
+            AnkiConnectError: If the `multi` request itself fails.
+            requests.exceptions.RequestException: If AnkiConnect can't be reached.
+        """
+        results = self.invoke("multi", actions=actions)
+        return [
+            (
+                result
+                if isinstance(result, dict) and "error" in result
+                else {"result": result, "error": None}
+            )
+            for result in results
+        ]
@@ -0,0 +1,4 @@
+from .audio_cache import AudioCache
+from .response_cache import ResponseCache
+
+__all__ = ["AudioCache", "ResponseCache"]
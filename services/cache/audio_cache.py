@@ -0,0 +1,207 @@
+import hashlib
+import os
+import shutil
+import sqlite3
+import threading
+import time
+from typing import Optional
+
+from PySide6.QtCore import QObject, Signal
+
+from base import QSingleton
+from utils.files import PathManager
+
+
+class AudioCache(QObject, metaclass=QSingleton):
+    """
+    Content-addressed cache of synthesized audio stored under the app data directory.
+
+    Entries are keyed by a hash of the text and the voice settings, so the same
+    pronunciation is only ever synthesized once. Cached files are hard linked (or
+    copied when linking isn't possible) into the destination folder. Once the cache
+    grows past its size limit the least recently used files are evicted.
+
+    Attributes:
+        cache_dir (str): Folder holding the cached audio files and their index.
+        max_bytes (int): Maximum total size of the cached files.
+        hits (int): Number of syntheses answered from the cache in this session.
+        misses (int): Number of syntheses that had to call the API in this session.
+
+    Signals:
+        stats_changed (Signal[int, int]): Emitted with the hit and miss counts whenever they change.
+    """
+
+    stats_changed = Signal(int, int)
+
+    def __init__(
+        self, cache_dir: Optional[str] = None, max_bytes: int = 500 * 1024 * 1024
+    ):
+        """
+        Opens (and creates if needed) the cache folder and its index.
+
+        Args:
+            cache_dir (str, optional): Cache folder. Defaults to the app data directory.
+            max_bytes (int, optional): Maximum total size of the cache. Defaults to 500 MB.
+        """
+        super().__init__()
+        self.cache_dir = cache_dir or PathManager.app_data_path("audio-cache")
+        PathManager.path_exists(self.cache_dir, True)
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(
+            os.path.join(self.cache_dir, "index.db"), check_same_thread=False
+        )
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS audio (
+                key TEXT PRIMARY KEY,
+                size INTEGER NOT NULL,
+                accessed REAL NOT NULL
+            )
+            """
+        )
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS audio_accessed ON audio (accessed)"
+        )
+        self._conn.commit()
+        self._size = self._conn.execute(
+            "SELECT COALESCE(SUM(size), 0) FROM audio"
+        ).fetchone()[0]
+
+    @staticmethod
+    def key(text: str, language_code: str, voice: str, audio_encoding: str) -> str:
+        """
+        Builds the cache key for a synthesis request.
+
+        Args:
+            text (str): The synthesized text.
+            language_code (str): The voice language.
+            voice (str): The voice name or gender.
+            audio_encoding (str): The audio encoding.
+
+        Returns:
+            str: The hex digest identifying the audio.
+        """
+        content = "\0".join([text, language_code, voice, audio_encoding])
+        return hashlib.sha256(content.encode("utf-8")).hexdigest()
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.cache_dir, key[:2], key)
+
+    def _emit_stats(self) -> None:
+        self.stats_changed.emit(self.hits, self.misses)
+
+    def place(self, key: str, destination: str) -> bool:
+        """
+        Links or copies the cached audio for a key to the destination path.
+
+        Args:
+            key (str): The cache key.
+            destination (str): Where the audio should be placed.
+
+        Returns:
+            bool: True if the audio was cached and placed, False on a miss.
+        """
+        path = self._path(key)
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT 1 FROM audio WHERE key = ?", (key,)
+            ).fetchone()
+            if row and os.path.isfile(path):
+                self._conn.execute(
+                    "UPDATE audio SET accessed = ? WHERE key = ?", (time.time(), key)
+                )
+                self._conn.commit()
+            else:
+                self.misses += 1
+                row = None
+        if not row:
+            self._emit_stats()
+            return False
+
+        try:
+            os.link(path, destination)
+        except OSError:
+            temp_path = destination + PathManager.PART_SUFFIX
+            try:
+                shutil.copyfile(path, temp_path)
+                os.replace(temp_path, destination)
+            except OSError as e:
+                print(f"Could not copy cached audio {path}: {e}")
+                with self._lock:
+                    self.misses += 1
+                self._emit_stats()
+                return False
+        with self._lock:
+            self.hits += 1
+        self._emit_stats()
+        return True
+
+    def put(self, key: str, content: bytes) -> None:
+        """
+        Stores audio in the cache and evicts the least recently used files if the
+        cache is over its size limit.
+
+        Args:
+            key (str): The cache key.
+            content (bytes): The encoded audio.
+
+        Returns:
+            None: This function does not return a value.
+        """
+        path = self._path(key)
+        PathManager.path_exists(os.path.dirname(path), True)
+        tmp_path = f"{path}.{threading.get_ident()}.tmp"
+        with open(tmp_path, "wb") as out:
+            out.write(content)
+        os.replace(tmp_path, path)
+
+        with self._lock:
+            old = self._conn.execute(
+                "SELECT size FROM audio WHERE key = ?", (key,)
+            ).fetchone()
+            self._conn.execute(
+                "INSERT OR REPLACE INTO audio (key, size, accessed) VALUES (?, ?, ?)",
+                (key, len(content), time.time()),
+            )
+            self._size += len(content) - (old[0] if old else 0)
+            evicted = []
+            if self._size > self.max_bytes:
+                for evict_key, size in self._conn.execute(
+                    "SELECT key, size FROM audio WHERE key != ? ORDER BY accessed ASC",
+                    (key,),
+                ).fetchall():
+                    if self._size <= self.max_bytes:
+                        break
+                    evicted.append(evict_key)
+                    self._size -= size
+                self._conn.executemany(
+                    "DELETE FROM audio WHERE key = ?", [(k,) for k in evicted]
+                )
+            self._conn.commit()
+
+        for evict_key in evicted:
+            try:
+                os.remove(self._path(evict_key))
+            except OSError:
+                pass
+
+    def clear(self) -> None:
+        """
+        Removes every cached audio file.
+
+        Returns:
+            None: This function does not return a value.
+        """
+        with self._lock:
+            keys = [row[0] for row in self._conn.execute("SELECT key FROM audio")]
+            self._conn.execute("DELETE FROM audio")
+            self._conn.commit()
+            self._size = 0
+        for key in keys:
+            try:
+                os.remove(self._path(key))
+            except OSError:
+                pass
@@ -0,0 +1,161 @@
+import sqlite3
+import threading
+import time
+from typing import Optional
+
+from PySide6.QtCore import QObject, Signal
+
+from base import QSingleton
+from utils.files import PathManager
+from utils.text import normalize_headword
+
+
+class ResponseCache(QObject, metaclass=QSingleton):
+    """
+    Persistent cache of dictionary API responses stored in SQLite under the app data
+    directory. Entries are keyed by backend and normalized headword, expire after a TTL
+    and the least recently used entries are evicted once the cache is full.
+
+    The cache is shared by the lookup threads and their prefetch pools, so every access
+    is serialized with a lock.
+
+    Attributes:
+        db_path (str): Location of the SQLite database.
+        ttl_seconds (int): Seconds before a cached response is considered stale.
+        max_entries (int): Maximum number of responses kept in the cache.
+        hits (int): Number of lookups answered from the cache in this session.
+        misses (int): Number of lookups that had to go to the network in this session.
+
+    Signals:
+        stats_changed (Signal[int, int]): Emitted with the hit and miss counts whenever they change.
+    """
+
+    stats_changed = Signal(int, int)
+
+    def __init__(
+        self,
+        db_path: Optional[str] = None,
+        ttl_seconds: int = 30 * 24 * 60 * 60,
+        max_entries: int = 5000,
+    ):
+        """
+        Opens (and creates if needed) the cache database.
+
+        Args:
+            db_path (str, optional): Location of the database. Defaults to the app data directory.
+            ttl_seconds (int, optional): Seconds before an entry expires. Defaults to 30 days.
+            max_entries (int, optional): Maximum number of entries kept. Defaults to 5000.
+        """
+        super().__init__()
+        self.db_path = db_path or PathManager.app_data_path("response-cache.db")
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.db_path, check_same_thread=False)
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS responses (
+                backend TEXT NOT NULL,
+                headword TEXT NOT NULL,
+                body TEXT NOT NULL,
+                created REAL NOT NULL,
+                accessed REAL NOT NULL,
+                PRIMARY KEY (backend, headword)
+            )
+            """
+        )
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS responses_accessed ON responses (accessed)"
+        )
+        self._conn.commit()
+        self._size = self._conn.execute("SELECT COUNT(*) FROM responses").fetchone()[0]
+
+    def get(self, backend: str, word: str) -> Optional[str]:
+        """
+        Returns the cached response body for a word, or None on a miss or expired entry.
+
+        Args:
+            backend (str): Name of the dictionary backend.
+            word (str): The word being looked up.
+
+        Returns:
+            Optional[str]: The cached response body.
+        """
+        headword = normalize_headword(word)
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT body, created FROM responses WHERE backend = ? AND headword = ?",
+                (backend, headword),
+            ).fetchone()
+            if row and now - row[1] <= self.ttl_seconds:
+                self._conn.execute(
+                    "UPDATE responses SET accessed = ? WHERE backend = ? AND headword = ?",
+                    (now, backend, headword),
+                )
+                self._conn.commit()
+                self.hits += 1
+                body = row[0]
+            else:
+                if row:
+                    self._conn.execute(
+                        "DELETE FROM responses WHERE backend = ? AND headword = ?",
+                        (backend, headword),
+                    )
+                    self._conn.commit()
+                    self._size -= 1
+                self.misses += 1
+                body = None
+            hits, misses = self.hits, self.misses
+        self.stats_changed.emit(hits, misses)
+        return body
+
+    def put(self, backend: str, word: str, body: str) -> None:
+        """
+        Stores a response body and evicts the least recently used entries if the cache is full.
+
+        Args:
+            backend (str): Name of the dictionary backend.
+            word (str): The word that was looked up.
+            body (str): The raw response body.
+
+        Returns:
+            None: This function does not return a value.
+        """
+        headword = normalize_headword(word)
+        now = time.time()
+        with self._lock:
+            exists = self._conn.execute(
+                "SELECT 1 FROM responses WHERE backend = ? AND headword = ?",
+                (backend, headword),
+            ).fetchone()
+            self._conn.execute(
+                "INSERT OR REPLACE INTO responses (backend, headword, body, created, accessed) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (backend, headword, body, now, now),
+            )
+            if not exists:
+                self._size += 1
+            if self._size > self.max_entries:
+                overflow = self._size - self.max_entries
+                self._conn.execute(
+                    "DELETE FROM responses WHERE rowid IN "
+                    "(SELECT rowid FROM responses ORDER BY accessed ASC LIMIT ?)",
+                    (overflow,),
+                )
+                self._size -= overflow
+            self._conn.commit()
+
+    def clear(self) -> None:
+        """
+        Removes every cached response.
+
+        Returns:
+            None: This function does not return a value.
+        """
+        with self._lock:
+            self._conn.execute("DELETE FROM responses")
+            self._conn.commit()
+            self._size = 0
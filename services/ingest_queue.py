@@ -0,0 +1,158 @@
+import threading
+import time
+from collections import deque
+from typing import List
+
+from PySide6.QtCore import QObject, QTimer, Slot
+
+from models import WordModel, WordsModel
+
+
+class IngestQueue(QObject):
+    """
+    Bounded queue between the HTTP server and the WordsModel.
+
+    Server threads put words in the queue and a timer on the GUI thread adds them to
+    the model in batches, so a burst of requests turns into a few model updates instead
+    of one queued signal per word. When the queue is full the words are refused and the
+    caller is expected to ask the client to retry later.
+
+    The queue must be created on the GUI thread so its timer runs there.
+
+    Attributes:
+        capacity (int): Maximum number of words waiting to be added.
+        batch_size (int): Maximum number of words added per timer tick.
+        interval_ms (int): Time between drains in milliseconds.
+        rate_window (float): Seconds of drains used to compute the drain rate.
+    """
+
+    def __init__(
+        self,
+        capacity: int = 1000,
+        batch_size: int = 200,
+        interval_ms: int = 100,
+        rate_window: float = 10.0,
+    ):
+        """
+        Initializes the queue and starts draining.
+
+        Args:
+            capacity (int, optional): Maximum words waiting. Defaults to 1000.
+            batch_size (int, optional): Maximum words added per tick. Defaults to 200.
+            interval_ms (int, optional): Time between drains. Defaults to 100.
+            rate_window (float, optional): Seconds used for the drain rate.
+                Defaults to 10.
+        """
+        super().__init__()
+        self.capacity = capacity
+        self.batch_size = batch_size
+        self.interval_ms = interval_ms
+        self.rate_window = rate_window
+        self.wordsModel = WordsModel()
+        self._lock = threading.Lock()
+        self._queue = deque()
+        self._drains = deque()
+        self._accepting = True
+        self.accepted_total = 0
+        self.rejected_total = 0
+        self.drained_total = 0
+
+        self.timer = QTimer(self)
+        self.timer.setInterval(self.interval_ms)
+        self.timer.timeout.connect(self.drain)
+        self.timer.start()
+
+    def offer(self, words: List[WordModel]) -> bool:
+        """
+        Queues words if they all fit. Safe to call from any thread.
+
+        Args:
+            words (List[WordModel]): The words to add to the model.
+
+        Returns:
+            bool: True if the words were queued, False if the queue is full or closed.
+        """
+        with self._lock:
+            if not self._accepting or len(self._queue) + len(words) > self.capacity:
+                self.rejected_total += len(words)
+                return False
+            self._queue.extend(words)
+            self.accepted_total += len(words)
+            return True
+
+    @property
+    def accepting(self) -> bool:
+        with self._lock:
+            return self._accepting
+
+    def close(self) -> None:
+        """
+        Stops accepting words. Words already queued are still drained.
+
+        Returns:
+            None: This function does not return a value.
+        """
+        with self._lock:
+            self._accepting = False
+
+    @Slot()
+    def drain(self) -> None:
+        """
+        Adds the next batch of queued words to the model. Runs on the GUI thread.
+
+        Returns:
+            None: This function does not return a value.
+        """
+        with self._lock:
+            count = min(self.batch_size, len(self._queue))
+            batch = [self._queue.popleft() for _ in range(count)]
+        if not batch:
+            return
+        self.wordsModel.add_words(batch)
+        with self._lock:
+            self.drained_total += len(batch)
+            self._drains.append((time.monotonic(), len(batch)))
+
+    def drain_rate(self) -> float:
+        """
+        Returns the number of words added per second over the rate window.
+
+        Returns:
+            float: Words per second.
+        """
+        with self._lock:
+            cutoff = time.monotonic() - self.rate_window
+            while self._drains and self._drains[0][0] < cutoff:
+                self._drains.popleft()
+            return sum(count for _, count in self._drains) / self.rate_window
+
+    def retry_after(self) -> int:
+        """
+        Estimates how many seconds it takes until the queue has room again.
+
+        Returns:
+            int: Seconds, at least 1.
+        """
+        with self._lock:
+            depth = len(self._queue)
+        per_second = self.batch_size * 1000 / self.interval_ms
+        return max(1, round(depth / per_second))
+
+    def stats(self) -> dict:
+        """
+        Returns the queue depth and counters.
+
+        Returns:
+            dict: The queue stats.
+        """
+        drain_rate = self.drain_rate()
+        with self._lock:
+            return {
+                "depth": len(self._queue),
+                "capacity": self.capacity,
+                "accepting": self._accepting,
+                "drain_rate": round(drain_rate, 2),
+                "accepted_total": self.accepted_total,
+                "rejected_total": self.rejected_total,
+                "drained_total": self.drained_total,
+            }
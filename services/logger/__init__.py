@@ -1,3 +1,4 @@
+from .log_history import LogHistory
 from .logger import Logger
 
-__all__ = ['Logger']
+__all__ = ["LogHistory", "Logger"]
@@ -0,0 +1,116 @@
+import mmap
+import os
+from typing import List, Optional, Tuple
+
+# (inode of the file, byte offset where the lines already read start)
+Cursor = Tuple[int, int]
+
+
+class LogHistory:
+    """
+    Reads a log file from the end, continuing into its RotatingFileHandler backups
+    (`file.log.1`, `file.log.2`, ...) for older lines.
+
+    Files are memory-mapped and scanned backwards for newlines, so only the end of a
+    large log is touched. A cursor remembers the file by inode, so paging keeps working
+    after the log rotates and the backups are renamed.
+
+    Attributes:
+        path (str): Location of the current log file.
+        encoding (str): Encoding of the log files.
+    """
+
+    def __init__(self, path: str, encoding: str = "utf-8"):
+        self.path = path
+        self.encoding = encoding
+
+    def files(self) -> List[str]:
+        """
+        Returns the log file and its backups that exist, newest first.
+
+        Returns:
+            List[str]: The file paths.
+        """
+        files = [self.path] if os.path.isfile(self.path) else []
+        index = 1
+        while os.path.isfile(f"{self.path}.{index}"):
+            files.append(f"{self.path}.{index}")
+            index += 1
+        return files
+
+    def tail(self, count: int) -> Tuple[List[str], Optional[Cursor]]:
+        """
+        Reads the last lines of the log.
+
+        Args:
+            count (int): Maximum number of lines.
+
+        Returns:
+            Tuple[List[str], Optional[Cursor]]: The lines, oldest first, and the cursor
+                to pass to `older`, or None if there is nothing older.
+        """
+        return self._read_back(self.files(), 0, None, count)
+
+    def older(self, cursor: Cursor, count: int) -> Tuple[List[str], Optional[Cursor]]:
+        """
+        Reads the lines before a cursor, continuing into older backups.
+
+        Args:
+            cursor (Cursor): Cursor returned by `tail` or a previous `older` call.
+            count (int): Maximum number of lines.
+
+        Returns:
+            Tuple[List[str], Optional[Cursor]]: The lines, oldest first, and the cursor
+                for the next page, or None if there is nothing older.
+        """
+        inode, offset = cursor
+        files = self.files()
+        for index, path in enumerate(files):
+            if self._inode(path) == inode:
+                return self._read_back(files, index, offset, count)
+        return [], None
+
+    def _read_back(
+        self, files: List[str], index: int, end: Optional[int], count: int
+    ) -> Tuple[List[str], Optional[Cursor]]:
+        lines: List[str] = []
+        while index < len(files) and len(lines) < count:
+            file_lines, start = self._read_file_back(
+                files[index], end, count - len(lines)
+            )
+            lines = file_lines + lines
+            if start > 0:
+                return lines, (self._inode(files[index]), start)
+            index += 1
+            end = None
+        while index < len(files) and os.path.getsize(files[index]) == 0:
+            index += 1
+        if index < len(files):
+            return lines, (self._inode(files[index]), os.path.getsize(files[index]))
+        return lines, None
+
+    def _read_file_back(
+        self, path: str, end: Optional[int], count: int
+    ) -> Tuple[List[str], int]:
+        """Reads up to `count` lines that end at byte `end`, and where they start."""
+        with open(path, "rb") as file:
+            size = os.fstat(file.fileno()).st_size
+            end = size if end is None else min(end, size)
+            if end == 0:
+                return [], 0
+            with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                # ignore the newline that ends the last line
+                search_end = end - 1 if mm[end - 1 : end] == b"\n" else end
+                start = search_end
+                for _ in range(count):
+                    start = mm.rfind(b"\n", 0, start)
+                    if start < 0:
+                        break
+                start += 1
+                data = mm[start:search_end]
+        text = data.decode(self.encoding, errors="replace")
+        return text.split("\n") if text else [], start
+
+    @staticmethod
+    def _inode(path: str) -> int:
+        return os.stat(path).st_ino
@@ -3,15 +3,52 @@ import queue
 import threading
 import time
 from logging.handlers import RotatingFileHandler
+from typing import List, Tuple
 
 from PySide6.QtCore import QMutex, QMutexLocker, QThread, Signal, Slot
 
 
+class BatchRotatingFileHandler(RotatingFileHandler):
+    """
+    RotatingFileHandler that can write a batch of records with a single flush.
+    """
+
+    def emit_batch(self, records: List[logging.LogRecord]) -> None:
+        """
+        Writes the records, rolling the file over when needed, and flushes once.
+
+        Args:
+            records (List[logging.LogRecord]): The records to write.
+
+        Returns:
+            None: This function does not return a value.
+        """
+        self.acquire()
+        try:
+            for record in records:
+                if self.shouldRollover(record):
+                    self.doRollover()
+                if self.stream is None:
+                    self.stream = self._open()
+                self.stream.write(self.format(record) + self.terminator)
+            if self.stream is not None:
+                self.stream.flush()
+        except Exception:
+            self.handleError(records[-1])
+        finally:
+            self.release()
+
+
 class LogWorker(QThread):
     """
     Worker thread responsible for managing logging operations, including writing log messages
     to a file and emitting log signals. It handles logging asynchronously and supports log rotation.
 
+    The queue is drained in batches of up to `max_batch` messages, which are written with
+    one flush. Lines for the UI are collected and emitted as one multi-line chunk at most
+    every `ui_interval` seconds, keeping only the last `max_ui_lines` lines of a chunk, so
+    a busy pipeline doesn't flood the GUI thread with signals.
+
     Attributes:
         log_queue (queue.Queue): Queue for storing log messages before writing.
         log_file_path (str): Path where log files are stored.
@@ -25,11 +62,17 @@ class LogWorker(QThread):
         logger (logging.Logger): Logger instance for handling log file writing.
 
     Signals:
-        log_signal (Signal[str]): Signal emitted with log messages after they are written to the log file.
+        log_signal (Signal[str]): Signal emitted with the log lines written since the last
+            emit, joined with newlines.
     """
 
     log_signal = Signal(str)
 
+    max_batch = 500
+    ui_interval = 0.25
+    max_ui_lines = 2000
+    LEVELS = {"INFO": logging.INFO, "WARN": logging.WARNING, "ERROR": logging.ERROR}
+
     def __init__(
         self,
         log_file_path: str,
@@ -61,6 +104,9 @@ class LogWorker(QThread):
 
         self.stop_event = False
         self.mutex = QMutex()
+        self.ui_lines = []
+        self.ui_skipped = 0
+        self.last_ui_emit = 0.0
         self.setup_logging()
 
     def setup_logging(self) -> None:
@@ -79,7 +125,7 @@ class LogWorker(QThread):
             self.log_file_max_mbs = 5
 
         if not self.logger.handlers:
-            logfile = RotatingFileHandler(
+            logfile = BatchRotatingFileHandler(
                 complete_path,
                 maxBytes=self.log_file_max_mbs * 1024 * 1024,
                 backupCount=self.log_backup_count,
@@ -120,29 +166,85 @@ class LogWorker(QThread):
     def run(self) -> None:
         """
         Processes the log queue and writes log messages to the file asynchronously.
-        Emits a signal with the log message after it is written.
+        Emits the written lines to the UI in coalesced chunks.
 
         Returns:
             None: This function does not return a value.
         """
         while not self.stop_event or not self.log_queue.empty():
-
+            timeout = 1 if not self.ui_lines else self.ui_interval
             try:
-                current_time_str = time.asctime(time.localtime())
-                level, msg = self.log_queue.get(timeout=1)
-                with QMutexLocker(self.mutex):
-                    if level == "INFO":
-                        self.logger.info(msg)
-                    elif level == "ERROR":
-                        self.logger.error(msg)
-                    elif level == "WARN":
-                        self.logger.warning(msg)
-                    self.log_signal.emit(f"{current_time_str} - {level} - {msg}")
-                self.log_queue.task_done()
+                batch = [self.log_queue.get(timeout=timeout)]
             except queue.Empty:
+                self.emit_ui_lines()
                 continue
+            while len(batch) < self.max_batch:
+                try:
+                    batch.append(self.log_queue.get_nowait())
+                except queue.Empty:
+                    break
+
+            try:
+                self.write_batch(batch)
             except Exception as e:
                 print(f"Logging error: {e}")
+            finally:
+                for _ in batch:
+                    self.log_queue.task_done()
+
+            if time.monotonic() - self.last_ui_emit >= self.ui_interval:
+                self.emit_ui_lines()
+        self.emit_ui_lines()
+
+    def write_batch(self, batch: List[Tuple[str, str]]) -> None:
+        """
+        Writes a batch of log messages to the log file and queues their lines for the UI.
+
+        Args:
+            batch (List[Tuple[str, str]]): The level and message of each log.
+
+        Returns:
+            None: This function does not return a value.
+        """
+        records = []
+        for level, msg in batch:
+            record = self.logger.makeRecord(
+                self.logger.name, self.LEVELS[level], "", 0, msg, None, None
+            )
+            records.append(record)
+            self.ui_lines.append(
+                f"{time.asctime(time.localtime(record.created))} - {level} - {msg}"
+            )
+
+        with QMutexLocker(self.mutex):
+            for handler in self.logger.handlers:
+                if isinstance(handler, BatchRotatingFileHandler):
+                    handler.emit_batch(records)
+                else:
+                    for record in records:
+                        handler.handle(record)
+
+        if len(self.ui_lines) > self.max_ui_lines:
+            self.ui_skipped += len(self.ui_lines) - self.max_ui_lines
+            del self.ui_lines[: -self.max_ui_lines]
+
+    def emit_ui_lines(self) -> None:
+        """
+        Emits the lines collected since the last emit as one chunk.
+
+        Returns:
+            None: This function does not return a value.
+        """
+        if not self.ui_lines:
+            return
+        if self.ui_skipped:
+            self.ui_lines.insert(
+                0, f"... {self.ui_skipped} lines not shown, see the log file ..."
+            )
+            self.ui_skipped = 0
+        self.log_signal.emit("\n".join(self.ui_lines))
+        self.ui_lines = []
+        self.last_ui_emit = time.monotonic()
 
     def stop(self) -> None:
         """
@@ -1,3 +1,11 @@
+from .http_client import HttpClient
 from .network_worker import NetworkWorker
+from .rate_limiter import QuotaExceededError, RateLimiter, TokenBucket
 
-__all__ = ["NetworkWorker"]
+__all__ = [
+    "HttpClient",
+    "NetworkWorker",
+    "QuotaExceededError",
+    "RateLimiter",
+    "TokenBucket",
+]
@@ -0,0 +1,179 @@
+import threading
+import time
+from typing import Dict, Optional, Tuple, Union
+from urllib.parse import urlsplit
+
+import requests
+from PySide6.QtCore import QObject
+from requests.adapters import HTTPAdapter
+
+from base import QSingleton
+
+Timeout = Union[None, float, Tuple[float, float]]
+
+
+class HttpClient(QObject, metaclass=QSingleton):
+    """
+    Shared HTTP client for every outbound request.
+
+    All requests go through one `requests.Session`, which keeps a pool of keep-alive
+    connections for each host. TLS handshakes to the dictionary APIs and TCP setup to
+    AnkiConnect then happen once per run instead of once per word. A host never has
+    more than `pool_size` connections open. Threads that need another one wait for a
+    connection to be returned to the pool.
+
+    The client is shared between threads. Create it on the main thread before any
+    worker uses it, the settings page does this when the settings are loaded.
+
+    Attributes:
+        pool_size (int): Maximum connections kept open per host.
+        connect_timeout (float): Seconds to wait for a connection.
+        read_timeout (float): Seconds to wait for a response, unless a request sets
+            its own.
+    """
+
+    # number of hosts whose pools are kept, the app talks to a handful of hosts
+    pool_hosts = 10
+
+    def __init__(
+        self,
+        pool_size: int = 10,
+        connect_timeout: float = 5.0,
+        read_timeout: float = 15.0,
+    ):
+        super().__init__()
+        self.pool_size = max(1, int(pool_size))
+        self.connect_timeout = connect_timeout
+        self.read_timeout = read_timeout
+        self._lock = threading.Lock()
+        self._stats: Dict[str, dict] = {}
+        self._session = self._new_session()
+
+    def _new_session(self) -> requests.Session:
+        session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=self.pool_hosts,
+            pool_maxsize=self.pool_size,
+            pool_block=True,
+        )
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        return session
+
+    def configure(
+        self,
+        pool_size: Optional[int] = None,
+        read_timeout: Optional[float] = None,
+        connect_timeout: Optional[float] = None,
+    ) -> None:
+        """
+        Changes the pool size and default timeouts. Changing the pool size starts new
+        pools; requests already running finish on the old ones.
+
+        Args:
+            pool_size (int, optional): Maximum connections kept open per host.
+            read_timeout (float, optional): Seconds to wait for a response.
+            connect_timeout (float, optional): Seconds to wait for a connection.
+
+        Returns:
+            None: This function does not return a value.
+        """
+        with self._lock:
+            if read_timeout:
+                self.read_timeout = float(read_timeout)
+            if connect_timeout:
+                self.connect_timeout = float(connect_timeout)
+            if pool_size and max(1, int(pool_size)) != self.pool_size:
+                self.pool_size = max(1, int(pool_size))
+                self._session = self._new_session()
+
+    def request(
+        self, method: str, url: str, timeout: Timeout = None, **kwargs
+    ) -> requests.Response:
+        """
+        Sends a request on a pooled connection and records its latency and outcome for
+        the host.
+
+        Args:
+            method (str): The HTTP method.
+            url (str): The URL.
+            timeout (float | Tuple[float, float], optional): Read timeout, or connect
+                and read timeouts. Defaults to the client's timeouts.
+            **kwargs: Passed to `requests.Session.request`.
+
+        Returns:
+            requests.Response: The response.
+
+        Raises:
+            requests.exceptions.RequestException: If the request fails.
+        """
+        if timeout is None:
+            timeout = (self.connect_timeout, self.read_timeout)
+        elif not isinstance(timeout, tuple):
+            timeout = (self.connect_timeout, timeout)
+
+        host = urlsplit(url).netloc
+        start = time.perf_counter()
+        try:
+            response = self._session.request(method, url, timeout=timeout, **kwargs)
+        except requests.exceptions.RequestException as e:
+            self._record(host, time.perf_counter() - start, type(e).__name__)
+            raise
+        error = f"HTTP {response.status_code}" if response.status_code >= 500 else None
+        self._record(host, time.perf_counter() - start, error)
+        return response
+
+    def get(self, url: str, timeout: Timeout = None, **kwargs) -> requests.Response:
+        """
+        Sends a GET request. See `request`.
+        """
+        return self.request("GET", url, timeout=timeout, **kwargs)
+
+    def post(self, url: str, timeout: Timeout = None, **kwargs) -> requests.Response:
+        """
+        Sends a POST request. See `request`.
+        """
+        return self.request("POST", url, timeout=timeout, **kwargs)
+
+    def _record(self, host: str, elapsed: float, error: Optional[str]) -> None:
+        with self._lock:
+            stats = self._stats.setdefault(
+                host,
+                {"requests": 0, "errors": 0, "total": 0.0, "max": 0.0, "error": None},
+            )
+            stats["requests"] += 1
+            stats["total"] += elapsed
+            stats["max"] = max(stats["max"], elapsed)
+            if error:
+                stats["errors"] += 1
+                stats["error"] = error
+
+    def stats(self) -> Dict[str, dict]:
+        """
+        Returns the request counters for each host.
+
+        Returns:
+            Dict[str, dict]: For each host, the number of requests and errors, the
+                average and slowest latency in ms and the last error.
+        """
+        with self._lock:
+            return {
+                host: {
+                    "requests": stats["requests"],
+                    "errors": stats["errors"],
+                    "avg_ms": round(stats["total"] / stats["requests"] * 1000, 1),
+                    "max_ms": round(stats["max"] * 1000, 1),
+                    "last_error": stats["error"],
+                }
+                for host, stats in self._stats.items()
+            }
+
+    def close(self) -> None:
+        """
+        Closes the pooled connections.
+
+        Returns:
+            None: This function does not return a value.
+        """
+        with self._lock:
+            self._session.close()
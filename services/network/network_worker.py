@@ -1,6 +1,8 @@
 import requests
 from PySide6.QtCore import QObject, Signal, Slot
 
+from .http_client import HttpClient
+
 
 class NetworkWorker(QObject):
     finished = Signal()
@@ -17,7 +19,7 @@ class NetworkWorker(QObject):
     def do_work(self):
         try:
             print(self.url)
-            request = requests.get(self.url, json=self.json, timeout=self.timeout)
+            request = HttpClient().get(self.url, json=self.json, timeout=self.timeout)
             res = request.json()
             self.response.emit(res)
         except requests.exceptions.ConnectionError as e:
@@ -0,0 +1,186 @@
+import datetime
+import threading
+import time
+from typing import Dict, Optional
+
+from PySide6.QtCore import QObject, QSettings, Signal
+
+from base import QSingleton
+
+
+class QuotaExceededError(Exception):
+    """
+    Raised when an API's daily quota is used up.
+    """
+
+
+class TokenBucket:
+    """
+    Token bucket that hands out reservations.
+
+    The bucket holds up to `capacity` tokens and refills at `rate` tokens a second. A
+    caller takes its tokens right away, even if that leaves the bucket in debt. It is
+    then told how long to wait, so concurrent callers queue up in order instead of
+    polling.
+
+    Attributes:
+        rate (float): Tokens added per second.
+        capacity (float): Maximum tokens held, the largest burst allowed.
+    """
+
+    def __init__(self, rate: float, capacity: float):
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.updated = time.monotonic()
+
+    def reserve(self, cost: float) -> float:
+        """
+        Takes tokens from the bucket. Not thread safe, callers hold a lock.
+
+        Args:
+            cost (float): Tokens to take.
+
+        Returns:
+            float: Seconds to wait before using the tokens.
+        """
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+        self.tokens -= cost
+        return 0.0 if self.tokens >= 0 else -self.tokens / self.rate
+
+
+class RateLimiter(QObject, metaclass=QSingleton):
+    """
+    Shared rate limits and daily quotas for the external APIs.
+
+    Each API registered here gets a token bucket, shared by every worker and pool
+    thread. Callers wait their turn in `acquire` instead of sending requests the API
+    would answer with a 429. Daily usage is stored in the app settings, so the counters
+    survive restarts, and `acquire` raises QuotaExceededError once an API's daily
+    quota is used up.
+
+    The limiter keeps its own QSettings object, guarded by its lock, because the
+    shared AppSettings groups are not safe to use from the pool threads.
+
+    Signals:
+        usage_changed (Signal[str, int, int]): Emitted with the API name, the units used
+            today and the daily quota (0 when there is none) whenever usage changes.
+    """
+
+    usage_changed = Signal(str, int, int)
+
+    def __init__(self):
+        super().__init__()
+        self._lock = threading.Lock()
+        self._settings = QSettings("EnglishDict", "EnglishDictApp")
+        self._buckets: Dict[str, TokenBucket] = {}
+        self._daily_limits: Dict[str, Optional[int]] = {}
+        self._units: Dict[str, str] = {}
+        self._used: Dict[str, int] = {}
+        self._day: Dict[str, str] = {}
+
+    def register(
+        self,
+        name: str,
+        rate: Optional[float],
+        capacity: Optional[float] = None,
+        daily_limit: Optional[int] = None,
+        unit: str = "requests",
+    ) -> None:
+        """
+        Sets the limits of an API. Registering an API again updates its limits and
+        keeps its bucket and usage.
+
+        Args:
+            name (str): Name of the API.
+            rate (float, optional): Units allowed per second, or None for no rate limit.
+            capacity (float, optional): Largest burst. Defaults to one second of `rate`.
+            daily_limit (int, optional): Units allowed per day, or None for no quota.
+            unit (str, optional): What the units count. Defaults to "requests".
+
+        Returns:
+            None: This function does not return a value.
+        """
+        with self._lock:
+            if rate:
+                capacity = capacity or max(1.0, rate)
+                bucket = self._buckets.get(name)
+                if bucket is None:
+                    self._buckets[name] = TokenBucket(rate, capacity)
+                else:
+                    bucket.rate, bucket.capacity = rate, capacity
+            else:
+                self._buckets.pop(name, None)
+            self._daily_limits[name] = daily_limit
+            self._units[name] = unit
+            if name not in self._used:
+                self._day[name] = self._settings.value(f"quota/{name}-day", "")
+                self._used[name] = int(self._settings.value(f"quota/{name}-used", 0))
+            used = self._roll_day(name)
+        self.usage_changed.emit(name, used, daily_limit or 0)
+
+    def acquire(self, name: str, cost: int = 1) -> None:
+        """
+        Counts `cost` units against the API's quota and waits until its rate limit
+        allows them. APIs that were never registered aren't limited.
+
+        Args:
+            name (str): Name of the API.
+            cost (int, optional): Units the request uses. Defaults to 1.
+
+        Returns:
+            None: This function does not return a value.
+
+        Raises:
+            QuotaExceededError: If the request would go over the daily quota.
+        """
+        with self._lock:
+            if name not in self._used:
+                return
+            used = self._roll_day(name)
+            daily_limit = self._daily_limits[name]
+            if daily_limit and used + cost > daily_limit:
+                raise QuotaExceededError(
+                    f"Daily quota of {daily_limit} {self._units[name]} for {name} "
+                    "is used up"
+                )
+            used += cost
+            self._used[name] = used
+            self._settings.setValue(f"quota/{name}-used", used)
+            bucket = self._buckets.get(name)
+            wait = bucket.reserve(cost) if bucket is not None else 0.0
+        self.usage_changed.emit(name, used, daily_limit or 0)
+        if wait > 0:
+            time.sleep(wait)
+
+    def _roll_day(self, name: str) -> int:
+        today = datetime.date.today().isoformat()
+        if self._day[name] != today:
+            self._day[name] = today
+            self._used[name] = 0
+            self._settings.setValue(f"quota/{name}-day", today)
+            self._settings.setValue(f"quota/{name}-used", 0)
+        return self._used[name]
+
+    def usage(self) -> Dict[str, dict]:
+        """
+        Returns today's usage of every registered API.
+
+        Returns:
+            Dict[str, dict]: For each API, the units used today, the daily quota and
+                the units left (None when there is no quota), and the unit name.
+        """
+        with self._lock:
+            usage = {}
+            for name in self._used:
+                used = self._roll_day(name)
+                daily_limit = self._daily_limits[name]
+                usage[name] = {
+                    "used": used,
+                    "limit": daily_limit,
+                    "remaining": (max(0, daily_limit - used) if daily_limit else None),
+                    "unit": self._units[name],
+                }
+            return usage
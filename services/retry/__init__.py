@@ -0,0 +1,5 @@
+from .circuit_breaker import CircuitBreaker
+from .retry_executor import RetryExecutor
+from .retry_policy import RetryPolicy, RetryRule
+
+__all__ = ["CircuitBreaker", "RetryExecutor", "RetryPolicy", "RetryRule"]
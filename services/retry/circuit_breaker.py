@@ -0,0 +1,107 @@
+import threading
+import time
+from typing import Dict
+
+
+class CircuitBreaker:
+    """
+    Stops calls to a backend that keeps failing.
+
+    After `failure_threshold` transient failures in a row the breaker opens and every
+    caller is told to wait `reset_timeout` seconds. When the wait is over one trial
+    call goes through. If it succeeds the breaker closes, if it fails the breaker opens
+    again. Breakers are shared by name, so every worker using a backend pauses
+    together.
+
+    Attributes:
+        name (str): Name of the backend.
+        failure_threshold (int): Failures in a row that open the breaker.
+        reset_timeout (float): Seconds the breaker stays open.
+        state (str): "closed", "open" or "half_open".
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    # how often callers check back while the trial call is running
+    probe_interval = 1.0
+
+    _breakers: Dict[str, "CircuitBreaker"] = {}
+    _breakers_lock = threading.Lock()
+
+    def __init__(
+        self, name: str, failure_threshold: int = 5, reset_timeout: float = 30.0
+    ):
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.state = self.CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._lock = threading.Lock()
+
+    @classmethod
+    def for_name(cls, name: str, **kwargs) -> "CircuitBreaker":
+        """
+        Returns the shared breaker of a backend, creating it on first use.
+
+        Args:
+            name (str): Name of the backend.
+            **kwargs: Passed to the constructor when the breaker is created.
+
+        Returns:
+            CircuitBreaker: The breaker.
+        """
+        with cls._breakers_lock:
+            if name not in cls._breakers:
+                cls._breakers[name] = cls(name, **kwargs)
+            return cls._breakers[name]
+
+    def retry_in(self) -> float:
+        """
+        Asks whether a call may go through now. The first caller after the breaker's
+        timeout is let through as the trial call.
+
+        Returns:
+            float: 0 if the call may go through, otherwise seconds to wait before
+                asking again.
+        """
+        with self._lock:
+            if self.state == self.CLOSED:
+                return 0.0
+            if self.state == self.OPEN:
+                remaining = self._opened_at + self.reset_timeout - time.monotonic()
+                if remaining > 0:
+                    return remaining
+                self.state = self.HALF_OPEN
+                return 0.0
+            return self.probe_interval
+
+    def record_success(self) -> None:
+        """
+        Records a call the backend answered, which closes the breaker.
+
+        Returns:
+            None: This function does not return a value.
+        """
+        with self._lock:
+            self._failures = 0
+            self.state = self.CLOSED
+
+    def record_failure(self) -> bool:
+        """
+        Records a transient failure.
+
+        Returns:
+            bool: True if this failure opened the breaker.
+        """
+        with self._lock:
+            self._failures += 1
+            if self.state == self.HALF_OPEN or (
+                self.state == self.CLOSED and self._failures >= self.failure_threshold
+            ):
+                self.state = self.OPEN
+                self._opened_at = time.monotonic()
+                return True
+            return False
@@ -0,0 +1,173 @@
+import heapq
+import itertools
+import threading
+import time
+from concurrent.futures import CancelledError, Future, ThreadPoolExecutor
+from functools import partial
+from typing import Callable, Optional
+
+from .circuit_breaker import CircuitBreaker
+from .retry_policy import RetryPolicy
+
+
+class RetryExecutor:
+    """
+    Thread pool whose tasks are retried according to a RetryPolicy.
+
+    `submit` returns a future that resolves once the task succeeds or fails for good.
+    A failed attempt doesn't sleep on its pool thread. It is put on a timer and
+    submitted again when its delay is over, so the pool keeps working on other tasks
+    in the meantime. While the circuit breaker is open, attempts are held on the timer
+    until the backend is tried again.
+
+    Attributes:
+        policy (RetryPolicy): Decides which failures are retried and when.
+        breaker (CircuitBreaker): Shared breaker of the backend, or None.
+        on_retry (Callable[[BaseException, int, float], None]): Called with the error,
+            the failed attempt and the delay before each retry.
+        on_circuit_open (Callable[[str, float], None]): Called with the backend name
+            and the pause in seconds when the breaker opens.
+    """
+
+    def __init__(
+        self,
+        max_workers: int,
+        policy: Optional[RetryPolicy] = None,
+        breaker: Optional[CircuitBreaker] = None,
+        thread_name_prefix: str = "",
+        on_retry: Optional[Callable[[BaseException, int, float], None]] = None,
+        on_circuit_open: Optional[Callable[[str, float], None]] = None,
+    ):
+        self.policy = policy or RetryPolicy.default()
+        self.breaker = breaker
+        self.on_retry = on_retry
+        self.on_circuit_open = on_circuit_open
+        self.executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix=thread_name_prefix
+        )
+        self._timers = []
+        self._sequence = itertools.count()
+        self._condition = threading.Condition()
+        self._timer_thread = None
+        self._closed = False
+
+    def submit(self, fn: Callable, *args, **kwargs) -> Future:
+        """
+        Runs a task on the pool, retrying it when it fails with a transient error.
+
+        Args:
+            fn (Callable): The task.
+            *args: Positional arguments for the task.
+            **kwargs: Keyword arguments for the task.
+
+        Returns:
+            Future: Resolves with the task's result, or its last error.
+        """
+        outer = Future()
+        outer.set_running_or_notify_cancel()
+        self._attempt(outer, fn, args, kwargs, 1)
+        return outer
+
+    def waiting(self) -> int:
+        """
+        Returns the number of attempts waiting for their delay to pass.
+
+        Returns:
+            int: The number of attempts.
+        """
+        with self._condition:
+            return len(self._timers)
+
+    def _attempt(self, outer, fn, args, kwargs, attempt) -> None:
+        wait = self.breaker.retry_in() if self.breaker is not None else 0.0
+        if wait > 0:
+            self._schedule(wait, outer, fn, args, kwargs, attempt)
+            return
+        try:
+            inner = self.executor.submit(self._run, outer, fn, args, kwargs, attempt)
+        except RuntimeError as e:
+            # the pool was shut down
+            outer.set_exception(e)
+            return
+        inner.add_done_callback(partial(self._forward_cancel, outer))
+
+    @staticmethod
+    def _forward_cancel(outer: Future, inner: Future) -> None:
+        if inner.cancelled():
+            outer.set_exception(CancelledError())
+
+    def _run(self, outer, fn, args, kwargs, attempt) -> None:
+        try:
+            result = fn(*args, **kwargs)
+        except Exception as e:
+            transient = self.policy.rule_for(e) is not None
+            if self.breaker is not None:
+                if not transient:
+                    # the backend answered, the request itself was bad
+                    self.breaker.record_success()
+                elif self.breaker.record_failure() and self.on_circuit_open:
+                    self.on_circuit_open(self.breaker.name, self.breaker.reset_timeout)
+            delay = self.policy.delay(e, attempt)
+            if delay is None or self._closed:
+                outer.set_exception(e)
+                return
+            if self.on_retry:
+                self.on_retry(e, attempt, delay)
+            self._schedule(delay, outer, fn, args, kwargs, attempt + 1)
+            return
+        if self.breaker is not None:
+            self.breaker.record_success()
+        outer.set_result(result)
+
+    def _schedule(self, delay, outer, fn, args, kwargs, attempt) -> None:
+        with self._condition:
+            if self._closed:
+                outer.set_exception(CancelledError())
+                return
+            heapq.heappush(
+                self._timers,
+                (
+                    time.monotonic() + delay,
+                    next(self._sequence),
+                    (outer, fn, args, kwargs, attempt),
+                ),
+            )
+            if self._timer_thread is None:
+                self._timer_thread = threading.Thread(
+                    target=self._run_timers, name="retry-timer", daemon=True
+                )
+                self._timer_thread.start()
+            self._condition.notify()
+
+    def _run_timers(self) -> None:
+        while True:
+            with self._condition:
+                while not self._closed:
+                    now = time.monotonic()
+                    if self._timers and self._timers[0][0] <= now:
+                        break
+                    timeout = self._timers[0][0] - now if self._timers else None
+                    self._condition.wait(timeout)
+                if self._closed:
+                    return
+                _, _, task = heapq.heappop(self._timers)
+            self._attempt(*task)
+
+    def shutdown(self, wait: bool = True, cancel_futures: bool = False) -> None:
+        """
+        Shuts the pool down. Attempts waiting on a timer are cancelled.
+
+        Args:
+            wait (bool, optional): Wait for running tasks. Defaults to True.
+            cancel_futures (bool, optional): Cancel queued tasks. Defaults to False.
+
+        Returns:
+            None: This function does not return a value.
+        """
+        with self._condition:
+            self._closed = True
+            timers, self._timers = self._timers, []
+            self._condition.notify()
+        for _, _, (outer, *_) in timers:
+            outer.set_exception(CancelledError())
+        self.executor.shutdown(wait=wait, cancel_futures=cancel_futures)
@@ -0,0 +1,182 @@
+import random
+from typing import List, Optional, Tuple, Type
+
+import requests
+
+
+class RetryRule:
+    """
+    How often and how long to wait before retrying one class of errors.
+
+    An error matches the rule if it is an instance of one of `exceptions` or carries
+    one of `status_codes`, either as an HTTP response status or as the `code` of a
+    Google API error.
+
+    Attributes:
+        name (str): Name of the error class, used in logs.
+        exceptions (Tuple[Type[BaseException], ...]): Exception types that match.
+        status_codes (Tuple[int, ...]): Status codes that match.
+        max_attempts (int): Attempts in total, including the first one.
+        base_delay (float): Seconds to wait before the first retry.
+        max_delay (float): Longest wait between two attempts.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        exceptions: Tuple[Type[BaseException], ...] = (),
+        status_codes: Tuple[int, ...] = (),
+        max_attempts: int = 4,
+        base_delay: float = 1.0,
+        max_delay: float = 60.0,
+    ):
+        self.name = name
+        self.exceptions = exceptions
+        self.status_codes = status_codes
+        self.max_attempts = max_attempts
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+
+    def matches(self, error: BaseException) -> bool:
+        """
+        Checks if the rule applies to an error.
+
+        Args:
+            error (BaseException): The error.
+
+        Returns:
+            bool: True if the error matches.
+        """
+        if self.exceptions and isinstance(error, self.exceptions):
+            return True
+        return RetryPolicy.status_code(error) in self.status_codes
+
+
+class RetryPolicy:
+    """
+    Decides whether a failed attempt is retried and how long to wait first.
+
+    The first matching rule decides. Errors no rule matches are permanent and are
+    never retried. Delays grow exponentially from the rule's base delay up to its
+    maximum, and half of each delay is random, so workers that failed together don't
+    retry together. A Retry-After header sent with the error is always respected.
+
+    Attributes:
+        rules (List[RetryRule]): The rules, checked in order.
+    """
+
+    def __init__(self, rules: List[RetryRule]):
+        self.rules = rules
+
+    @classmethod
+    def default(cls) -> "RetryPolicy":
+        """
+        Builds the policy used by the pipeline workers. Timeouts, dropped connections,
+        throttling and server errors are retried. Everything else, like a bad API key
+        or a rejected note, fails right away.
+
+        Returns:
+            RetryPolicy: The policy.
+        """
+        return cls(
+            [
+                RetryRule(
+                    "timeout",
+                    (requests.exceptions.Timeout, TimeoutError),
+                    max_attempts=4,
+                    base_delay=1.0,
+                    max_delay=30.0,
+                ),
+                RetryRule(
+                    "connection",
+                    (requests.exceptions.ConnectionError, ConnectionError),
+                    max_attempts=5,
+                    base_delay=2.0,
+                    max_delay=60.0,
+                ),
+                RetryRule(
+                    "throttled",
+                    status_codes=(429,),
+                    max_attempts=6,
+                    base_delay=5.0,
+                    max_delay=120.0,
+                ),
+                RetryRule(
+                    "server",
+                    status_codes=(500, 502, 503, 504),
+                    max_attempts=5,
+                    base_delay=2.0,
+                    max_delay=60.0,
+                ),
+            ]
+        )
+
+    @staticmethod
+    def status_code(error: BaseException) -> Optional[int]:
+        """
+        Returns the status code an error carries, if any.
+
+        Args:
+            error (BaseException): The error.
+
+        Returns:
+            Optional[int]: The HTTP status of the error's response, or its `code` for
+                Google API errors.
+        """
+        response = getattr(error, "response", None)
+        status = getattr(response, "status_code", None)
+        if isinstance(status, int):
+            return status
+        code = getattr(error, "code", None)
+        return code if isinstance(code, int) else None
+
+    @staticmethod
+    def retry_after(error: BaseException) -> float:
+        """
+        Returns the seconds the server asked to wait in a Retry-After header.
+
+        Args:
+            error (BaseException): The error.
+
+        Returns:
+            float: The seconds to wait, or 0 if the server didn't say.
+        """
+        headers = getattr(getattr(error, "response", None), "headers", None) or {}
+        try:
+            return max(0.0, float(headers.get("Retry-After", 0)))
+        except (TypeError, ValueError):
+            return 0.0
+
+    def rule_for(self, error: BaseException) -> Optional[RetryRule]:
+        """
+        Finds the rule for an error.
+
+        Args:
+            error (BaseException): The error.
+
+        Returns:
+            Optional[RetryRule]: The first matching rule, or None for permanent errors.
+        """
+        for rule in self.rules:
+            if rule.matches(error):
+                return rule
+        return None
+
+    def delay(self, error: BaseException, attempt: int) -> Optional[float]:
+        """
+        Decides whether to retry after a failed attempt.
+
+        Args:
+            error (BaseException): The error the attempt failed with.
+            attempt (int): Number of the failed attempt, starting at 1.
+
+        Returns:
+            Optional[float]: Seconds to wait before the next attempt, or None if the
+                error is permanent or the rule's attempts are used up.
+        """
+        rule = self.rule_for(error)
+        if rule is None or attempt >= rule.max_attempts:
+            return None
+        cap = min(rule.max_delay, rule.base_delay * 2 ** (attempt - 1))
+        delay = cap / 2 + random.uniform(0, cap / 2)
+        return max(delay, self.retry_after(error))
@@ -1,5 +1,9 @@
+import json
+import threading
 import uuid
 from concurrent.futures import ThreadPoolExecutor
+from dataclasses import fields
+from typing import List, Optional, Tuple
 
 import waitress
 from flask import Flask, jsonify, request
@@ -8,10 +12,13 @@ from PySide6.QtCore import Signal, Slot
 
 from base import QObjectBase
 from models import Status, WordModel, WordsModel
+from services.network import HttpClient, RateLimiter
+from utils.text import normalize_headword
+
+from .ingest_queue import IngestQueue
 
 
 class FlaskWorker(QObjectBase):
-    add_word_to_model = Signal(WordModel)
     stop_signal = Signal()
     finished = Signal()
     log_with_toast = Signal(str, str, str, str, bool)
@@ -23,7 +30,13 @@ class FlaskWorker(QObjectBase):
         super().__init__()
         self.setup_routes()
         self.wordsModel = WordsModel()
-        self.add_word_to_model.connect(self.wordsModel.add_word)
+        # created before the worker moves to the server thread so it drains on the GUI
+        # thread
+        self.ingest_queue = IngestQueue()
+        self.wordsModel.word_added.connect(self.release_word)
+        self.wordsModel.words_added.connect(self.release_words)
+        self._in_flight_lock = threading.Lock()
+        self._in_flight = set()
         self.stop_signal.connect(self.stop_server)
         self.PORT = 5002
         self.HOST = "127.0.0.1"
@@ -39,13 +52,28 @@ class FlaskWorker(QObjectBase):
 
         @self.server.route("/data", methods=["GET"])
         def route_data():
-            return jsonify({"message": "Data coming soon"})
+            return self.handle_data_get(request)
 
         @self.server.route("/word", methods=["POST"])
         def route_word():
             if request.method == "POST":
                 return self.handle_word_post(request)
 
+        @self.server.route("/words", methods=["POST"])
+        def route_words():
+            return self.handle_words_post(request)
+
+        @self.server.route("/status", methods=["GET"])
+        def route_status():
+            return jsonify(
+                {
+                    "running": self.running,
+                    "queue": self.ingest_queue.stats(),
+                    "http": HttpClient().stats(),
+                    "quota": RateLimiter().usage(),
+                }
+            )
+
     def run(self):
         """Run the Flask server."""
 
@@ -75,6 +103,7 @@ class FlaskWorker(QObjectBase):
     def stop_server(self):
         """Stop the server."""
         self.logging(f"Shutting down Server -  {self.HOST} on port {self.PORT}....")
+        self.ingest_queue.close()
         if self.server_create and self.running:
             self.running = False
             self.server_create.close()
@@ -93,19 +122,201 @@ class FlaskWorker(QObjectBase):
         """
         return any(thread.is_alive() for thread in self.executor._threads)
 
+    WORD_FIELDS = [field.name for field in fields(WordModel)]
+    DATA_PAGE_LIMIT = 100
+    DATA_MAX_PAGE_LIMIT = 1000
+    # snapshot versions start over with every process, so the ETags carry a token of
+    # the process that made them
+    ETAG_EPOCH = uuid.uuid4().hex[:8]
+
+    def handle_data_get(self, request):
+        """
+        Serves the words from the published WordsSnapshot, so it never touches the
+        words the GUI thread is working on.
+
+        Query parameters:
+            status: Comma separated Status names to filter by. Defaults to every status.
+            fields: Comma separated word fields to return. Defaults to every field.
+            cursor: The next_cursor of the previous page.
+            limit: Words per page, up to 1000. Defaults to 100.
+
+        The response has a weak ETag that only changes when a word with one of the
+        requested statuses changes or the app restarts, and If-None-Match is answered
+        with a 304.
+
+        Args:
+            request (Request): The Flask request.
+
+        Returns:
+            tuple: The JSON response and status code.
+        """
+        snapshot = self.wordsModel.snapshot
+
+        statuses = self.split_param(request.args.get("status"))
+        statuses = [status.upper() for status in statuses]
+        unknown = [status for status in statuses if status not in Status.__members__]
+        if unknown:
+            return jsonify({"error": f"Unknown status: {', '.join(unknown)}"}), 400
+
+        projection = self.split_param(request.args.get("fields"))
+        unknown = [field for field in projection if field not in self.WORD_FIELDS]
+        if unknown:
+            return jsonify({"error": f"Unknown field: {', '.join(unknown)}"}), 400
+
+        try:
+            cursor = int(request.args.get("cursor", 0))
+            limit = int(request.args.get("limit", self.DATA_PAGE_LIMIT))
+        except ValueError:
+            return jsonify({"error": "'cursor' and 'limit' must be integers"}), 400
+        limit = max(1, min(limit, self.DATA_MAX_PAGE_LIMIT))
+
+        etag = f"{self.ETAG_EPOCH}-{snapshot.status_version(statuses)}"
+        if request.if_none_match.contains_weak(etag):
+            response = self.server.response_class(status=304)
+        else:
+            rows, next_cursor = snapshot.page(statuses, cursor, limit)
+            if projection:
+                rows = [{field: row[field] for field in projection} for row in rows]
+            response = jsonify(
+                {
+                    "version": snapshot.version,
+                    "count": snapshot.count(statuses),
+                    "words": rows,
+                    "next_cursor": next_cursor,
+                }
+            )
+        response.set_etag(etag, weak=True)
+        response.headers["Cache-Control"] = "no-cache"
+        return response
+
+    @staticmethod
+    def split_param(value: Optional[str]) -> List[str]:
+        if not value:
+            return []
+        return [item.strip() for item in value.split(",") if item.strip()]
+
+    @staticmethod
+    def is_valid_word(received_word) -> bool:
+        """
+        Checks that a received word is a non-empty string.
+
+        Args:
+            received_word (Any): The value received for a word.
+
+        Returns:
+            bool: True if the word can be added.
+        """
+        return (
+            isinstance(received_word, str)
+            and bool(received_word.strip())
+            and received_word.strip().lower() != "undefined"
+        )
+
+    def reserve_words(self, received_words: List[str]) -> List[Tuple[str, str]]:
+        """
+        Deduplicates words against the library, words that were sent to the model but
+        not added yet, and the other words of the same request. New words are reserved
+        until the model reports them as added.
+
+        Args:
+            received_words (List[str]): The valid words received, in request order.
+
+        Returns:
+            List[Tuple[str, str]]: The word and "added" or "duplicate" for each word.
+        """
+        results = []
+        with self._in_flight_lock:
+            for received_word in received_words:
+                headword = normalize_headword(received_word)
+                if headword in self._in_flight or self.wordsModel.has_headword(
+                    received_word
+                ):
+                    results.append((received_word, "duplicate"))
+                else:
+                    self._in_flight.add(headword)
+                    results.append((received_word, "added"))
+        return results
+
+    def queue_words(self, words: List[WordModel]):
+        """
+        Offers new words to the ingest queue. If the queue refuses them their
+        reservations are released and a flow control response is returned.
+
+        Args:
+            words (List[WordModel]): The new words.
+
+        Returns:
+            Optional[tuple]: None if the words were queued, otherwise the 429 or 503
+                response to send back.
+        """
+        if self.ingest_queue.offer(words):
+            return None
+        self.release_words(words)
+        retry_after = self.ingest_queue.retry_after()
+        if self.ingest_queue.accepting:
+            self.logging("Ingest queue is full. Asking client to retry.", "WARN")
+            response = jsonify(
+                {"error": "Too many words queued", "retry_after": retry_after}
+            )
+            code = 429
+        else:
+            response = jsonify({"error": "Server is shutting down"})
+            code = 503
+        response.headers["Retry-After"] = str(retry_after)
+        return response, code
+
+    @Slot(WordModel)
+    def release_word(self, word: WordModel) -> None:
+        """
+        Releases the reservation of a word once the model has added it.
+
+        Args:
+            word (WordModel): The word that was added.
+
+        Returns:
+            None: This function does not return a value.
+        """
+        self.release_words([word])
+
+    @Slot(list)
+    def release_words(self, words: List[WordModel]) -> None:
+        """
+        Releases the reservations of words once the model has added them.
+
+        Args:
+            words (List[WordModel]): The words that were added.
+
+        Returns:
+            None: This function does not return a value.
+        """
+        with self._in_flight_lock:
+            for word in words:
+                self._in_flight.discard(normalize_headword(word.word))
+
+    @staticmethod
+    def new_word(received_word: str) -> WordModel:
+        return WordModel(
+            Status.ADDED, str(uuid.uuid4()), received_word.strip(), "", "", "", "", ""
+        )
+
     def handle_word_post(self, request):
-        data = request.json
-        if "word" not in data:
+        data = request.get_json(silent=True)
+        if not isinstance(data, dict) or "word" not in data:
             return jsonify({"error": "Missing 'word' field"}), 400
         received_word = data["word"]
 
-        if (
-            not isinstance(received_word, str)
-            or not received_word.strip()
-            or received_word.lower() == "undefined"
-        ):
+        if not self.is_valid_word(received_word):
             return jsonify({"error": "'word' must be a non-empty valid string"}), 400
 
+        received_word, status = self.reserve_words([received_word.strip()])[0]
+        if status == "duplicate":
+            self.logging(f"Word already in library: {received_word}", "WARN")
+            return jsonify({"word": received_word, "status": status}), 200
+
+        refused = self.queue_words([self.new_word(received_word)])
+        if refused:
+            return refused
+
         self.log_with_toast.emit(
             "Received Word From Extension",
             f"received word:  {received_word}",
@@ -113,9 +324,103 @@ class FlaskWorker(QObjectBase):
             "INFO",
             True,
         )
-        new_word = WordModel(
-            Status.ADDED, str(uuid.uuid4()), received_word, "", "", "", "", ""
-        )
-        self.add_word_to_model.emit(new_word)
 
-        return jsonify({"word": received_word}), 201
+        return jsonify({"word": received_word, "status": status}), 201
+
+    @staticmethod
+    def read_words_body(request) -> list:
+        """
+        Reads the items of a bulk request. The body is either a JSON array (or an
+        object with a "words" array) or newline delimited JSON. Items are strings or
+        objects with a "word" field.
+
+        Args:
+            request (Request): The Flask request.
+
+        Returns:
+            list: The received items.
+
+        Raises:
+            ValueError: If the body can't be parsed.
+        """
+        body = request.get_data(as_text=True)
+        if "ndjson" in (request.mimetype or "") or "jsonlines" in (
+            request.mimetype or ""
+        ):
+            return [json.loads(line) for line in body.splitlines() if line.strip()]
+
+        data = json.loads(body)
+        if isinstance(data, dict):
+            data = data.get("words")
+        if not isinstance(data, list):
+            raise ValueError("Expected an array of words")
+        return data
+
+    def handle_words_post(self, request):
+        """
+        Adds a batch of words. Every item gets a result of "added", "duplicate" or
+        "invalid", and the new words are queued for the model together. If the
+        ingest queue can't take all of them none are added. A batch larger than the
+        queue could ever hold is refused with a 413, since retrying it can't succeed.
+
+        Args:
+            request (Request): The Flask request.
+
+        Returns:
+            tuple: The JSON response and status code.
+        """
+        try:
+            items = self.read_words_body(request)
+        except ValueError as e:
+            return jsonify({"error": f"Invalid body: {e}"}), 400
+        if len(items) > self.ingest_queue.capacity:
+            return (
+                jsonify(
+                    {
+                        "error": "Too many words in one request",
+                        "max_batch_size": self.ingest_queue.capacity,
+                    }
+                ),
+                413,
+            )
+
+        results = [None] * len(items)
+        valid = []
+        for i, item in enumerate(items):
+            received_word = item.get("word") if isinstance(item, dict) else item
+            if self.is_valid_word(received_word):
+                valid.append((i, received_word.strip()))
+            else:
+                results[i] = {"word": received_word, "status": "invalid"}
+
+        new_words = []
+        reserved = self.reserve_words([received_word for _, received_word in valid])
+        for (i, _), (received_word, status) in zip(valid, reserved):
+            results[i] = {"word": received_word, "status": status}
+            if status == "added":
+                new_word = self.new_word(received_word)
+                results[i]["guid"] = new_word.guid
+                new_words.append(new_word)
+
+        counts = {
+            status: sum(1 for result in results if result["status"] == status)
+            for status in ["added", "duplicate", "invalid"]
+        }
+        if new_words:
+            refused = self.queue_words(new_words)
+            if refused:
+                return refused
+            self.log_with_toast.emit(
+                "Received Words From Extension",
+                f"received {counts['added']} words"
+                + (
+                    f", {counts['duplicate']} already in library"
+                    if counts["duplicate"]
+                    else ""
+                ),
+                "INFO",
+                "INFO",
+                True,
+            )
+
+        return jsonify({**counts, "results": results}), 201 if new_words else 200
@@ -1,8 +1,6 @@
 import platform
 from typing import Optional
 
-import keyring
-from keyring import get_keyring
 from PySide6.QtCore import Signal, Slot
 
 from base import QObjectBase, QSingleton
@@ -23,12 +21,26 @@ class SecureCredentials(QObjectBase, metaclass=QSingleton):
 
     def __init__(self):
         """
-        Sets up the keyring backend based on the operating system and retrieves
-        stored credentials from the application settings and keyring if available.
+        Initializes the credentials manager. The keyring module is imported and its
+        backend set up the first time credentials are read or saved.
         """
         super().__init__()
+        self._keyring = None
 
-        self.set_keyring_backend()
+    def keyring(self):
+        """
+        Returns the keyring module, importing it and setting up the backend the first
+        time it is needed.
+
+        Returns:
+            module: The configured keyring module.
+        """
+        if self._keyring is None:
+            import keyring
+
+            self._keyring = keyring
+            self.set_keyring_backend()
+        return self._keyring
 
     def set_keyring_backend(self) -> None:
         """
@@ -36,9 +48,11 @@ class SecureCredentials(QObjectBase, metaclass=QSingleton):
         have specific keyring backends set. Logs the current keyring backend or errors
         during setup.
         """
+        keyring = self._keyring
         try:
-            get_keyring()
-            self.logging("Current Keyring method: " + str(get_keyring()), "INFO")
+            self.logging(
+                "Current Keyring method: " + str(keyring.get_keyring()), "INFO"
+            )
             current_os = platform.system()
 
             if current_os == "Windows":
@@ -75,7 +89,7 @@ class SecureCredentials(QObjectBase, metaclass=QSingleton):
         Returns:
             str: secure credential.
         """
-        return keyring.get_password(service_name, name_field)
+        return self.keyring().get_password(service_name, name_field)
 
     @Slot(str, str, str)
     def save_creds(self, service_name: str, name_field: str, secure: str) -> None:
@@ -93,7 +107,7 @@ class SecureCredentials(QObjectBase, metaclass=QSingleton):
         """
         try:
             if service_name and name_field and secure:
-                keyring.set_password(service_name, name_field, secure)
+                self.keyring().set_password(service_name, name_field, secure)
                 self.logging("Saved Credentials to Keyring", "INFO")
                 self.success.emit()
         except Exception as e:
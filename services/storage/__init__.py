@@ -0,0 +1,5 @@
+from .job_journal import JobJournal, JournalRecovery
+from .save_scheduler import SaveScheduler
+from .word_store import WordStore
+
+__all__ = ["JobJournal", "JournalRecovery", "SaveScheduler", "WordStore"]
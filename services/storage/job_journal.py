@@ -0,0 +1,274 @@
+import glob
+import json
+import os
+import threading
+import time
+from typing import Dict, List, NamedTuple, Optional, Tuple
+
+from base import QObjectBase, QSingleton
+from utils.files import PathManager
+
+
+class JournalRecovery(NamedTuple):
+    """
+    What startup recovery found in the journal.
+
+    Attributes:
+        results (List[Tuple[str, dict]]): The stage and word row of every word a stage
+            finished with, in the order they finished.
+        interrupted (Dict[str, dict]): The stages whose last run never finished, with
+            the options the run was started with.
+        removed_files (List[str]): Partly written files that were deleted.
+        in_flight (Dict[str, List[str]]): The guids each interrupted stage started
+            without recording a result. Their work may have been done.
+    """
+
+    results: List[Tuple[str, dict]]
+    interrupted: Dict[str, dict]
+    removed_files: List[str]
+    in_flight: Dict[str, List[str]]
+
+
+class JobJournal(QObjectBase, metaclass=QSingleton):
+    """
+    Append-only journal of the define, audio and sync runs.
+
+    The workers record when a run starts and finishes and when each word is started,
+    completed or failed. Completed and failed words carry the word's row. Every record
+    is one JSON line, flushed as soon as it is written, so the journal survives the app
+    quitting at any point. The words database is only written behind the workers.
+
+    At startup `recover` replays the journal. It returns the word results that may not
+    have reached the database, the stages that were interrupted and the words they had
+    started without a result, and it deletes the temporary files interrupted audio
+    runs left behind. Once the results are saved, `compact` drops everything except
+    the interrupted runs and their started words.
+
+    Attributes:
+        path (str): Location of the journal file.
+    """
+
+    def __init__(self, path: Optional[str] = None):
+        super().__init__()
+        self.path = path or PathManager.app_data_path("jobs.journal")
+        self._lock = threading.Lock()
+        self._file = open(self.path, "a", encoding="utf-8")
+        if self._file.tell() and not self._ends_with_newline():
+            # end a line cut short by a crash, so the next record starts clean
+            self._file.write("\n")
+            self._file.flush()
+
+    def _ends_with_newline(self) -> bool:
+        with open(self.path, "rb") as file:
+            file.seek(-1, os.SEEK_END)
+            return file.read(1) == b"\n"
+
+    def _append(self, record: dict) -> None:
+        record["time"] = time.time()
+        line = json.dumps(record, ensure_ascii=False)
+        with self._lock:
+            self._file.write(line + "\n")
+            self._file.flush()
+
+    def run_started(self, stage: str, **options) -> None:
+        """
+        Records that a stage run started.
+
+        Args:
+            stage (str): "define", "audio" or "sync".
+            **options: Values recovery needs, e.g. the audio folder.
+
+        Returns:
+            None: This function does not return a value.
+        """
+        self._append({"event": "run_started", "stage": stage, "options": options})
+
+    def run_finished(self, stage: str) -> None:
+        """
+        Records that a stage run finished.
+
+        Args:
+            stage (str): The stage.
+
+        Returns:
+            None: This function does not return a value.
+        """
+        self._append({"event": "run_finished", "stage": stage})
+
+    def started(self, stage: str, guid: str) -> None:
+        """
+        Records that a stage started working on a word.
+
+        Args:
+            stage (str): The stage.
+            guid (str): The word's guid.
+
+        Returns:
+            None: This function does not return a value.
+        """
+        self._append({"event": "started", "stage": stage, "guid": guid})
+
+    def completed(self, stage: str, row: dict) -> None:
+        """
+        Records that a stage is done with a word.
+
+        Args:
+            stage (str): The stage.
+            row (dict): The word's storage row after the stage.
+
+        Returns:
+            None: This function does not return a value.
+        """
+        self._append(
+            {"event": "completed", "stage": stage, "guid": row["guid"], "row": row}
+        )
+
+    def failed(
+        self, stage: str, guid: str, error: str = "", row: Optional[dict] = None
+    ) -> None:
+        """
+        Records that a stage failed a word. Words failed with a row were moved to an
+        error status; words failed without one stay queued for the stage.
+
+        Args:
+            stage (str): The stage.
+            guid (str): The word's guid.
+            error (str, optional): What went wrong.
+            row (dict, optional): The word's storage row after the stage.
+
+        Returns:
+            None: This function does not return a value.
+        """
+        self._append(
+            {
+                "event": "failed",
+                "stage": stage,
+                "guid": guid,
+                "error": error,
+                "row": row,
+            }
+        )
+
+    def records(self) -> List[dict]:
+        """
+        Reads the journal. A line cut short by a crash is skipped.
+
+        Returns:
+            List[dict]: The records, oldest first.
+        """
+        records = []
+        with self._lock:
+            self._file.flush()
+            with open(self.path, "r", encoding="utf-8") as file:
+                for line in file:
+                    try:
+                        records.append(json.loads(line))
+                    except json.JSONDecodeError:
+                        continue
+        return records
+
+    def recover(self) -> JournalRecovery:
+        """
+        Replays the journal after a start.
+
+        Returns:
+            JournalRecovery: The word results, the interrupted stages and the files
+                that were cleaned up.
+        """
+        results = []
+        runs: Dict[str, Optional[dict]] = {}
+        started: Dict[str, Dict[str, None]] = {}
+        for record in self.records():
+            event = record.get("event")
+            if event == "run_started":
+                runs[record["stage"]] = record.get("options") or {}
+            elif event == "run_finished":
+                runs[record["stage"]] = None
+                started.pop(record["stage"], None)
+            elif event == "started":
+                started.setdefault(record["stage"], {})[record["guid"]] = None
+            elif event in ["completed", "failed"]:
+                started.get(record["stage"], {}).pop(record["guid"], None)
+                if record.get("row"):
+                    results.append((record["stage"], record["row"]))
+
+        interrupted = {
+            stage: options for stage, options in runs.items() if options is not None
+        }
+        in_flight = {
+            stage: list(guids)
+            for stage, guids in started.items()
+            if guids and stage in interrupted
+        }
+        removed_files = []
+        folder = (interrupted.get("audio") or {}).get("folder")
+        if folder:
+            removed_files = self.remove_partial_files(folder)
+        return JournalRecovery(results, interrupted, removed_files, in_flight)
+
+    def remove_partial_files(self, folder: str) -> List[str]:
+        """
+        Deletes the temporary files of writes that never finished in a folder.
+
+        Args:
+            folder (str): The folder.
+
+        Returns:
+            List[str]: The deleted files.
+        """
+        removed = []
+        pattern = os.path.join(glob.escape(folder), f"*{PathManager.PART_SUFFIX}")
+        for path in glob.glob(pattern):
+            try:
+                os.remove(path)
+                removed.append(path)
+            except OSError as e:
+                self.logging(f"Could not remove partial file {path}: {e}", "WARN")
+        return removed
+
+    def compact(self) -> None:
+        """
+        Rewrites the journal with only the start of the runs that never finished and
+        the words they started without a result. Call it once the word results have
+        been saved.
+
+        Returns:
+            None: This function does not return a value.
+        """
+        runs = {}
+        started: Dict[str, Dict[str, dict]] = {}
+        for record in self.records():
+            event = record.get("event")
+            if event == "run_started":
+                runs[record["stage"]] = record
+            elif event == "run_finished":
+                runs.pop(record["stage"], None)
+                started.pop(record["stage"], None)
+            elif event == "started":
+                started.setdefault(record["stage"], {})[record["guid"]] = record
+            elif event in ["completed", "failed"]:
+                started.get(record["stage"], {}).pop(record["guid"], None)
+        kept = list(runs.values())
+        for stage in runs:
+            kept.extend(started.get(stage, {}).values())
+
+        with self._lock:
+            self._file.close()
+            temp_path = self.path + PathManager.PART_SUFFIX
+            with open(temp_path, "w", encoding="utf-8") as file:
+                for record in kept:
+                    file.write(json.dumps(record, ensure_ascii=False) + "\n")
+                file.flush()
+                os.fsync(file.fileno())
+            os.replace(temp_path, self.path)
+            self._file = open(self.path, "a", encoding="utf-8")
+
+    def close(self) -> None:
+        """
+        Closes the journal file.
+
+        Returns:
+            None: This function does not return a value.
+        """
+        with self._lock:
+            self._file.close()
@@ -0,0 +1,101 @@
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Optional, Tuple
+
+from PySide6.QtCore import QTimer, Slot
+
+from base import QObjectBase
+
+
+class SaveScheduler(QObjectBase):
+    """
+    Write-behind save scheduler that merges bursts of save requests into one write.
+
+    A save request only marks the data dirty. Requests are merged until `window_ms`
+    passes without a flush or `max_pending` requests have piled up. The flush takes an
+    immutable snapshot of the changes on the calling (GUI) thread and writes it on a
+    single background thread, so writes stay ordered and never block the GUI.
+
+    Attributes:
+        collect (Callable): Returns the snapshot to write, or None if nothing changed.
+        write (Callable): Writes a snapshot. Runs on the background thread.
+        window_ms (int): Milliseconds to wait for more requests before flushing.
+        max_pending (int): Number of requests that trigger an immediate flush.
+    """
+
+    def __init__(
+        self,
+        collect: Callable[[], Optional[Tuple[Any, ...]]],
+        write: Callable[..., None],
+        window_ms: int = 250,
+        max_pending: int = 50,
+    ):
+        """
+        Initializes the scheduler.
+
+        Args:
+            collect (Callable): Returns the snapshot to write, or None if nothing changed.
+            write (Callable): Writes a snapshot, called with the snapshot's items as arguments.
+            window_ms (int, optional): Merge window in milliseconds. Defaults to 250.
+            max_pending (int, optional): Requests that force a flush. Defaults to 50.
+        """
+        super().__init__()
+        self.collect = collect
+        self.write = write
+        self.window_ms = window_ms
+        self.max_pending = max(1, max_pending)
+        self._pending = 0
+        self._last_write: Optional[Future] = None
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="save")
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.setInterval(window_ms)
+        self._timer.timeout.connect(self.flush)
+
+    @Slot()
+    def request(self) -> None:
+        """
+        Marks the data dirty and schedules a flush.
+
+        Returns:
+            None: This function does not return a value.
+        """
+        self._pending += 1
+        if self._pending >= self.max_pending:
+            self.flush()
+        elif not self._timer.isActive():
+            self._timer.start()
+
+    @Slot()
+    def flush(self, wait: bool = False) -> None:
+        """
+        Writes the pending changes now.
+
+        Args:
+            wait (bool, optional): Block until every write has finished. Defaults to False.
+
+        Returns:
+            None: This function does not return a value.
+        """
+        self._timer.stop()
+        self._pending = 0
+        snapshot = self.collect()
+        if snapshot is not None:
+            self._last_write = self._executor.submit(self._write, snapshot)
+        if wait:
+            self.wait()
+
+    def wait(self) -> None:
+        """
+        Blocks until the writes already handed to the background thread have finished.
+
+        Returns:
+            None: This function does not return a value.
+        """
+        if self._last_write is not None:
+            self._last_write.result()
+
+    def _write(self, snapshot) -> None:
+        try:
+            self.write(*snapshot)
+        except Exception as e:
+            self.logging(f"Error saving words: {e}", "ERROR")
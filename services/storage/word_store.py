@@ -0,0 +1,144 @@
+import sqlite3
+import threading
+from typing import Dict, Iterable, List, Optional
+
+from utils.files import PathManager
+
+FIELDS = [
+    "status",
+    "guid",
+    "word",
+    "definition",
+    "audio",
+    "audio_path",
+    "synonyms",
+    "example",
+]
+
+
+class WordStore:
+    """
+    SQLite storage for the words library, one row per word.
+
+    The database runs in WAL mode, so each add, update, status change or delete is a
+    single row upsert or delete that doesn't block readers. Rows are read back in the
+    order the words were first stored, either all at once or only the rows with some
+    statuses, so a library can be loaded one status at a time.
+
+    Rows are plain dicts with the WordModel field names. The status is stored by name.
+
+    Attributes:
+        db_path (str): Location of the SQLite database.
+    """
+
+    def __init__(self, db_path: Optional[str] = None):
+        """
+        Opens (and creates if needed) the words database.
+
+        Args:
+            db_path (str, optional): Location of the database. Defaults to the app data directory.
+        """
+        self.db_path = db_path or PathManager.app_data_path("words.db")
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.db_path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS words (
+                guid TEXT PRIMARY KEY,
+                status TEXT NOT NULL,
+                word TEXT NOT NULL,
+                definition TEXT NOT NULL,
+                audio TEXT NOT NULL,
+                audio_path TEXT NOT NULL,
+                synonyms TEXT NOT NULL,
+                example TEXT NOT NULL
+            )
+            """
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS words_status ON words (status)")
+        self._conn.commit()
+
+    def load(self, statuses: Optional[Iterable[str]] = None) -> List[Dict[str, str]]:
+        """
+        Reads the stored words, or only the words with some statuses.
+
+        Args:
+            statuses (Iterable[str], optional): Status names to read. Defaults to every
+                status.
+
+        Returns:
+            List[dict]: The rows, in the order the words were first stored.
+        """
+        query = f"SELECT {', '.join(FIELDS)} FROM words"
+        params = []
+        if statuses is not None:
+            params = list(statuses)
+            query += f" WHERE status IN ({', '.join('?' for _ in params)})"
+        with self._lock:
+            rows = self._conn.execute(query + " ORDER BY rowid", params).fetchall()
+        return [dict(zip(FIELDS, row)) for row in rows]
+
+    def status_of(self, guid: str) -> Optional[str]:
+        """
+        Reads the stored status of a word.
+
+        Args:
+            guid (str): The guid of the word.
+
+        Returns:
+            Optional[str]: The status name, or None if the word isn't stored.
+        """
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT status FROM words WHERE guid = ?", (guid,)
+            ).fetchone()
+        return row[0] if row else None
+
+    def is_empty(self) -> bool:
+        """
+        Checks if no words are stored.
+
+        Returns:
+            bool: True if the database has no words.
+        """
+        with self._lock:
+            return self._conn.execute("SELECT 1 FROM words LIMIT 1").fetchone() is None
+
+    def save(self, rows: Iterable[Dict[str, str]], deleted: Iterable[str] = ()) -> None:
+        """
+        Upserts the changed rows and deletes the removed guids in one transaction.
+
+        Args:
+            rows (Iterable[dict]): The rows to insert or update.
+            deleted (Iterable[str], optional): Guids of the words to delete. Defaults to none.
+
+        Returns:
+            None: This function does not return a value.
+        """
+        values = [tuple(str(row[field]) for field in FIELDS) for row in rows]
+        deleted = [(guid,) for guid in deleted]
+        if not values and not deleted:
+            return
+        updates = ", ".join(f"{field} = excluded.{field}" for field in FIELDS[2:])
+        with self._lock:
+            with self._conn:
+                self._conn.executemany(
+                    f"INSERT INTO words ({', '.join(FIELDS)}) "
+                    f"VALUES ({', '.join('?' for _ in FIELDS)}) "
+                    f"ON CONFLICT(guid) DO UPDATE SET status = excluded.status, {updates}",
+                    values,
+                )
+                self._conn.executemany("DELETE FROM words WHERE guid = ?", deleted)
+
+    def clear(self) -> None:
+        """
+        Deletes every stored word.
+
+        Returns:
+            None: This function does not return a value.
+        """
+        with self._lock:
+            with self._conn:
+                self._conn.execute("DELETE FROM words")
@@ -1,12 +1,18 @@
 import os
+import platform
 
 
 class PathManager:
     """
     A utility class to manage file and directory paths. It includes methods for checking
     if paths exist, creating directories, handling duplicates, and parsing file paths.
+
+    Attributes:
+        PART_SUFFIX (str): Suffix of files that are still being written.
     """
 
+    PART_SUFFIX = ".part"
+
     @staticmethod
     def path_exists(path: str, makepath: bool, raiseError: bool = False) -> bool:
         """
@@ -82,3 +88,51 @@ class PathManager:
                 count += 1
             path = newpath
         return path
+
+    @staticmethod
+    def app_data_path(*parts: str) -> str:
+        """
+        Returns a path inside the per-user application data directory, creating the
+        directory if it doesn't exist.
+
+        Args:
+            *parts (str): Path components to join onto the application data directory.
+
+        Returns:
+            str: The joined path.
+        """
+        current_os = platform.system()
+        if current_os == "Darwin":
+            base = os.path.expanduser("~/Library/Application Support")
+        elif current_os == "Windows":
+            base = os.environ.get("APPDATA", os.path.expanduser("~"))
+        else:
+            base = os.environ.get("XDG_DATA_HOME", os.path.expanduser("~/.local/share"))
+        app_dir = os.path.join(base, "EnglishDict")
+        PathManager.path_exists(app_dir, True)
+        return os.path.join(app_dir, *parts)
+
+    @staticmethod
+    def write_atomic(path: str, content: bytes) -> None:
+        """
+        Writes a file so it is either complete or not there at all. The content goes to
+        a temporary file next to it, which is renamed once it is on disk.
+
+        Args:
+            path (str): The file to write.
+            content (bytes): The content.
+
+        Returns:
+            None: This function does not return a value.
+        """
+        temp_path = path + PathManager.PART_SUFFIX
+        try:
+            with open(temp_path, "wb") as out:
+                out.write(content)
+                out.flush()
+                os.fsync(out.fileno())
+            os.replace(temp_path, path)
+        except OSError:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+            raise
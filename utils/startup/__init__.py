@@ -0,0 +1,3 @@
+from .startup_timer import StartupTimer
+
+__all__ = ["StartupTimer"]
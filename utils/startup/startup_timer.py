@@ -0,0 +1,153 @@
+import importlib.abc
+import sys
+import threading
+import time
+from typing import List, Tuple
+
+
+class _TimedLoader(importlib.abc.Loader):
+    """Wraps a module loader and records how long executing the module takes."""
+
+    def __init__(self, loader, name: str):
+        self._loader = loader
+        self._name = name
+
+    def create_module(self, spec):
+        return self._loader.create_module(spec)
+
+    def exec_module(self, module) -> None:
+        StartupTimer._begin_import()
+        start = time.perf_counter()
+        try:
+            self._loader.exec_module(module)
+        finally:
+            StartupTimer._end_import(self._name, time.perf_counter() - start)
+
+    def __getattr__(self, name):
+        # resource readers and other loader features keep working
+        return getattr(self._loader, name)
+
+
+class _TimedFinder(importlib.abc.MetaPathFinder):
+    """Finds modules with the other finders and wraps their loaders for timing."""
+
+    def find_spec(self, fullname, path, target=None):
+        if getattr(StartupTimer._local, "finding", False):
+            return None
+        StartupTimer._local.finding = True
+        try:
+            for finder in sys.meta_path:
+                if finder is self or not hasattr(finder, "find_spec"):
+                    continue
+                spec = finder.find_spec(fullname, path, target)
+                if spec is not None:
+                    break
+            else:
+                return None
+        finally:
+            StartupTimer._local.finding = False
+        if spec.loader is not None and hasattr(spec.loader, "exec_module"):
+            spec.loader = _TimedLoader(spec.loader, fullname)
+        return spec
+
+
+class StartupTimer:
+    """
+    Records how long the application takes to start.
+
+    `mark` records named checkpoints measured from when this module was imported, so it
+    should be imported before anything else. `enable_import_timing` additionally times
+    every module import from then on, like `python -X importtime`, so the slowest
+    imports can be listed in the report.
+    """
+
+    _started = time.perf_counter()
+    _marks: List[Tuple[str, float]] = []
+    _imports: List[Tuple[str, float, float]] = []
+    _finder = None
+    _local = threading.local()
+
+    @classmethod
+    def mark(cls, name: str) -> None:
+        """
+        Records a checkpoint.
+
+        Args:
+            name (str): Name of the checkpoint.
+
+        Returns:
+            None: This function does not return a value.
+        """
+        cls._marks.append((name, time.perf_counter() - cls._started))
+
+    @classmethod
+    def enable_import_timing(cls) -> None:
+        """
+        Starts timing every module import.
+
+        Returns:
+            None: This function does not return a value.
+        """
+        if cls._finder is None:
+            cls._finder = _TimedFinder()
+            sys.meta_path.insert(0, cls._finder)
+
+    @classmethod
+    def disable_import_timing(cls) -> None:
+        """
+        Stops timing module imports.
+
+        Returns:
+            None: This function does not return a value.
+        """
+        if cls._finder is not None:
+            sys.meta_path.remove(cls._finder)
+            cls._finder = None
+
+    @classmethod
+    def _begin_import(cls) -> None:
+        stack = getattr(cls._local, "stack", None)
+        if stack is None:
+            stack = cls._local.stack = []
+        stack.append(0.0)
+
+    @classmethod
+    def _end_import(cls, name: str, elapsed: float) -> None:
+        stack = cls._local.stack
+        children = stack.pop()
+        if stack:
+            stack[-1] += elapsed
+        cls._imports.append((name, elapsed - children, elapsed))
+
+    @classmethod
+    def report(cls, limit: int = 15) -> List[str]:
+        """
+        Builds the startup report: the time between checkpoints and, if import timing
+        is on, the slowest imports by cumulative time.
+
+        Args:
+            limit (int, optional): Number of imports to list. Defaults to 15.
+
+        Returns:
+            List[str]: The report lines.
+        """
+        lines = []
+        previous = 0.0
+        for name, at in cls._marks:
+            lines.append(
+                f"Startup: {name} at {at * 1000:.0f} ms "
+                f"(+{(at - previous) * 1000:.0f} ms)"
+            )
+            previous = at
+        if cls._imports:
+            lines.append(
+                f"Startup: {len(cls._imports)} modules imported in "
+                f"{sum(own for _, own, _ in cls._imports) * 1000:.0f} ms"
+            )
+            slowest = sorted(cls._imports, key=lambda item: item[2], reverse=True)
+            for name, own, cumulative in slowest[:limit]:
+                lines.append(
+                    f"Import time: self {own * 1000:7.1f} ms | "
+                    f"cumulative {cumulative * 1000:7.1f} ms | {name}"
+                )
+        return lines
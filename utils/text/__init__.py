@@ -0,0 +1,3 @@
+from .headword import normalize_headword
+
+__all__ = ["normalize_headword"]
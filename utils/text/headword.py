@@ -0,0 +1,11 @@
+def normalize_headword(word: str) -> str:
+    """
+    Normalizes a headword so different spellings of the same word compare equal.
+
+    Args:
+        word (str): The word as entered by the user.
+
+    Returns:
+        str: The lower cased word with surrounding and repeated whitespace removed.
+    """
+    return " ".join(str(word).strip().lower().split())
@@ -1,8 +1,9 @@
-from PySide6.QtCore import Qt, Signal, Slot
+from PySide6.QtCore import Qt, QTimer, Signal, Slot
 from PySide6.QtGui import QLinearGradient, QPainter, QPaintEvent
 from PySide6.QtWidgets import QGridLayout, QWidget
 
 from base import QWidgetBase
+from utils.startup import StartupTimer
 
 from ..main_screen import MainScreen
 from ..navbars import HeaderNavBar, IconOnlyNavBar, IconTextNavBar
@@ -12,9 +13,11 @@ class CentralWidget(QWidgetBase):
     close_main_window = Signal()
     start_import = Signal()
     close_main_window = Signal(int)
+    first_paint = Signal()
 
     def __init__(self):
         super().__init__()
+        self.painted = False
         self.setAttribute(Qt.WA_StyledBackground, True)
         # self.setStyleSheet("background-color: gray;")
         # main_layout = QVBoxLayout(self)
@@ -57,6 +60,7 @@ class CentralWidget(QWidgetBase):
         self.main_screen_widget.page_changed.connect(self.page_changed)
         self.main_screen_widget.force_update.connect(self.update_paint)
         self.start_import.connect(self.main_screen_widget.start_import)
+        self.first_paint.connect(self.main_screen_widget.load_settings)
 
     def paintEvent(self, event: QPaintEvent) -> None:
         """
@@ -76,6 +80,11 @@ class CentralWidget(QWidgetBase):
         gradient.setColorAt(1, "#003366")
         painter.setBrush(gradient)
         painter.drawRect(self.rect())
+        if not self.painted:
+            # let the rest of the first frame paint before starting deferred work
+            self.painted = True
+            StartupTimer.mark("first paint")
+            QTimer.singleShot(0, self.first_paint.emit)
 
     def page_changed(self, index):
         match index:
@@ -1,9 +1,30 @@
+from functools import partial
+
 from PySide6.QtCore import Signal, Slot
-from PySide6.QtWidgets import QPushButton
+from PySide6.QtWidgets import QPushButton, QWidget
 
 from base import QWidgetBase
+from core import PipelineOrchestrator
+from models import WordsModel
+from utils.startup import StartupTimer
+
+from .main_screen_ui import PAGES, MainScreenView
 
-from .main_screen_ui import MainScreenView
+# page and method that starts each stage's run
+STAGE_STARTS = {
+    "define": ("define_page", "start_define_words"),
+    "audio": ("audio_page", "start_audio_words"),
+    "sync": ("sync_page", "start_sync_words"),
+}
+
+# settings page signal for each page's receive_settings_update
+PAGE_SETTINGS_SIGNALS = {
+    "import_page": "import_page_settings",
+    "define_page": "define_page_settings",
+    "audio_page": "audio_page_settings",
+    "sync_page": "sync_page_settings",
+    "logs_page": "log_page_settings",
+}
 
 
 class MainScreen(QWidgetBase):
@@ -29,6 +50,10 @@ class MainScreen(QWidgetBase):
     def __init__(self):
         """
         Initializes the MainScreen, sets up the UI, and connects signals for handling page changes and app shutdown.
+
+        Pages other than the import page are built on first navigation. The settings
+        page is built once the window has painted, and the settings it sends are kept
+        so pages built later still receive them.
         """
         super().__init__()
         self.ui = MainScreenView()
@@ -36,47 +61,131 @@ class MainScreen(QWidgetBase):
         self.setLayout(self.layout)
 
         self.setObjectName("main_screen")
+        self.page_settings = {}
+        self.pipeline = PipelineOrchestrator()
+        self.pipeline.start_stage.connect(self.start_stage)
 
-        self.ui.import_page.start_defining_words.connect(
-            self.ui.define_page.start_define_words
-        )
-        self.ui.import_page.start_defining_words.connect(self.int_change_page)
-        self.ui.define_page.start_audio_for_words.connect(self.int_change_page)
-        self.ui.define_page.start_audio_for_words.connect(
-            self.ui.audio_page.start_audio_words
-        )
-        self.ui.audio_page.start_sync_for_words.connect(self.int_change_page)
-        self.ui.audio_page.start_sync_for_words.connect(
-            self.ui.sync_page.start_sync_words
-        )
-
-        self.ui.settings_page.import_page_settings.connect(
-            self.ui.import_page.receive_settings_update
-        )
-        self.ui.settings_page.audio_page_settings.connect(
-            self.ui.audio_page.receive_settings_update
-        )
-        self.ui.settings_page.sync_page_settings.connect(
-            self.ui.sync_page.receive_settings_update
-        )
-
-        self.ui.settings_page.log_page_settings.connect(
-            self.ui.logs_page.receive_settings_update
-        )
-        self.ui.settings_page.define_page_settings.connect(
-            self.ui.define_page.receive_settings_update
-        )
-
-        self.appshutdown.connect(self.ui.import_page.notified_app_shutting)
-        self.appshutdown.connect(self.ui.define_page.notified_app_shutting)
-        self.appshutdown.connect(self.ui.audio_page.notified_app_shutting)
-        self.appshutdown.connect(self.ui.sync_page.notified_app_shutting)
+        self.wire_page("import_page", self.ui.import_page)
         self.start_import.connect(self.ui.import_page.import_words_from_apple_notes)
-        self.send_app_settings.connect(self.ui.settings_page.send_all_settings)
+
+    @Slot()
+    def load_settings(self) -> None:
+        """
+        Builds the settings page and has it send the settings to the pages, then
+        resumes the runs that were cut short when the app last quit.
+
+        Returns:
+            None: This function does not return a value.
+        """
+        settings_page = self.page("settings_page")
+        self.send_app_settings.connect(settings_page.send_all_settings)
         self.send_app_settings.emit()
+        StartupTimer.mark("settings loaded")
+        self.resume_interrupted_stages()
+
+    def resume_interrupted_stages(self) -> None:
+        """
+        Starts again every stage whose run was interrupted, according to the job
+        journal. The stages only pick up the words still waiting for them.
+
+        Returns:
+            None: This function does not return a value.
+        """
+        for stage in WordsModel().interrupted_stages:
+            self.logging(f"Resuming the interrupted {stage} run")
+            self.start_stage(stage)
+        WordsModel().interrupted_stages = {}
+
+    @Slot(str)
+    def start_stage(self, stage: str) -> None:
+        """
+        Starts a stage's run on its page, building the page if needed.
+
+        Args:
+            stage (str): "define", "audio" or "sync".
+
+        Returns:
+            None: This function does not return a value.
+        """
+        page_name, method = STAGE_STARTS[stage]
+        getattr(self.page(page_name), method)()
+
+    def page(self, name: str) -> QWidget:
+        """
+        Returns a page, building and wiring it up the first time it is needed.
+
+        Args:
+            name (str): The page attribute name, e.g. "define_page".
+
+        Returns:
+            QWidget: The page.
+        """
+        page = self.ui.built_page(name)
+        if page is None:
+            page = self.ui.build_page(name)
+            self.wire_page(name, page)
+        return page
+
+    def wire_page(self, name: str, page: QWidget) -> None:
+        """
+        Connects a newly built page to the main screen and sends it the last settings
+        it missed.
+
+        Args:
+            name (str): The page attribute name.
+            page (QWidget): The page.
+
+        Returns:
+            None: This function does not return a value.
+        """
+        match name:
+            case "import_page":
+                page.start_defining_words.connect(self.start_defining_words)
+            case "define_page":
+                page.start_audio_for_words.connect(self.start_audio_for_words)
+            case "audio_page":
+                page.start_sync_for_words.connect(self.start_sync_for_words)
+            case "settings_page":
+                for page_name, signal_name in PAGE_SETTINGS_SIGNALS.items():
+                    getattr(page, signal_name).connect(
+                        partial(self.route_page_settings, page_name)
+                    )
+                page.pipeline_settings.connect(self.pipeline.receive_settings_update)
+        if name in ["import_page", "define_page", "audio_page", "sync_page"]:
+            self.appshutdown.connect(page.notified_app_shutting)
+        if name in self.page_settings:
+            page.receive_settings_update(*self.page_settings[name])
+
+    def route_page_settings(self, name: str, *settings) -> None:
+        """
+        Keeps the latest settings for a page and passes them on if it is built.
+
+        Args:
+            name (str): The page attribute name.
+            *settings: The values the settings page emitted.
+
+        Returns:
+            None: This function does not return a value.
+        """
+        self.page_settings[name] = settings
+        page = self.ui.built_page(name)
+        if page is not None:
+            page.receive_settings_update(*settings)
+
+    def start_defining_words(self, index):
+        self.int_change_page(index)
+        self.page("define_page").start_define_words()
+
+    def start_audio_for_words(self, index):
+        self.int_change_page(index)
+        self.page("audio_page").start_audio_words()
+
+    def start_sync_for_words(self, index):
+        self.int_change_page(index)
+        self.page("sync_page").start_sync_words()
 
     def int_change_page(self, index):
-        print(index)
+        self.page(PAGES[index])
         self.ui.stackedWidget.setCurrentIndex(index)
         self.page_changed.emit(index)
 
@@ -94,17 +203,30 @@ class MainScreen(QWidgetBase):
         btn_name = btn.objectName()
 
         if btn_name.startswith("import_btn_"):
-            self.ui.stackedWidget.setCurrentIndex(0)
+            self.show_page(0)
         elif btn_name.startswith("define_btn_"):
-            self.ui.stackedWidget.setCurrentIndex(1)
+            self.show_page(1)
         elif btn_name.startswith("audio_btn_"):
-            self.ui.stackedWidget.setCurrentIndex(2)
+            self.show_page(2)
         elif btn_name.startswith("export_btn_"):
-            self.ui.stackedWidget.setCurrentIndex(3)
+            self.show_page(3)
         elif btn_name.startswith("logs_btn_"):
-            self.ui.stackedWidget.setCurrentIndex(4)
+            self.show_page(4)
         elif btn_name.startswith("settings_btn_"):
-            self.ui.stackedWidget.setCurrentIndex(5)
+            self.show_page(5)
         elif btn_name.startswith("signout_btn"):
             self.close_main_window.emit(self.ui.stackedWidget.currentIndex())
         self.force_update.emit()
+
+    def show_page(self, index: int) -> None:
+        """
+        Builds the page at the index if needed and shows it.
+
+        Args:
+            index (int): The page index in the stacked widget.
+
+        Returns:
+            None: This function does not return a value.
+        """
+        self.page(PAGES[index])
+        self.ui.stackedWidget.setCurrentIndex(index)
@@ -1,14 +1,27 @@
+from typing import Optional
+
 from PySide6.QtCore import QSize
 from PySide6.QtWidgets import QSizePolicy, QStackedWidget, QVBoxLayout, QWidget
 
-from views.pages import (
-    AudioPage,
-    DefinePage,
-    ImportPage,
-    LogsPage,
-    SettingsPage,
-    SyncPage,
-)
+import views.pages
+
+# stacked widget order
+PAGES = [
+    "import_page",
+    "define_page",
+    "audio_page",
+    "sync_page",
+    "logs_page",
+    "settings_page",
+]
+PAGE_CLASSES = {
+    "import_page": "ImportPage",
+    "define_page": "DefinePage",
+    "audio_page": "AudioPage",
+    "sync_page": "SyncPage",
+    "logs_page": "LogsPage",
+    "settings_page": "SettingsPage",
+}
 
 
 class MainScreenView(QWidget):
@@ -16,6 +29,9 @@ class MainScreenView(QWidget):
     MainScreenView is the view component for the main screen. It manages the UI layout
     and holds different pages like login, rules, settings, and logs using QStackedWidget.
 
+    Only the import page is built up front. The other pages start as empty placeholders
+    and are built by `build_page` the first time they are needed.
+
     Attributes:
         main_screen_container_v (QVBoxLayout): The vertical layout that holds the stacked widget.
         stackedWidget (QStackedWidget): The stacked widget for switching between pages.
@@ -49,20 +65,46 @@ class MainScreenView(QWidget):
         # Stacked widget to hold multiple pages
         self.stackedWidget = QStackedWidget(self)
         self.stackedWidget.setObjectName("main_screen_stacked")
-        # Pages
-        self.import_page = ImportPage()
-        self.define_page = DefinePage()
-        self.audio_page = AudioPage()
-        self.sync_page = SyncPage()
-        self.settings_page = SettingsPage()
-        self.logs_page = LogsPage()
-        # Add pages to stacked widget
-        self.stackedWidget.addWidget(self.import_page)
-        self.stackedWidget.addWidget(self.define_page)
-        self.stackedWidget.addWidget(self.audio_page)
-        self.stackedWidget.addWidget(self.sync_page)
-        self.stackedWidget.addWidget(self.logs_page)
-        self.stackedWidget.addWidget(self.settings_page)
+        # Pages start as placeholders and are built on first use
+        for name in PAGES:
+            setattr(self, name, None)
+            placeholder = QWidget()
+            placeholder.setObjectName(f"{name}_placeholder")
+            self.stackedWidget.addWidget(placeholder)
         # Add the stacked widget to the main layout
         self.main_screen_container_v.addWidget(self.stackedWidget)
+        self.build_page("import_page")
         self.stackedWidget.setCurrentIndex(0)
+
+    def built_page(self, name: str) -> Optional[QWidget]:
+        """
+        Returns a page if it has been built.
+
+        Args:
+            name (str): The page attribute name, e.g. "define_page".
+
+        Returns:
+            Optional[QWidget]: The page, or None if it hasn't been built yet.
+        """
+        return getattr(self, name)
+
+    def build_page(self, name: str) -> QWidget:
+        """
+        Builds a page and swaps it in for its placeholder in the stacked widget.
+
+        Args:
+            name (str): The page attribute name, e.g. "define_page".
+
+        Returns:
+            QWidget: The new page.
+        """
+        page = getattr(views.pages, PAGE_CLASSES[name])()
+        index = PAGES.index(name)
+        current = self.stackedWidget.currentIndex()
+        placeholder = self.stackedWidget.widget(index)
+        self.stackedWidget.removeWidget(placeholder)
+        placeholder.deleteLater()
+        self.stackedWidget.insertWidget(index, page)
+        self.stackedWidget.setCurrentIndex(current)
+        setattr(self, name, page)
+        return page
@@ -8,9 +8,9 @@ from PySide6.QtWidgets import (
 )
 
 from components.helpers import StyleHelper, WidgetFactory
+from resources import load_resources
 
-# trunk-ignore(ruff/F401)
-from resources import resources_rc
+load_resources()
 
 
 class IconTextNavBarView(QWidget):
@@ -13,8 +13,9 @@ from PySide6.QtWidgets import (
 )
 
 from components.dialogs import ConfirmationDialog
+from models import WordsModel
 from services.logger import Logger
-from services.server import FlaskWorker
+from utils.startup import StartupTimer
 from views.layout import CentralWidget
 
 
@@ -29,6 +30,7 @@ class MainWindow(QMainWindow):
         super().__init__()
         self.prog_close_applications = False
         self.trigger_server_stop = False
+        self.server_thread = None
         self.app = app
         self.setWindowTitle("English Dictionary")
         self.setObjectName("MainWindow")
@@ -86,10 +88,26 @@ class MainWindow(QMainWindow):
         tray_icon.show()
 
         tray_icon.activated.connect(self.on_tray_icon_click)
-        self.start_server()
+        self.centralWidget.first_paint.connect(self.startup_finished)
         self.app.instance().aboutToQuit.connect(self.cleanup_server)
 
+    @Slot()
+    def startup_finished(self) -> None:
+        """
+        Starts the server once the window has painted and logs the startup report.
+
+        Returns:
+            None: This function does not return a value.
+        """
+        self.start_server()
+        StartupTimer.mark("server started")
+        StartupTimer.disable_import_timing()
+        for line in StartupTimer.report():
+            self.logging(line)
+
     def start_server(self):
+        from services.server import FlaskWorker
+
         self.server_thread = QThread(self)
         self.flask_worker = FlaskWorker()
         self.flask_worker.moveToThread(self.server_thread)
@@ -101,6 +119,8 @@ class MainWindow(QMainWindow):
         self.server_thread.start()
 
     def cleanup_server(self):
+        if self.server_thread is None:
+            return
         if not self.trigger_server_stop:
             self.stop_server.emit()
             self.trigger_server_stop = True
@@ -184,6 +204,7 @@ class MainWindow(QMainWindow):
                 event.ignore()
 
     def close_application_process(self):
+        WordsModel().flush_words()
         self.cleanup_server()
         self.appshutdown.emit()
         self.send_logs.emit("Closing Application", "INFO", True)
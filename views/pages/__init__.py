@@ -1,9 +1,15 @@
-from .audio_page import AudioPage
-from .define_page import DefinePage
-from .import_page import ImportPage
-from .log_page import LogsPage
-from .settings_page import SettingsPage
-from .sync_page import SyncPage
+import importlib
+
+# Pages are built the first time they are shown, so their modules (and the workers
+# they import) are only loaded then.
+_exports = {
+    "AudioPage": ".audio_page",
+    "DefinePage": ".define_page",
+    "ImportPage": ".import_page",
+    "LogsPage": ".log_page",
+    "SettingsPage": ".settings_page",
+    "SyncPage": ".sync_page",
+}
 
 __all__ = [
     "ImportPage",
@@ -13,3 +19,15 @@ __all__ = [
     "SettingsPage",
     "LogsPage",
 ]
+
+
+def __getattr__(name):
+    if name not in _exports:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(_exports[name], __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(list(globals()) + __all__)
@@ -1,16 +1,11 @@
-from PySide6.QtCore import Qt, Signal, Slot
-from PySide6.QtWidgets import (
-    QHBoxLayout,
-    QListWidget,
-    QListWidgetItem,
-    QPushButton,
-    QVBoxLayout,
-)
+from PySide6.QtCore import QThread, Signal, Slot
+from PySide6.QtWidgets import QHBoxLayout, QPushButton, QVBoxLayout
 
 from base import QWidgetBase
 from components.dialogs import EditWordDialog
-from core import AudioThread
-from models import Status, WordModel, WordsModel
+from components.lists import WordListView
+from core import AnkiDuplicateCheck, AudioThread, PipelineOrchestrator
+from models import Status, WordListModel, WordModel, WordsModel
 
 
 class AudioPage(QWidgetBase):
@@ -30,11 +25,24 @@ class AudioPage(QWidgetBase):
         self.google_api_key_string = None
         self.anki_audio_path_verified = None
         self.google_api_key_string_verified = None
+        self.anki_deck_name = None
+        self.anki_model_name = None
+        self.anki_deck_name_verified = False
+        self.anki_model_name_verified = False
+        self.duplicate_check_thread = None
+        self.checked_guids = None
+        self.audio_concurrency = 4
+
+        self.wordsModel = WordsModel()
+        self.pipeline = PipelineOrchestrator()
+        self.queue_model = WordListModel(self.wordsModel.to_be_audio_words)
+        self.errored_model = WordListModel(self.wordsModel.audio_error_words)
+        self.audio_downloaded_model = WordListModel(self.wordsModel.audio_words)
 
         # List Widget
         define_queue_qv = QVBoxLayout()
         word_set_layout.addLayout(define_queue_qv)
-        self.list_widget = QListWidget()
+        self.list_widget = WordListView(self.queue_model)
         queue_buttons_layout = QHBoxLayout()
         define_queue_qv.addWidget(self.list_widget)
         define_queue_qv.addLayout(queue_buttons_layout)
@@ -51,7 +59,7 @@ class AudioPage(QWidgetBase):
         self.bottom_list_widgets.addLayout(self.audio_downloaded_box)
 
         # SKIPPED BOX
-        self.errored_list_widget = QListWidget()
+        self.errored_list_widget = WordListView(self.errored_model)
         self.skipped_box.addWidget(self.errored_list_widget)
         self.skip_audio_word_btn = QPushButton("Skip Audio")
         self.move_word_to_queue_btn = QPushButton("Move Word to Audio Queue")
@@ -62,10 +70,11 @@ class AudioPage(QWidgetBase):
         self.skipped_box.addLayout(self.h_skipped_layout)
 
         # DEFINED BOX
-        self.audio_downloaded_list_widget = QListWidget()
+        self.audio_downloaded_list_widget = WordListView(
+            self.audio_downloaded_model, multi_selection=True
+        )
         self.audio_downloaded_box.addWidget(self.audio_downloaded_list_widget)
         self.h_defined_layout = QHBoxLayout()
-        self.audio_downloaded_list_widget.setSelectionMode(QListWidget.MultiSelection)
         self.get_sync_btn = QPushButton("Sync Words to Anki")
         self.h_defined_layout.addWidget(self.get_sync_btn)
 
@@ -73,7 +82,6 @@ class AudioPage(QWidgetBase):
 
         word_set_layout.addLayout(self.bottom_list_widgets)
 
-        self.wordsModel = WordsModel()
         # SLOTS / SIGNALS
         self.start_define.clicked.connect(self.start_audio_words)
         self.wordsModel.word_added_to_be_audio.connect(self.add_word)
@@ -84,21 +92,10 @@ class AudioPage(QWidgetBase):
         self.change_status.connect(self.wordsModel.update_status)
         self.get_sync_btn.clicked.connect(self.start_sync_words)
 
-        for word in self.wordsModel.to_be_audio_words:
-            self.add_word(word)
-
-        for word in self.wordsModel.audio_error_words:
-            self.receive_error_word(word)
-
-        for word in self.wordsModel.audio_words:
-            self.receive_audio_word(word)
-
     def move_error_word_to_sync(self):
         word = self.remove_from_error_list()
         if word:
-            list_item = QListWidgetItem(word.word)
-            list_item.setData(Qt.UserRole, word.guid)
-            self.audio_downloaded_list_widget.addItem(list_item)
+            self.audio_downloaded_model.add_word(word)
             word.status = Status.AUDIO
             self.update_word_model.emit(word.guid, word)
 
@@ -108,24 +105,10 @@ class AudioPage(QWidgetBase):
             self.change_status.emit(word.guid, Status.TO_BE_AUDIO)
 
     def remove_from_error_list(self):
-        item = self.errored_list_widget.currentItem()
-        if item:
-            guid = item.data(Qt.UserRole)
-            word = [
-                word
-                for word in self.wordsModel.skipped_audio_words
-                if word.guid == guid
-            ]
-            if word:
-                change_word = word[0]
-
-                for index in reversed(range(self.errored_list_widget.count())):
-                    item = self.errored_list_widget.item(index)
-                    if item and item.data(Qt.UserRole) == change_word.guid:
-                        self.errored_list_widget.takeItem(
-                            self.errored_list_widget.row(item)
-                        )
-                return change_word
+        change_word = self.wordsModel.get_word(self.errored_list_widget.current_guid())
+        if change_word and change_word.status == Status.SKIPPED_AUDIO:
+            self.errored_model.remove_word(change_word.guid)
+            return change_word
         return False
 
     @Slot(WordModel)
@@ -143,9 +126,7 @@ class AudioPage(QWidgetBase):
 
         """
 
-        list_item = QListWidgetItem(word.word)
-        list_item.setData(Qt.UserRole, word.guid)
-        self.list_widget.addItem(list_item)
+        self.queue_model.add_word(word)
 
         if self.audio_thread and self.audio_thread.isRunning():
             self.add_word_to_audio_queue.emit(word)
@@ -154,6 +135,8 @@ class AudioPage(QWidgetBase):
     def start_audio_words(self):
         if self.audio_thread and self.audio_thread.isRunning():
             return
+        elif self.duplicate_check_thread:
+            return
         elif not self.wordsModel.to_be_audio_words:
             return
         elif not self.google_api_key_string:
@@ -194,22 +177,84 @@ class AudioPage(QWidgetBase):
             return
         else:
             self.start_define.setDisabled(True)
-            self.audio_thread = AudioThread(
-                self.wordsModel.to_be_audio_words,
-                folder_path=self.anki_audio_path,
-                credential_string=self.google_api_key_string,
-            )
+            if self.can_check_duplicates():
+                self.start_duplicate_check()
+            else:
+                self.start_audio_thread()
+
+    def can_check_duplicates(self):
+        return bool(
+            self.anki_deck_name
+            and self.anki_model_name
+            and self.anki_deck_name_verified
+            and self.anki_model_name_verified
+        )
 
-            self.audio_thread.audio_word.connect(self.receive_audio_word)
-            self.audio_thread.error_word.connect(self.receive_error_word)
+    def start_duplicate_check(self):
+        words = self.wordsModel.to_be_audio_words
+        self.checked_guids = {word.guid for word in words}
+        self.duplicate_check_thread = QThread(self)
+        self.duplicate_check_worker = AnkiDuplicateCheck(
+            words,
+            self.anki_deck_name,
+            self.anki_model_name,
+        )
+        self.duplicate_check_worker.moveToThread(self.duplicate_check_thread)
+        self.duplicate_check_worker.send_logs.connect(self.send_logs)
+        self.duplicate_check_thread.started.connect(self.duplicate_check_worker.do_work)
+        self.duplicate_check_worker.duplicate_word.connect(self.receive_duplicate_word)
+        self.duplicate_check_worker.error_word.connect(self.receive_invalid_word)
+        self.duplicate_check_worker.finished.connect(self.start_audio_thread)
+        self.duplicate_check_worker.finished.connect(self.duplicate_check_thread.quit)
+        self.duplicate_check_thread.finished.connect(
+            self.duplicate_check_worker.deleteLater
+        )
+        self.duplicate_check_thread.finished.connect(
+            self.duplicate_check_thread.deleteLater
+        )
+        self.duplicate_check_thread.start()
+
+    def start_audio_thread(self):
+        self.duplicate_check_thread = None
+        words = self.wordsModel.to_be_audio_words
+        if not words:
+            self.start_define.setDisabled(False)
+            self.save_words_to_model.emit()
+            self.pipeline.stage_finished("audio")
+            return
 
-            self.audio_thread.finished.connect(
-                lambda: self.start_define.setDisabled(False)
-            )
-            self.audio_thread.finished.connect(lambda: self.save_words_to_model.emit())
-            self.audio_thread.finished.connect(self.reset_thread_reference)
-            self.add_word_to_audio_queue.connect(self.audio_thread.add_word_to_list)
-            self.audio_thread.start()
+        # words that arrived during the duplicate check are checked by the thread
+        checked_guids, self.checked_guids = self.checked_guids, None
+        if checked_guids is None:
+            checked_guids = {word.guid for word in words}
+        self.audio_thread = AudioThread(
+            [word for word in words if word.guid in checked_guids],
+            folder_path=self.anki_audio_path,
+            credential_string=self.google_api_key_string,
+            max_workers=self.audio_concurrency,
+            anki_deck_name=self.anki_deck_name if self.can_check_duplicates() else None,
+            anki_model_name=self.anki_model_name,
+        )
+
+        self.audio_thread.send_logs.connect(self.send_logs)
+        self.audio_thread.audio_word.connect(self.receive_audio_word)
+        self.audio_thread.error_word.connect(self.receive_error_word)
+        self.audio_thread.duplicate_word.connect(self.receive_duplicate_word)
+        self.audio_thread.invalid_word.connect(self.receive_invalid_word)
+
+        self.audio_thread.finished.connect(lambda: self.start_define.setDisabled(False))
+        self.audio_thread.finished.connect(lambda: self.save_words_to_model.emit())
+        self.audio_thread.finished.connect(self.on_audio_thread_finished)
+        self.audio_thread.finished.connect(self.reset_thread_reference)
+        self.add_word_to_audio_queue.connect(self.audio_thread.add_word_to_list)
+        for word in words:
+            if word.guid not in checked_guids:
+                self.audio_thread.add_word_to_list(word)
+        self.pipeline.stage_started("audio", self.audio_thread)
+        self.audio_thread.start()
+
+    def on_audio_thread_finished(self):
+        self.pipeline.stage_finished("audio")
 
     def reset_thread_reference(self):
         if self.audio_thread and self.audio_thread.isRunning():
@@ -219,53 +264,51 @@ class AudioPage(QWidgetBase):
             self.audio_thread = None
 
     def receive_audio_word(self, word):
-        list_item = QListWidgetItem(word.word)
-        list_item.setData(Qt.UserRole, word.guid)
-        self.audio_downloaded_list_widget.addItem(list_item)
         self.update_word_model.emit(word.guid, word)
-        for index in reversed(range(self.list_widget.count())):
-            item = self.list_widget.item(index)
-            if item and item.data(Qt.UserRole) == word.guid:
-                self.list_widget.takeItem(self.list_widget.row(item))
+        self.queue_model.remove_word(word.guid)
+        if not self.pipeline.advance("audio", word):
+            self.audio_downloaded_model.add_word(word)
 
-    def receive_error_word(self, word):
-        list_item = QListWidgetItem(word.word)
-        list_item.setData(Qt.UserRole, word.guid)
-        self.errored_list_widget.addItem(list_item)
+    def receive_duplicate_word(self, word):
+        self.change_status.emit(word.guid, Status.SKIPPED_ANKI_DUP)
+        self.queue_model.remove_word(word.guid)
 
-        for index in reversed(range(self.list_widget.count())):
-            item = self.list_widget.item(index)
-            if item and item.data(Qt.UserRole) == word.guid:
-                self.list_widget.takeItem(self.list_widget.row(item))
+    def receive_invalid_word(self, word, error):
+        self.logging(f"Anki can't add {word.word}: {error}", "WARN")
+        self.change_status.emit(word.guid, Status.SKIPPED_AUDIO)
+        self.receive_error_word(word)
+
+    def receive_error_word(self, word):
+        self.update_word_model.emit(word.guid, word)
+        self.errored_model.add_word(word)
+        self.queue_model.remove_word(word.guid)
 
     def start_sync_words(self):
-        self.audio_downloaded_list_widget.selectAll()
-        selected_words = self.audio_downloaded_list_widget.selectedItems()
-        print(selected_words)
-        for word in selected_words:
-            self.change_status.emit(word.data(Qt.UserRole), Status.TO_BE_SYNCED)
-            self.audio_downloaded_list_widget.takeItem(
-                self.audio_downloaded_list_widget.row(word)
-            )
+        for guid in self.audio_downloaded_model.guids():
+            self.change_status.emit(guid, Status.TO_BE_SYNCED)
+        self.audio_downloaded_model.clear()
         self.save_words_to_model.emit()
         self.start_sync_for_words.emit(3)
 
-    @Slot(str, bool, str, bool)
+    @Slot(str, bool, str, bool, str, bool, str, bool, int)
     def receive_settings_update(
         self,
         google_api_key_string,
         google_api_key_string_verified,
         anki_audio_path,
         anki_audio_path_verified,
+        anki_deck_name,
+        anki_deck_name_verified,
+        anki_model_name,
+        anki_model_name_verified,
+        audio_concurrency,
     ):
-        print(
-            "audio page",
-            google_api_key_string,
-            google_api_key_string_verified,
-            anki_audio_path,
-            anki_audio_path_verified,
-        )
         self.google_api_key_string = google_api_key_string
         self.google_api_key_string_verified = google_api_key_string_verified
         self.anki_audio_path = anki_audio_path
         self.anki_audio_path_verified = anki_audio_path_verified
+        self.anki_deck_name = anki_deck_name
+        self.anki_deck_name_verified = anki_deck_name_verified
+        self.anki_model_name = anki_model_name
+        self.anki_model_name_verified = anki_model_name_verified
+        self.audio_concurrency = max(1, audio_concurrency)
@@ -1,16 +1,16 @@
-from PySide6.QtCore import Qt, Signal, Slot
-from PySide6.QtWidgets import (
-    QHBoxLayout,
-    QListWidget,
-    QListWidgetItem,
-    QPushButton,
-    QVBoxLayout,
-)
+from PySide6.QtCore import Signal, Slot
+from PySide6.QtWidgets import QHBoxLayout, QPushButton, QVBoxLayout
 
 from base import QWidgetBase
 from components.dialogs import EditWordDialog, MultiSelectionDialog
-from core import WordLookupWorker, WordLookupWorkerWebster
-from models import Status, WordModel, WordsModel
+from components.lists import WordListView
+from core import PipelineOrchestrator, WordLookupWorker
+from core.backends import (
+    FreeDictionaryBackend,
+    MerriamWebsterBackend,
+    OfflineDictionaryBackend,
+)
+from models import Status, WordListModel, WordModel, WordsModel
 
 
 class DefinePage(QWidgetBase):
@@ -33,11 +33,20 @@ class DefinePage(QWidgetBase):
         self.dictionary_lookup_souce_verified = None
         self.merriam_webster_api_key = None
         self.merriam_webster_api_key_verified = None
+        self.lookup_concurrency = 4
+        self.offline_dictionary_path = None
+        self.offline_dictionary_path_verified = False
+
+        self.wordsModel = WordsModel()
+        self.pipeline = PipelineOrchestrator()
+        self.queue_model = WordListModel(self.wordsModel.to_be_defined_words)
+        self.skipped_model = WordListModel(self.wordsModel.skipped_defined_words)
+        self.defined_model = WordListModel(self.wordsModel.defined_words)
 
         # List Widget
         define_queue_qv = QVBoxLayout()
         word_set_layout.addLayout(define_queue_qv)
-        self.list_widget = QListWidget()
+        self.list_widget = WordListView(self.queue_model)
         queue_buttons_layout = QHBoxLayout()
         define_queue_qv.addWidget(self.list_widget)
         define_queue_qv.addLayout(queue_buttons_layout)
@@ -54,7 +63,7 @@ class DefinePage(QWidgetBase):
         self.bottom_list_widgets.addLayout(self.definded_box)
 
         # SKIPPED BOX
-        self.skipped_list_widget = QListWidget()
+        self.skipped_list_widget = WordListView(self.skipped_model)
         self.skipped_box.addWidget(self.skipped_list_widget)
         self.edit_word_btn = QPushButton("Edit Word")
         self.move_word_to_queue_btn = QPushButton("Move Word to Queue")
@@ -64,8 +73,9 @@ class DefinePage(QWidgetBase):
         self.skipped_box.addLayout(self.h_skipped_layout)
 
         # DEFINED BOX
-        self.defined_list_widget = QListWidget()
-        self.defined_list_widget.setSelectionMode(QListWidget.MultiSelection)
+        self.defined_list_widget = WordListView(
+            self.defined_model, multi_selection=True
+        )
         self.definded_box.addWidget(self.defined_list_widget)
         self.h_defined_layout = QHBoxLayout()
 
@@ -76,7 +86,6 @@ class DefinePage(QWidgetBase):
 
         word_set_layout.addLayout(self.bottom_list_widgets)
 
-        self.wordsModel = WordsModel()
         # SLOTS / SIGNALS
         self.start_define_btn.clicked.connect(self.start_define_words)
         self.wordsModel.word_added_to_be_defined.connect(self.add_word)
@@ -87,60 +96,30 @@ class DefinePage(QWidgetBase):
         self.get_audio_btn.clicked.connect(self.start_audio_words)
         self.change_status.connect(self.wordsModel.update_status)
 
-        for word in self.wordsModel.to_be_defined_words:
-            self.add_word(word)
-
-        for word in self.wordsModel.skipped_defined_words:
-            self.receive_skipped_word(word)
-
-        for word in self.wordsModel.defined_words:
-            self.receive_defined_word(word)
+    def current_skipped_word(self):
+        word = self.wordsModel.get_word(self.skipped_list_widget.current_guid())
+        if word and word.status == Status.SKIPPED_DEFINED:
+            return word
+        return None
 
     def edit_skipped_word(self):
-        item = self.skipped_list_widget.currentItem()
-        if item:
-            guid = item.data(Qt.UserRole)
-            word = [
-                word
-                for word in self.wordsModel.skipped_defined_words
-                if word.guid == guid
-            ]
-            if word:
-                edit_word = word[0]
-                self.edit_word_dialog = EditWordDialog(
-                    edit_word, "Edit Word", "Edit Word"
-                )
-                self.edit_word_dialog.updated_word.connect(self.update_edited_word)
-                self.edit_word_dialog.exec()
+        edit_word = self.current_skipped_word()
+        if edit_word:
+            self.edit_word_dialog = EditWordDialog(edit_word, "Edit Word", "Edit Word")
+            self.edit_word_dialog.updated_word.connect(self.update_edited_word)
+            self.edit_word_dialog.exec()
 
     def update_edited_word(self, word):
-        print(word)
         word.status = Status.TO_BE_DEFINED
         self.add_word(word)
         self.update_word_model.emit(word.guid, word)
-        for index in reversed(range(self.skipped_list_widget.count())):
-            item = self.skipped_list_widget.item(index)
-            if item and item.data(Qt.UserRole) == word.guid:
-                self.skipped_list_widget.takeItem(self.skipped_list_widget.row(item))
+        self.skipped_model.remove_word(word.guid)
 
     def move_word_to_queue(self):
-        item = self.skipped_list_widget.currentItem()
-        if item:
-            guid = item.data(Qt.UserRole)
-            word = [
-                word
-                for word in self.wordsModel.skipped_defined_words
-                if word.guid == guid
-            ]
-            if word:
-                change_word = word[0]
-                self.change_status.emit(change_word.guid, Status.TO_BE_DEFINED)
-                for index in reversed(range(self.skipped_list_widget.count())):
-                    item = self.skipped_list_widget.item(index)
-                    if item and item.data(Qt.UserRole) == change_word.guid:
-                        self.skipped_list_widget.takeItem(
-                            self.skipped_list_widget.row(item)
-                        )
+        change_word = self.current_skipped_word()
+        if change_word:
+            self.change_status.emit(change_word.guid, Status.TO_BE_DEFINED)
+            self.skipped_model.remove_word(change_word.guid)
 
     @Slot(WordModel)
     def add_word(self, word: WordModel) -> None:
@@ -157,9 +136,7 @@ class DefinePage(QWidgetBase):
 
         """
 
-        list_item = QListWidgetItem(word.word)
-        list_item.setData(Qt.UserRole, word.guid)
-        self.list_widget.addItem(list_item)
+        self.queue_model.add_word(word)
 
         if self.word_lookup_thread and self.word_lookup_thread.isRunning():
 
@@ -177,14 +154,32 @@ class DefinePage(QWidgetBase):
             and self.merriam_webster_api_key
             and self.merriam_webster_api_key_verified
         ):
-            self.word_lookup_thread = WordLookupWorkerWebster(
-                self.wordsModel.to_be_defined_words,
-                MW_API_KEY=self.merriam_webster_api_key,
-            )
+            backend = MerriamWebsterBackend(self.merriam_webster_api_key)
+        elif (
+            self.dictionary_lookup_souce == "Offline Dictionary"
+            and self.offline_dictionary_path
+            and self.offline_dictionary_path_verified
+        ):
+            try:
+                backend = OfflineDictionaryBackend(self.offline_dictionary_path)
+            except (OSError, ValueError) as e:
+                self.log_with_toast(
+                    "Offline Dictionary Not Loaded",
+                    f"Could not open the offline dictionary: {e}",
+                    "ERROR",
+                    "ERROR",
+                    parent=self,
+                )
+                self.start_define_btn.setDisabled(False)
+                self.pipeline.stage_finished("define")
+                return
         else:
-            self.word_lookup_thread = WordLookupWorker(
-                self.wordsModel.to_be_defined_words
-            )
+            backend = FreeDictionaryBackend()
+        self.word_lookup_thread = WordLookupWorker(
+            self.wordsModel.to_be_defined_words,
+            backend,
+            max_workers=self.lookup_concurrency,
+        )
         self.word_lookup_thread.send_logs.connect(self.send_logs)
         self.word_lookup_thread.multi_definitions.connect(self.select_definitions)
         self.word_lookup_thread.multi_words.connect(self.select_word)
@@ -199,13 +194,18 @@ class DefinePage(QWidgetBase):
         self.word_lookup_thread.finished.connect(
             lambda: self.start_define_btn.setDisabled(False)
         )
+        self.word_lookup_thread.finished.connect(self.on_lookup_finished)
         self.word_lookup_thread.finished.connect(self.reset_thread_reference)
         self.word_lookup_thread.finished.connect(
             lambda: self.save_words_to_model.emit()
         )
         self.add_word_to_define_queue.connect(self.word_lookup_thread.add_word_to_list)
+        self.pipeline.stage_started("define", self.word_lookup_thread)
         self.word_lookup_thread.start()
 
+    def on_lookup_finished(self):
+        self.pipeline.stage_finished("define")
+
     def reset_thread_reference(self):
         if self.word_lookup_thread and self.word_lookup_thread.isRunning():
             self.word_lookup_thread.quit()
@@ -243,52 +243,40 @@ class DefinePage(QWidgetBase):
         self.user_definition_selection.emit(choices)
 
     def receive_defined_word(self, word):
-        list_item = QListWidgetItem(word.word)
-        list_item.setData(Qt.UserRole, word.guid)
-        self.defined_list_widget.addItem(list_item)
         self.update_word_model.emit(word.guid, word)
-        for index in reversed(range(self.list_widget.count())):
-            item = self.list_widget.item(index)
-            if item and item.data(Qt.UserRole) == word.guid:
-                self.list_widget.takeItem(self.list_widget.row(item))
+        self.queue_model.remove_word(word.guid)
+        if not self.pipeline.advance("define", word):
+            self.defined_model.add_word(word)
         self.save_words_to_model.emit()
 
     def receive_skipped_word(self, word):
-        list_item = QListWidgetItem(word.word)
-        list_item.setData(Qt.UserRole, word.guid)
-        self.skipped_list_widget.addItem(list_item)
-
-        for index in reversed(range(self.list_widget.count())):
-            item = self.list_widget.item(index)
-            if item and item.data(Qt.UserRole) == word.guid:
-                self.list_widget.takeItem(self.list_widget.row(item))
+        self.update_word_model.emit(word.guid, word)
+        self.skipped_model.add_word(word)
+        self.queue_model.remove_word(word.guid)
         self.save_words_to_model.emit()
 
     def start_audio_words(self):
-        self.defined_list_widget.selectAll()
-        selected_words = self.defined_list_widget.selectedItems()
-        for word in selected_words:
-            self.change_status.emit(word.data(Qt.UserRole), Status.TO_BE_AUDIO)
-            self.defined_list_widget.takeItem(self.defined_list_widget.row(word))
+        for guid in self.defined_model.guids():
+            self.change_status.emit(guid, Status.TO_BE_AUDIO)
+        self.defined_model.clear()
         self.save_words_to_model.emit()
         self.start_audio_for_words.emit(2)
 
-    @Slot(str, bool, str, bool)
+    @Slot(str, bool, str, bool, int, str, bool)
     def receive_settings_update(
         self,
         dictionary_lookup_souce,
         dictionary_lookup_souce_verified,
         merriam_webster_api_key,
         merriam_webster_api_key_verified,
+        lookup_concurrency,
+        offline_dictionary_path,
+        offline_dictionary_path_verified,
     ):
-        print(
-            "define page",
-            dictionary_lookup_souce,
-            dictionary_lookup_souce_verified,
-            merriam_webster_api_key,
-            merriam_webster_api_key_verified,
-        )
         self.dictionary_lookup_souce = dictionary_lookup_souce
         self.dictionary_lookup_souce_verified = dictionary_lookup_souce_verified
         self.merriam_webster_api_key = merriam_webster_api_key
         self.merriam_webster_api_key_verified = merriam_webster_api_key_verified
+        self.lookup_concurrency = max(1, lookup_concurrency)
+        self.offline_dictionary_path = offline_dictionary_path
+        self.offline_dictionary_path_verified = offline_dictionary_path_verified
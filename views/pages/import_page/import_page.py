@@ -3,8 +3,7 @@ import uuid
 from PySide6.QtCore import Qt, QThread, Signal, Slot
 from PySide6.QtWidgets import (
     QHBoxLayout,
-    QListWidget,
-    QListWidgetItem,
+    QLineEdit,
     QPushButton,
     QSizePolicy,
     QSpacerItem,
@@ -13,8 +12,9 @@ from PySide6.QtWidgets import (
 
 from base import QWidgetBase
 from components.helpers import WidgetFactory
+from components.lists import WordListView
 from core.apple_note_import import AppleNoteImport
-from models import Status, WordModel, WordsModel
+from models import Status, WordListModel, WordModel, WordsModel
 
 
 class ImportPage(QWidgetBase):
@@ -26,14 +26,19 @@ class ImportPage(QWidgetBase):
 
     def __init__(self):
         super().__init__()
-        self.word_list = []
         word_set_layout = QVBoxLayout(self)
         h_layout = QHBoxLayout()
 
         self.apple_note_name = None
         self.apple_note_verified = False
 
+        self.wordsModel = WordsModel()
+        self.word_list_model = WordListModel(self.wordsModel.undefined_words)
+
         top_btn_h_layout = QHBoxLayout()
+        self.filter_line_edit = QLineEdit()
+        self.filter_line_edit.setPlaceholderText("Filter words")
+        top_btn_h_layout.addWidget(self.filter_line_edit)
         self.import_btn = QPushButton("Import")
         self.import_btn.setMinimumWidth(200)
         hspacer = QSpacerItem(20, 20, QSizePolicy.Expanding, QSizePolicy.Minimum)
@@ -72,8 +77,7 @@ class ImportPage(QWidgetBase):
         word_set_layout.addLayout(h_layout)
 
         # List Widget
-        self.list_widget = QListWidget()
-        self.list_widget.setSelectionMode(QListWidget.MultiSelection)
+        self.list_widget = WordListView(self.word_list_model, multi_selection=True)
 
         self.start_define_btn = QPushButton("Define Selected Words")
         self.delete_words_btn = QPushButton("Delete Selected Words")
@@ -84,21 +88,22 @@ class ImportPage(QWidgetBase):
 
         h_layout.addWidget(self.list_widget)
 
-        self.wordsModel = WordsModel()
         # SLOTS / SIGNALS
         self.import_btn.clicked.connect(self.import_words_from_apple_notes)
         self.arrow_up.clicked.connect(self.navigate_up)
         self.arrow_down.clicked.connect(self.navigate_down)
         self.add_word_to_model.connect(self.wordsModel.add_word)
         self.wordsModel.word_added.connect(self.add_word)
+        self.wordsModel.words_added.connect(self.add_words)
         self.save_words_to_model.connect(self.wordsModel.save_words)
         self.start_define_btn.clicked.connect(self.start_define_words)
         self.to_define_word.connect(self.wordsModel.update_status)
         self.delete_words_model.connect(self.wordsModel.delete_words)
         self.delete_words_btn.clicked.connect(self.delete_words)
+        self.filter_line_edit.textChanged.connect(self.list_widget.set_filter)
 
-        for word in self.wordsModel.undefined_words:
-            self.add_word(word)
+        if self.list_widget.row_count():
+            self.list_widget.set_current_row(0)
 
     def navigate_up(self):
         """
@@ -108,10 +113,10 @@ class ImportPage(QWidgetBase):
         Returns:
             None: This function does not return a value.
         """
-        if self.list_widget.currentRow() > 0:
-            self.list_widget.setCurrentRow(self.list_widget.currentRow() - 1)
+        if self.list_widget.current_row() > 0:
+            self.list_widget.set_current_row(self.list_widget.current_row() - 1)
         else:
-            self.list_widget.setCurrentRow(self.list_widget.count() - 1)
+            self.list_widget.set_current_row(self.list_widget.row_count() - 1)
 
     def navigate_down(self):
         """
@@ -121,10 +126,10 @@ class ImportPage(QWidgetBase):
         Returns:
             None: This function does not return a value.
         """
-        if self.list_widget.currentRow() != self.list_widget.count() - 1:
-            self.list_widget.setCurrentRow(self.list_widget.currentRow() + 1)
+        if self.list_widget.current_row() != self.list_widget.row_count() - 1:
+            self.list_widget.set_current_row(self.list_widget.current_row() + 1)
         else:
-            self.list_widget.setCurrentRow(0)
+            self.list_widget.set_current_row(0)
 
     @Slot(WordModel)
     def add_word(self, word: WordModel) -> None:
@@ -141,12 +146,26 @@ class ImportPage(QWidgetBase):
 
         """
 
-        list_item = QListWidgetItem(word.word)
-        list_item.setData(Qt.UserRole, word.guid)
-        self.list_widget.addItem(list_item)
-        self.word_list.append(word)
-        if self.list_widget.count() == 1:
-            self.list_widget.setCurrentRow(0)
+        self.word_list_model.add_word(word)
+        if self.list_widget.row_count() == 1:
+            self.list_widget.set_current_row(0)
+
+    @Slot(list)
+    def add_words(self, words: list) -> None:
+        """
+        Slot for adding a batch of words to the list.
+
+        Args:
+            words (list): The words to be added.
+
+        Returns:
+            None: This function does not return a value.
+        """
+        self.word_list_model.add_words(
+            word for word in words if word.status == Status.ADDED
+        )
+        if self.list_widget.current_row() < 0 and self.list_widget.row_count():
+            self.list_widget.set_current_row(0)
 
     def import_words_from_apple_notes(self):
         print(self.apple_note_name, self.apple_note_verified)
@@ -194,21 +213,16 @@ class ImportPage(QWidgetBase):
         )
 
     def start_define_words(self):
-        selected_words = self.list_widget.selectedItems()
+        guids = self.list_widget.selected_guids()
 
-        for word in selected_words:
-            self.to_define_word.emit(word.data(Qt.UserRole), Status.TO_BE_DEFINED)
-            self.list_widget.takeItem(self.list_widget.row(word))
+        for guid in guids:
+            self.to_define_word.emit(guid, Status.TO_BE_DEFINED)
+        self.word_list_model.remove_words(guids)
         self.save_words_to_model.emit()
         self.start_defining_words.emit(1)
 
     def delete_words(self):
-        selected_words = self.list_widget.selectedItems()
-
-        ids = []
-        for word in selected_words:
-            ids.append(word.data(Qt.UserRole))
-            self.list_widget.takeItem(self.list_widget.row(word))
+        ids = self.list_widget.selected_guids()
         self.delete_words_model.emit(ids)
         self.save_words_to_model.emit()
 
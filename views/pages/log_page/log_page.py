@@ -1,10 +1,35 @@
 from PySide6.QtCore import Slot
-from PySide6.QtWidgets import QScrollArea, QTextEdit, QVBoxLayout
+from PySide6.QtGui import QTextCursor
+from PySide6.QtWidgets import (
+    QHBoxLayout,
+    QLabel,
+    QPlainTextEdit,
+    QPushButton,
+    QVBoxLayout,
+)
 
 from base import QWidgetBase
+from services.cache import AudioCache, ResponseCache
+from services.logger import LogHistory
+from services.network import RateLimiter
 
 
 class LogsPage(QWidgetBase):
+    """
+    Shows the end of the log file and the live log lines, with older history loaded
+    on demand.
+
+    Attributes:
+        tail_lines (int): Lines read from the end of the log file when it is opened.
+        page_lines (int): Lines added each time older history is loaded.
+        max_live_lines (int): Lines kept in the display, older ones are dropped.
+        max_lines (int): Lines kept in the display while browsing older history.
+    """
+
+    tail_lines = 500
+    page_lines = 1000
+    max_live_lines = 5000
+    max_lines = 50000
 
     def __init__(self):
         super().__init__()
@@ -25,46 +50,179 @@ class LogsPage(QWidgetBase):
 
         self.settings_layout = QVBoxLayout(self)
 
-        # Text edit widget for displaying logs
-        self.log_display = QTextEdit()
-        self.log_display.setLineWrapMode(QTextEdit.LineWrapMode.NoWrap)
+        # Dictionary response cache counters
+        self.response_cache = ResponseCache()
+        self.cache_stats_label = QLabel()
+        self.update_cache_stats(self.response_cache.hits, self.response_cache.misses)
+        self.response_cache.stats_changed.connect(self.update_cache_stats)
+        self.settings_layout.addWidget(self.cache_stats_label)
+
+        # Synthesized audio cache counters
+        self.audio_cache = AudioCache()
+        self.audio_cache_stats_label = QLabel()
+        self.update_audio_cache_stats(self.audio_cache.hits, self.audio_cache.misses)
+        self.audio_cache.stats_changed.connect(self.update_audio_cache_stats)
+        self.settings_layout.addWidget(self.audio_cache_stats_label)
+
+        # API usage and remaining daily quota
+        self.rate_limiter = RateLimiter()
+        self.quota_label = QLabel()
+        self.update_quota()
+        self.rate_limiter.usage_changed.connect(self.update_quota)
+        self.settings_layout.addWidget(self.quota_label)
+
+        # Buttons for paging through older log history
+        history_layout = QHBoxLayout()
+        self.older_button = QPushButton("Load older")
+        self.older_button.setEnabled(False)
+        self.older_button.clicked.connect(self.load_older)
+        self.tail_button = QPushButton("Back to latest")
+        self.tail_button.clicked.connect(self.load_tail)
+        history_layout.addWidget(self.older_button)
+        history_layout.addWidget(self.tail_button)
+        history_layout.addStretch()
+        self.settings_layout.addLayout(history_layout)
+
+        # Plain text widget for displaying logs, capped so the live view stays small
+        self.log_display = QPlainTextEdit()
+        self.log_display.setReadOnly(True)
+        self.log_display.setLineWrapMode(QPlainTextEdit.LineWrapMode.NoWrap)
+        self.log_display.setMaximumBlockCount(self.max_live_lines)
+        self.log_display.setMinimumWidth(500)
+        self.settings_layout.addWidget(self.log_display)
+
+        self.log_history = None
+        self.history_cursor = None
+        self.history_lines = 0
 
         self.logger.send_log.connect(self.update_log_display)
-        # Scroll area for the log display
-        scroll_area = QScrollArea(self)
-        scroll_area.setWidgetResizable(True)
-        scroll_area.setWidget(self.log_display)
-        scroll_area.setMinimumWidth(500)
-        # scroll_area.setStyleSheet(SCROLL_AREA_STYLES)
-        self.settings_layout.addWidget(scroll_area)
-
-    def load_all_logs(self):
-        self.log_display.setText("")
+
+    def load_tail(self) -> None:
+        """
+        Shows the last `tail_lines` lines of the log file and drops any older history
+        that was loaded.
+
+        Returns:
+            None: This function does not return a value.
+        """
+        if self.log_history is None:
+            return
+        self.history_lines = 0
+        self.log_display.setMaximumBlockCount(self.max_live_lines)
         try:
-            print("here")
-            with open(self.log_file_path + self.log_file_name, "r") as file:
-                for line in file:
-                    self.log_display.append(line.strip())
-        except FileNotFoundError:
-            print(
-                f"Error: The file '{self.log_file_path + self.log_file_name}' was not found."
-            )
-        except IOError as e:
+            lines, self.history_cursor = self.log_history.tail(self.tail_lines)
+        except OSError as e:
             print(f"Error: {e}")
-        except Exception as e:
+            lines, self.history_cursor = [], None
+        self.log_display.setPlainText("\n".join(lines))
+        self.log_display.moveCursor(QTextCursor.MoveOperation.End)
+        self.older_button.setEnabled(self.history_cursor is not None)
+
+    def load_older(self) -> None:
+        """
+        Adds the `page_lines` lines before the oldest line shown to the top of the log
+        display, continuing into the rotated log files.
+
+        Returns:
+            None: This function does not return a value.
+        """
+        if self.log_history is None or self.history_cursor is None:
+            return
+        try:
+            lines, self.history_cursor = self.log_history.older(
+                self.history_cursor, self.page_lines
+            )
+        except OSError as e:
             print(f"Error: {e}")
+            lines, self.history_cursor = [], None
+
+        if lines:
+            # raise the cap so the lines added at the top are not trimmed right away
+            self.history_lines += len(lines)
+            self.log_display.setMaximumBlockCount(
+                min(self.max_live_lines + self.history_lines, self.max_lines)
+            )
+            scroll_bar = self.log_display.verticalScrollBar()
+            from_bottom = scroll_bar.maximum() - scroll_bar.value()
+            cursor = QTextCursor(self.log_display.document())
+            cursor.movePosition(QTextCursor.MoveOperation.Start)
+            cursor.insertText("\n".join(lines) + "\n")
+            scroll_bar.setValue(scroll_bar.maximum() - from_bottom)
+
+        if self.history_lines + self.max_live_lines >= self.max_lines:
+            self.history_cursor = None
+        self.older_button.setEnabled(self.history_cursor is not None)
 
     def update_log_display(self, log: str) -> None:
         """
-        Appends a new log entry to the log display.
+        Appends new log lines to the log display. The oldest lines are dropped once
+        the display holds `max_live_lines` lines.
+
+        Args:
+            log (str): The log lines to be appended.
+
+        Returns:
+            None: This function does not return a value.
+        """
+        self.log_display.appendPlainText(log)
+
+    @Slot(int, int)
+    def update_cache_stats(self, hits: int, misses: int) -> None:
+        """
+        Updates the dictionary cache hit/miss counter.
+
+        Args:
+            hits (int): Number of lookups answered from the cache.
+            misses (int): Number of lookups that went to the network.
+
+        Returns:
+            None: This function does not return a value.
+        """
+        self.cache_stats_label.setText(
+            f"Dictionary cache: {hits} hits / {misses} misses"
+        )
+
+    @Slot(int, int)
+    def update_audio_cache_stats(self, hits: int, misses: int) -> None:
+        """
+        Updates the audio cache hit/miss counter.
+
+        Args:
+            hits (int): Number of words whose audio came from the cache.
+            misses (int): Number of words that were synthesized.
+
+        Returns:
+            None: This function does not return a value.
+        """
+        self.audio_cache_stats_label.setText(
+            f"Audio cache: {hits} hits / {misses} misses"
+        )
+
+    @Slot(str, int, int)
+    def update_quota(self, name: str = "", used: int = 0, limit: int = 0) -> None:
+        """
+        Updates the API usage and remaining daily quota of every API.
 
         Args:
-            log (str): The log entry to be appended.
+            name (str, optional): The API whose usage changed.
+            used (int, optional): Units it used today.
+            limit (int, optional): Its daily quota, 0 when there is none.
 
         Returns:
             None: This function does not return a value.
         """
-        self.log_display.append(log)
+        parts = []
+        for api, usage in sorted(self.rate_limiter.usage().items()):
+            if usage["limit"]:
+                parts.append(
+                    f"{api} {usage['remaining']} of {usage['limit']} "
+                    f"{usage['unit']} left"
+                )
+            else:
+                parts.append(f"{api} {usage['used']} {usage['unit']}")
+        self.quota_label.setText(
+            f"API usage today: {' | '.join(parts) if parts else 'none'}"
+        )
 
     @Slot(str, bool, str, bool)
     def receive_settings_update(
@@ -85,4 +243,5 @@ class LogsPage(QWidgetBase):
             and log_file_name
             and log_file_name_verified
         ):
-            self.load_all_logs()
+            self.log_history = LogHistory(log_file_path + log_file_name)
+            self.load_tail()
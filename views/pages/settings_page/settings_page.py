@@ -4,6 +4,7 @@ from PySide6.QtCore import QTimer, Signal, Slot
 
 from base import QWidgetBase
 from models import AppSettingsModel, LogSettingsModel
+from services.network import HttpClient
 from services.settings import AppSettings, SecureCredentials
 
 from .settings_page_view import SettingsPageView
@@ -13,10 +14,11 @@ from .verify_settings import VerifySettings
 class SettingsPage(QWidgetBase):
     main_app_settings = Signal(bool, bool)
     import_page_settings = Signal(str, bool)
-    audio_page_settings = Signal(str, bool, str, bool)
-    sync_page_settings = Signal(str, bool, str, bool)
+    audio_page_settings = Signal(str, bool, str, bool, str, bool, str, bool, int)
+    sync_page_settings = Signal(str, bool, str, bool, int)
     log_page_settings = Signal(str, bool, str, bool)
-    define_page_settings = Signal(str, bool, str, bool)
+    define_page_settings = Signal(str, bool, str, bool, int, str, bool)
+    pipeline_settings = Signal(bool, bool, int)
     save_log_settings_model = Signal(str, str, int, int, int, bool)
     verify_response_update_ui = Signal(str, bool)
     handle_change_update_ui = Signal(str)
@@ -53,6 +55,12 @@ class SettingsPage(QWidgetBase):
         self.view.btn_anki_user_verify.clicked.connect(
             lambda: self.handle_verify("anki_user")
         )
+        self.view.btn_anki_export_batch_size_verify.clicked.connect(
+            lambda: self.handle_verify("anki_export_batch_size")
+        )
+        self.view.btn_audio_concurrency_verify.clicked.connect(
+            lambda: self.handle_verify("audio_concurrency")
+        )
         self.view.btn_google_api_key_verify.clicked.connect(
             lambda: self.handle_verify("google_api_key")
         )
@@ -77,6 +85,27 @@ class SettingsPage(QWidgetBase):
         self.view.btn_auto_save_on_close_verify.clicked.connect(
             lambda: self.handle_verify("auto_save_on_close")
         )
+        self.view.btn_lookup_concurrency_verify.clicked.connect(
+            lambda: self.handle_verify("lookup_concurrency")
+        )
+        self.view.btn_offline_dictionary_path_verify.clicked.connect(
+            lambda: self.handle_verify("offline_dictionary_path")
+        )
+        self.view.btn_http_pool_size_verify.clicked.connect(
+            lambda: self.handle_verify("http_pool_size")
+        )
+        self.view.btn_http_timeout_verify.clicked.connect(
+            lambda: self.handle_verify("http_timeout")
+        )
+        self.view.btn_auto_advance_define_verify.clicked.connect(
+            lambda: self.handle_verify("auto_advance_define")
+        )
+        self.view.btn_auto_advance_audio_verify.clicked.connect(
+            lambda: self.handle_verify("auto_advance_audio")
+        )
+        self.view.btn_pipeline_queue_size_verify.clicked.connect(
+            lambda: self.handle_verify("pipeline_queue_size")
+        )
 
         self.view.comboBox_dictionary_source.currentIndexChanged.connect(
             lambda index, sender=self.view.comboBox_dictionary_source, key="dictionary_source": self.onComboBox_changed(
@@ -88,6 +117,16 @@ class SettingsPage(QWidgetBase):
                 index, sender, key, type
             )
         )
+        self.view.comboBox_auto_advance_define.currentIndexChanged.connect(
+            lambda index, sender=self.view.comboBox_auto_advance_define, key="auto_advance_define", type="bool": self.onComboBox_changed(
+                index, sender, key, type
+            )
+        )
+        self.view.comboBox_auto_advance_audio.currentIndexChanged.connect(
+            lambda index, sender=self.view.comboBox_auto_advance_audio, key="auto_advance_audio", type="bool": self.onComboBox_changed(
+                index, sender, key, type
+            )
+        )
 
         self.line_edit_connections = [
             (self.view.lineEdit_apple_note_name, "apple_note_name", "str"),
@@ -95,11 +134,26 @@ class SettingsPage(QWidgetBase):
             (self.view.lineEdit_anki_model_name, "anki_model_name", "str"),
             (self.view.lineEdit_anki_user, "anki_user", "str"),
             (self.view.lineEdit_anki_audio_path, "anki_audio_path", "str"),
+            (
+                self.view.lineEdit_anki_export_batch_size,
+                "anki_export_batch_size",
+                "int",
+            ),
+            (self.view.lineEdit_audio_concurrency, "audio_concurrency", "int"),
             (self.view.lineEdit_log_file_path, "log_file_path", "str"),
             (self.view.lineEdit_log_file_name, "log_file_name", "str"),
             (self.view.lineEdit_log_backup_count, "log_backup_count", "int"),
             (self.view.lineEdit_log_file_max_mbs, "log_file_max_mbs", "int"),
             (self.view.lineEdit_log_keep_files_days, "log_keep_files_days", "int"),
+            (self.view.lineEdit_lookup_concurrency, "lookup_concurrency", "int"),
+            (
+                self.view.lineEdit_offline_dictionary_path,
+                "offline_dictionary_path",
+                "str",
+            ),
+            (self.view.lineEdit_http_pool_size, "http_pool_size", "int"),
+            (self.view.lineEdit_http_timeout, "http_timeout", "int"),
+            (self.view.lineEdit_pipeline_queue_size, "pipeline_queue_size", "int"),
         ]
         self.view.lineEdit_merriam_webster_api_key.textChanged.connect(
             lambda text, key="merriam_webster_api_key", field=self.view.lineEdit_merriam_webster_api_key: self.handle_secure_text_change_timer(
@@ -155,7 +209,6 @@ class SettingsPage(QWidgetBase):
             word (str): The new value of the setting.
             icon_label (QLabel): The icon label to update.
         """
-        print(field, word)
         self.settings_model.change_setting(field, word, type=type)
         self.handle_change_update_ui.emit(field)
 
@@ -179,10 +232,11 @@ class SettingsPage(QWidgetBase):
         # Import Page settings
         if key in ["apple_note_name"]:
             self.send_import_page_settings()
-        elif key in ["audio_path", "google_api_key"]:
+        elif key in ["audio_path", "google_api_key", "audio_concurrency"]:
             self.send_audio_page_settings()
-        elif key in ["anki_deck_name", "anki_model_name"]:
+        elif key in ["anki_deck_name", "anki_model_name", "anki_export_batch_size"]:
             self.send_sync_page_settings()
+            self.send_audio_page_settings()
         elif key in [
             "log_file_path",
             "log_file_name",
@@ -191,10 +245,23 @@ class SettingsPage(QWidgetBase):
             "log_keep_files_days",
         ]:
             self.send_logs_page_setting()
-        elif key in ["dictionary_source", "merriam_webster_api_key"]:
+        elif key in [
+            "dictionary_source",
+            "merriam_webster_api_key",
+            "lookup_concurrency",
+            "offline_dictionary_path",
+        ]:
             self.send_define_page_settings()
         elif key in ["auto_save_on_close"]:
             self.main_app_settings()
+        elif key in ["http_pool_size", "http_timeout"]:
+            self.send_http_settings()
+        elif key in [
+            "auto_advance_define",
+            "auto_advance_audio",
+            "pipeline_queue_size",
+        ]:
+            self.send_pipeline_settings()
 
     def send_main_app_settings(self):
         auto_save_on_close, auto_save_on_close_verifed = (
@@ -209,12 +276,37 @@ class SettingsPage(QWidgetBase):
         merriam_webster_api_key, merriam_webster_verifed = (
             self.settings_model.get_setting("merriam_webster_api_key")
         )
+        lookup_concurrency, _ = self.settings_model.get_setting("lookup_concurrency")
+        offline_dictionary_path, odp_verifed = self.settings_model.get_setting(
+            "offline_dictionary_path"
+        )
 
         self.define_page_settings.emit(
             dictionary_source,
             dict_source_verifed,
             merriam_webster_api_key,
             merriam_webster_verifed,
+            int(lookup_concurrency or 4),
+            offline_dictionary_path,
+            odp_verifed,
+        )
+
+    def send_http_settings(self):
+        http_pool_size, _ = self.settings_model.get_setting("http_pool_size")
+        http_timeout, _ = self.settings_model.get_setting("http_timeout")
+        HttpClient().configure(
+            pool_size=int(http_pool_size or 10), read_timeout=int(http_timeout or 15)
+        )
+
+    def send_pipeline_settings(self):
+        auto_advance_define, _ = self.settings_model.get_setting("auto_advance_define")
+        auto_advance_audio, _ = self.settings_model.get_setting("auto_advance_audio")
+        pipeline_queue_size, _ = self.settings_model.get_setting("pipeline_queue_size")
+        # bools read back from an ini file are strings
+        self.pipeline_settings.emit(
+            str(auto_advance_define).lower() == "true",
+            str(auto_advance_audio).lower() == "true",
+            int(pipeline_queue_size or 20),
         )
 
     def send_import_page_settings(self):
@@ -228,12 +320,22 @@ class SettingsPage(QWidgetBase):
         anki_audio_path, aap_verifed = self.settings_model.get_setting(
             "anki_audio_path"
         )
+        anki_deck_name, adn_verifed = self.settings_model.get_setting("anki_deck_name")
+        anki_model_name, amn_verifed = self.settings_model.get_setting(
+            "anki_model_name"
+        )
+        audio_concurrency, _ = self.settings_model.get_setting("audio_concurrency")
 
         self.audio_page_settings.emit(
             google_api_key,
             gak_verifed,
             anki_audio_path,
             aap_verifed,
+            anki_deck_name,
+            adn_verifed,
+            anki_model_name,
+            amn_verifed,
+            int(audio_concurrency or 4),
         )
 
     def send_sync_page_settings(self):
@@ -241,9 +343,16 @@ class SettingsPage(QWidgetBase):
         anki_model_name, amn_verifed = self.settings_model.get_setting(
             "anki_model_name"
         )
+        anki_export_batch_size, _ = self.settings_model.get_setting(
+            "anki_export_batch_size"
+        )
 
         self.sync_page_settings.emit(
-            anki_deck_name, adn_verifed, anki_model_name, amn_verifed
+            anki_deck_name,
+            adn_verifed,
+            anki_model_name,
+            amn_verifed,
+            int(anki_export_batch_size or 50),
         )
 
     def send_logs_page_setting(self):
@@ -277,3 +386,5 @@ class SettingsPage(QWidgetBase):
         self.send_logs_page_setting()
         self.send_define_page_settings()
         self.send_main_app_settings()
+        self.send_http_settings()
+        self.send_pipeline_settings()
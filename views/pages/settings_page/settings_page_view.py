@@ -96,6 +96,14 @@ class SettingsPageView(QWidgetBase, metaclass=QSingleton):
             self.btn_anki_user_verify,
             self.hlayout_anki_user,
         ) = self.create_input_fields("anki_user", "Anki User Name:", "Verify User")
+        (
+            self.lineEdit_anki_export_batch_size,
+            self.label_anki_export_batch_size_verified_icon,
+            self.btn_anki_export_batch_size_verify,
+            self.hlayout_anki_export_batch_size,
+        ) = self.create_input_fields(
+            "anki_export_batch_size", "Anki Export Batch Size:", "Save Batch Size"
+        )
         (
             self.lineEdit_anki_audio_path,
             self.label_anki_audio_path_verified_icon,
@@ -105,6 +113,14 @@ class SettingsPageView(QWidgetBase, metaclass=QSingleton):
         ) = self.create_input_fields(
             "anki_audio_path", "Anki Audio path:", "Verify Audio Path", folder_icon=True
         )
+        (
+            self.lineEdit_audio_concurrency,
+            self.label_audio_concurrency_verified_icon,
+            self.btn_audio_concurrency_verify,
+            self.hlayout_audio_concurrency,
+        ) = self.create_input_fields(
+            "audio_concurrency", "Audio Concurrency:", "Save Audio Concurrency"
+        )
         (
             self.lineEdit_log_file_path,
             self.label_log_file_path_verified_icon,
@@ -157,7 +173,7 @@ class SettingsPageView(QWidgetBase, metaclass=QSingleton):
             "Dictionary Source:",
             "Save Dictionary Source",
             lineEdit=False,
-            comboBox=["Free Dictionary API", "Merriam Webster"],
+            comboBox=["Free Dictionary API", "Merriam Webster", "Offline Dictionary"],
         )
         (
             self.comboBox_auto_save_on_close,
@@ -179,6 +195,70 @@ class SettingsPageView(QWidgetBase, metaclass=QSingleton):
         ) = self.create_input_fields(
             "merriam_webster_api_key", "Merriam Webster API Key:", "Verify API Key"
         )
+        (
+            self.lineEdit_lookup_concurrency,
+            self.label_lookup_concurrency_verified_icon,
+            self.btn_lookup_concurrency_verify,
+            self.hlayout_lookup_concurrency,
+        ) = self.create_input_fields(
+            "lookup_concurrency", "Lookup Concurrency:", "Save Lookup Concurrency"
+        )
+        (
+            self.lineEdit_offline_dictionary_path,
+            self.label_offline_dictionary_path_verified_icon,
+            self.btn_offline_dictionary_path_verify,
+            self.hlayout_offline_dictionary_path,
+        ) = self.create_input_fields(
+            "offline_dictionary_path", "Offline Dictionary:", "Verify Index"
+        )
+        (
+            self.lineEdit_http_pool_size,
+            self.label_http_pool_size_verified_icon,
+            self.btn_http_pool_size_verify,
+            self.hlayout_http_pool_size,
+        ) = self.create_input_fields(
+            "http_pool_size", "Connections per Host:", "Save Connections"
+        )
+        (
+            self.lineEdit_http_timeout,
+            self.label_http_timeout_verified_icon,
+            self.btn_http_timeout_verify,
+            self.hlayout_http_timeout,
+        ) = self.create_input_fields(
+            "http_timeout", "Request Timeout (s):", "Save Timeout"
+        )
+        (
+            self.comboBox_auto_advance_define,
+            self.label_auto_advance_define_verified_icon,
+            self.btn_auto_advance_define_verify,
+            self.hlayout_auto_advance_define,
+        ) = self.create_input_fields(
+            "auto_advance_define",
+            "Auto Audio Defined:",
+            "Save Auto Audio",
+            lineEdit=False,
+            comboBox=["True", "False"],
+        )
+        (
+            self.comboBox_auto_advance_audio,
+            self.label_auto_advance_audio_verified_icon,
+            self.btn_auto_advance_audio_verify,
+            self.hlayout_auto_advance_audio,
+        ) = self.create_input_fields(
+            "auto_advance_audio",
+            "Auto Sync Audio:",
+            "Save Auto Sync",
+            lineEdit=False,
+            comboBox=["True", "False"],
+        )
+        (
+            self.lineEdit_pipeline_queue_size,
+            self.label_pipeline_queue_size_verified_icon,
+            self.btn_pipeline_queue_size_verify,
+            self.hlayout_pipeline_queue_size,
+        ) = self.create_input_fields(
+            "pipeline_queue_size", "Stage Queue Size:", "Save Queue Size"
+        )
         (
             self.textEdit_google_api_key,
             self.label_google_api_key_verified_icon,
@@ -4,6 +4,7 @@ from PySide6.QtCore import QThread, Signal
 
 from base import QWidgetBase
 from core import AppleNoteImport, AudioThread, RemoveDuplicateAudio
+from core.backends import OfflineIndex
 from models import AppSettingsModel, LogSettingsModel, Status, WordModel
 from services.network import NetworkWorker
 from services.settings import AppSettings, SecureCredentials
@@ -68,6 +69,29 @@ class VerifySettings(QWidgetBase):
         elif key == "auto_save_on_close":
             text = self.view.get_combo_box_text("auto_save_on_close")
             self.update_ui_verified("auto_save_on_close", text, "bool")
+        elif key == "lookup_concurrency":
+            text = self.view.get_line_edit_text("lookup_concurrency")
+            self.update_ui_verified("lookup_concurrency", text, "int")
+        elif key == "audio_concurrency":
+            text = self.view.get_line_edit_text("audio_concurrency")
+            self.update_ui_verified("audio_concurrency", text, "int")
+        elif key == "anki_export_batch_size":
+            text = self.view.get_line_edit_text("anki_export_batch_size")
+            self.update_ui_verified("anki_export_batch_size", text, "int")
+        elif key == "offline_dictionary_path":
+            self._verify_offline_dictionary_path()
+        elif key == "http_pool_size":
+            text = self.view.get_line_edit_text("http_pool_size")
+            self.update_ui_verified("http_pool_size", text, "int")
+        elif key == "http_timeout":
+            text = self.view.get_line_edit_text("http_timeout")
+            self.update_ui_verified("http_timeout", text, "int")
+        elif key in ["auto_advance_define", "auto_advance_audio"]:
+            text = self.view.get_combo_box_text(key)
+            self.update_ui_verified(key, text, "bool")
+        elif key == "pipeline_queue_size":
+            text = self.view.get_line_edit_text("pipeline_queue_size")
+            self.update_ui_verified("pipeline_queue_size", text, "int")
 
     def update_ui_verified(self, key, value, type="str"):
         self.settings_model.change_setting(key, value, True, type)
@@ -155,8 +179,11 @@ class VerifySettings(QWidgetBase):
             [WordModel("", "", "test", "", "", "", "", "")],
             folder_path="./",
             credential_string=self.view.get_text_edit_text("google_api_key"),
+            use_cache=False,
+            use_journal=False,
         )
 
+        self.audio_thread.send_logs.connect(self.send_logs)
         self.audio_thread.audio_word.connect(self.google_api_key_response)
         self.audio_thread.error_word.connect(self.google_api_key_response)
         self.audio_thread.finished.connect(self.audio_thread.deleteLater)
@@ -167,7 +194,6 @@ class VerifySettings(QWidgetBase):
 
     def _verify_merriam_webster_api_key(self):
         key = self.view.get_line_edit_text("merriam_webster_api_key")
-        print(key, "key")
         self.run_network_check(
             "merriam_webster_api_key",
             f"https://www.dictionaryapi.com/api/v3/references/collegiate/json/voluminous?key={key}",
@@ -175,6 +201,17 @@ class VerifySettings(QWidgetBase):
             self.merriam_webster_response,
         )
 
+    def _verify_offline_dictionary_path(self):
+        path = self.view.get_line_edit_text("offline_dictionary_path")
+        try:
+            index = OfflineIndex(path)
+            self.logging(f"Offline dictionary index has {index.count} words")
+            index.close()
+            self.update_ui_verified("offline_dictionary_path", path)
+        except (OSError, ValueError) as e:
+            self.logging(f"Offline dictionary index is not valid: {e}", "WARN")
+            self.verify_response_update_ui.emit("offline_dictionary_path", False)
+
     def _verify_path_keys(self, key, folder):
 
         isExist = os.path.exists(folder)
@@ -1,15 +1,10 @@
-from PySide6.QtCore import Qt, QThread, Signal, Slot
-from PySide6.QtWidgets import (
-    QHBoxLayout,
-    QListWidget,
-    QListWidgetItem,
-    QPushButton,
-    QVBoxLayout,
-)
+from PySide6.QtCore import QThread, Signal, Slot
+from PySide6.QtWidgets import QHBoxLayout, QPushButton, QVBoxLayout
 
 from base import QWidgetBase
-from core import AnkiExportThread, RemoveDuplicateAudio
-from models import Status, WordModel, WordsModel
+from components.lists import WordListView
+from core import AnkiExportThread, PipelineOrchestrator, RemoveDuplicateAudio
+from models import Status, WordListModel, WordModel, WordsModel
 
 
 class SyncPage(QWidgetBase):
@@ -30,11 +25,24 @@ class SyncPage(QWidgetBase):
         self.anki_model_name = None
         self.anki_deck_name_verified = False
         self.anki_model_name_verified = False
+        self.anki_export_batch_size = 50
+
+        self.wordsModel = WordsModel()
+        self.pipeline = PipelineOrchestrator()
+        self.queue_model = WordListModel(self.wordsModel.to_be_synced_words)
+        self.errored_model = WordListModel(
+            self.wordsModel.anki_duplicate_words + self.wordsModel.anki_error_words,
+            display=lambda word: (
+                f"{word.word}"
+                f"{' - Duplicate' if word.status == Status.SKIPPED_ANKI_DUP else ''}"
+            ),
+        )
+        self.synced_model = WordListModel(self.wordsModel.synced_words)
 
         # List Widget
         define_queue_qv = QVBoxLayout()
         word_set_layout.addLayout(define_queue_qv)
-        self.list_widget = QListWidget()
+        self.list_widget = WordListView(self.queue_model)
         queue_buttons_layout = QHBoxLayout()
         define_queue_qv.addWidget(self.list_widget)
         define_queue_qv.addLayout(queue_buttons_layout)
@@ -51,7 +59,7 @@ class SyncPage(QWidgetBase):
         self.bottom_list_widgets.addLayout(self.definded_box)
 
         # SKIPPED BOX
-        self.errored_list_widget = QListWidget()
+        self.errored_list_widget = WordListView(self.errored_model)
         self.skipped_box.addWidget(self.errored_list_widget)
         self.remove_duplicates_btn = QPushButton("Remove Duplicates")
         self.move_word_to_queue_btn = QPushButton("Try Sync Again")
@@ -62,7 +70,7 @@ class SyncPage(QWidgetBase):
         self.skipped_box.addLayout(self.h_skipped_layout)
 
         # DEFINED BOX
-        self.defined_list_widget = QListWidget()
+        self.defined_list_widget = WordListView(self.synced_model)
         self.definded_box.addWidget(self.defined_list_widget)
         self.h_defined_layout = QHBoxLayout()
 
@@ -70,10 +78,12 @@ class SyncPage(QWidgetBase):
 
         word_set_layout.addLayout(self.bottom_list_widgets)
 
-        self.wordsModel = WordsModel()
         # SLOTS / SIGNALS
         self.start_sync_btn.clicked.connect(self.start_sync_words)
         self.wordsModel.word_added_to_be_sync.connect(self.add_word)
+        self.wordsModel.word_added_anki_dup.connect(
+            lambda word: self.receive_error_word(word, True)
+        )
         self.remove_duplicates_btn.clicked.connect(self.remove_duplicates)
         self.move_word_to_queue_btn.clicked.connect(self.move_word_to_queue)
         self.save_words_to_model.connect(self.wordsModel.save_words)
@@ -81,23 +91,10 @@ class SyncPage(QWidgetBase):
         self.change_status.connect(self.wordsModel.update_status)
         self.delete_words.connect(self.wordsModel.delete_words)
 
-        for word in self.wordsModel.to_be_synced_words:
-            self.add_word(word)
-
-        for word in self.wordsModel.synced_words:
-            self.receive_synced_word(word)
-
-        for word in self.wordsModel.anki_duplicate_words:
-            self.receive_error_word(word, True)
-
-        for word in self.wordsModel.anki_error_words:
-            self.receive_error_word(word, False)
-
     def remove_duplicates(self):
         guids = []
         paths = []
         for word in self.wordsModel.skipped_sync_duplicates:
-            print(word.word)
             guids.append(word.guid)
             paths.append(word.audio_path)
 
@@ -117,10 +114,7 @@ class SyncPage(QWidgetBase):
     def on_file_removal_completed(self, guids):
 
         self.delete_words.emit(guids)
-        for index in reversed(range(self.errored_list_widget.count())):
-            item = self.errored_list_widget.item(index)
-            if item and item.data(Qt.UserRole) in guids:
-                self.errored_list_widget.takeItem(self.errored_list_widget.row(item))
+        self.errored_model.remove_words(guids)
         self.remove_duplicates_btn.setDisabled(False)
 
     def move_word_to_queue(self):
@@ -129,22 +123,10 @@ class SyncPage(QWidgetBase):
             self.change_status.emit(word.guid, Status.TO_BE_SYNCED)
 
     def remove_from_error_list(self):
-        item = self.errored_list_widget.currentItem()
-        if item:
-            guid = item.data(Qt.UserRole)
-            word = [
-                word for word in self.wordsModel.skipped_sync_error if word.guid == guid
-            ]
-            if word:
-                change_word = word[0]
-
-                for index in reversed(range(self.errored_list_widget.count())):
-                    item = self.errored_list_widget.item(index)
-                    if item and item.data(Qt.UserRole) == change_word.guid:
-                        self.errored_list_widget.takeItem(
-                            self.errored_list_widget.row(item)
-                        )
-                return change_word
+        change_word = self.wordsModel.get_word(self.errored_list_widget.current_guid())
+        if change_word and change_word.status == Status.SKIPPED_ANKI_ERROR:
+            self.errored_model.remove_word(change_word.guid)
+            return change_word
         return False
 
     @Slot(WordModel)
@@ -161,10 +143,7 @@ class SyncPage(QWidgetBase):
             None: This function does not return a value.
 
         """
-        print("received to be sync ********", word)
-        list_item = QListWidgetItem(word.word)
-        list_item.setData(Qt.UserRole, word.guid)
-        self.list_widget.addItem(list_item)
+        self.queue_model.add_word(word)
 
         if self.anki_thread and self.anki_thread.isRunning():
             self.add_word_to_sync_queue.emit(word)
@@ -212,13 +191,13 @@ class SyncPage(QWidgetBase):
             )
             return
         else:
-            print("hereeee")
-            print(self.wordsModel.to_be_synced_words)
             self.start_sync_btn.setDisabled(True)
             self.anki_thread = AnkiExportThread(
                 self.wordsModel.to_be_synced_words,
                 self.anki_deck_name,
                 self.anki_model_name,
+                self.anki_export_batch_size,
+                in_flight=self.wordsModel.take_in_flight("sync"),
             )
             self.anki_thread.error_word.connect(
                 lambda word: self.receive_error_word(word, False)
@@ -229,9 +208,11 @@ class SyncPage(QWidgetBase):
             self.anki_thread.finished.connect(self.on_anki_thread_completed)
             self.anki_thread.synced_word.connect(self.receive_synced_word)
             self.add_word_to_sync_queue.connect(self.anki_thread.add_word_to_list)
+            self.pipeline.stage_started("sync", self.anki_thread)
             self.anki_thread.start()
 
     def on_anki_thread_completed(self):
+        self.pipeline.stage_finished("sync")
         self.save_words_to_model.emit()
         self.reset_thread_reference()
         self.start_sync_btn.setDisabled(False)
@@ -244,39 +225,27 @@ class SyncPage(QWidgetBase):
             self.anki_thread = None
 
     def receive_synced_word(self, word):
-        list_item = QListWidgetItem(word.word)
-        list_item.setData(Qt.UserRole, word.guid)
-        self.defined_list_widget.addItem(list_item)
+        self.synced_model.add_word(word)
         self.update_word_model.emit(word.guid, word)
         self.change_status.emit(word.guid, Status.ANKI_SYNCED)
-        for index in reversed(range(self.list_widget.count())):
-            item = self.list_widget.item(index)
-            if item and item.data(Qt.UserRole) == word.guid:
-                self.list_widget.takeItem(self.list_widget.row(item))
+        self.queue_model.remove_word(word.guid)
 
     def receive_error_word(self, word, dup):
-        list_item = QListWidgetItem(f"{word.word}{' - Duplicate' if dup else ''}")
-        list_item.setData(Qt.UserRole, word.guid)
-        self.errored_list_widget.addItem(list_item)
-
-        for index in reversed(range(self.list_widget.count())):
-            item = self.list_widget.item(index)
-            if item and item.data(Qt.UserRole) == word.guid:
-                self.list_widget.takeItem(self.list_widget.row(item))
+        self.update_word_model.emit(word.guid, word)
+        self.errored_model.add_word(word)
+        self.queue_model.remove_word(word.guid)
 
-    @Slot(str, str)
+    @Slot(str, bool, str, bool, int)
     def receive_settings_update(
-        self, words_deck, words_deck_verified, model_name, model_name_verified
+        self,
+        words_deck,
+        words_deck_verified,
+        model_name,
+        model_name_verified,
+        export_batch_size,
     ):
-        print(
-            "sync page",
-            words_deck,
-            words_deck_verified,
-            model_name,
-            model_name_verified,
-        )
-
         self.anki_deck_name = words_deck
         self.anki_model_name = model_name
         self.anki_deck_name_verified = words_deck_verified
         self.anki_model_name_verified = model_name_verified
+        self.anki_export_batch_size = max(1, export_batch_size)